@@ -0,0 +1,127 @@
+"""Benchmarks the cost of importing the ISO currency database, comparing
+the current, table-driven ``finnr.iso`` module ("after") against the
+legacy format of one ``Currency(...)`` constructor call per currency
+("before"). The legacy module is re-rendered from the current data, so
+that both contain exactly the same currencies.
+
+Each measurement runs in a fresh interpreter (after a warmup run, so
+that the ``.pyc`` is already cached), and includes both the import and
+the construction of the ``mint`` currency set.
+
+Run with ``uv run python benchmarks_py/iso_import.py``.
+"""
+from __future__ import annotations
+
+import marshal
+import operator
+import statistics
+import subprocess
+import sys
+import tempfile
+from datetime import date
+from pathlib import Path
+
+import finnr.iso
+from finnr._types import Singleton
+
+RUNS = 25
+LEGACY_MODULE_NAME = '_finnr_iso_legacy'
+TIMER_SNIPPET = '''
+import sys
+import time
+sys.path.insert(0, {path!r})
+import finnr.currency
+start = time.perf_counter()
+import {module_name}
+{module_name}.mint
+print(time.perf_counter() - start)
+'''
+
+
+def main() -> None:
+    current_source = Path(finnr.iso.__file__).read_text(encoding='utf-8')
+    legacy_source = render_legacy_module()
+
+    with tempfile.TemporaryDirectory() as tempdir:
+        Path(tempdir, f'{LEGACY_MODULE_NAME}.py').write_text(
+            legacy_source, encoding='utf-8')
+
+        before = time_import(tempdir, LEGACY_MODULE_NAME)
+        after = time_import(tempdir, 'finnr.iso')
+
+    rows = [
+        ('source lines',
+            legacy_source.count('\n'), current_source.count('\n')),
+        ('bytecode (bytes)',
+            bytecode_size(legacy_source), bytecode_size(current_source)),
+        ('import + mint (ms)',
+            round(before * 1000, 3), round(after * 1000, 3)),]
+    print(f'{"":<24}{"before":>12}{"after":>12}')
+    for label, before_value, after_value in rows:
+        print(f'{label:<24}{before_value:>12}{after_value:>12}')
+
+
+def time_import(path: str, module_name: str) -> float:
+    """Returns the median time, in seconds, to import the module and
+    access its mint, each in a fresh interpreter.
+    """
+    snippet = TIMER_SNIPPET.format(path=path, module_name=module_name)
+    # The first run is just to make sure the pyc gets written.
+    timings = [
+        float(subprocess.check_output(  # noqa: S603
+            [sys.executable, '-c', snippet], text=True))
+        for _ in range(RUNS + 1)]
+    return statistics.median(timings[1:])
+
+
+def bytecode_size(source: str) -> int:
+    """Returns the size of the marshalled code object (ie, roughly the
+    size of the .pyc) for the passed source.
+    """
+    return len(marshal.dumps(compile(source, '<benchmark>', 'exec')))
+
+
+def render_legacy_module() -> str:
+    """Renders the ISO database in its legacy format, with one
+    ``Currency(...)`` call per currency, constructed at import time.
+    """
+    lines = [
+        'from datetime import date',
+        '',
+        'from finnr._types import Singleton',
+        'from finnr.currency import Currency',
+        'from finnr.currency import CurrencySet',
+        '',
+        'mint = CurrencySet({']
+    for currency in sorted(
+        finnr.iso.mint, key=operator.attrgetter('code_alpha3')
+    ):
+        entities = ', '.join(
+            repr(entity) for entity in sorted(currency.entities))
+        lines.extend((
+            '    Currency(',
+            f'        code_alpha3={currency.code_alpha3!r},',
+            f'        code_num={currency.code_num!r},',
+            '        minor_unit_denominator='
+            + f'{_render_value(currency.minor_unit_denominator)},',
+            f'        entities=frozenset({{{entities}}}),',
+            f'        name={_render_value(currency.name)},',
+            '        approx_active_from='
+            + f'{_render_value(currency.approx_active_from)},',
+            '        approx_active_until='
+            + f'{_render_value(currency.approx_active_until)},),'))
+    lines.append('})')
+    return '\n'.join(lines) + '\n'
+
+
+def _render_value(value: object) -> str:
+    if value is Singleton.UNKNOWN:
+        return 'Singleton.UNKNOWN'
+    elif isinstance(value, date):
+        return f'date({value.year}, {value.month}, {value.day})'
+    else:
+        return repr(value)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,172 @@
+"""Benchmarks minting amounts with ``quantize_to_minor=True`` for
+currencies whose minor unit isn't a power of ten (for example, MGA and
+MRU), comparing finnr's precomputed rounders against the previous
+implementation, which rebuilt the rounding on every call.
+
+Before timing anything, this checks that both implementations give
+bit-identical results -- including the exponent and the sign of zero --
+for every rounding mode, so this doubles as an equivalence test.
+
+Run with ``uv run python benchmarks_py/minor_rounding.py``.
+"""
+from __future__ import annotations
+
+import random
+import time
+from collections.abc import Callable
+from decimal import ROUND_05UP
+from decimal import ROUND_CEILING
+from decimal import ROUND_DOWN
+from decimal import ROUND_FLOOR
+from decimal import ROUND_HALF_DOWN
+from decimal import ROUND_HALF_EVEN
+from decimal import ROUND_HALF_UP
+from decimal import ROUND_UP
+from decimal import Decimal
+from decimal import localcontext
+from typing import cast
+
+import finnr.iso
+from finnr.currency import Currency
+from finnr.money import Money
+
+ROUNDINGS = (
+    ROUND_05UP, ROUND_CEILING, ROUND_DOWN, ROUND_FLOOR, ROUND_HALF_DOWN,
+    ROUND_HALF_EVEN, ROUND_HALF_UP, ROUND_UP)
+CODES = ('MGA', 'MRU')
+AMOUNT_COUNT = 100_000
+REPEATS = 5
+
+
+def main() -> None:
+    rng = random.Random(42)  # noqa: S311
+    amounts = [_random_amount(rng) for _ in range(AMOUNT_COUNT)]
+    edge_cases = [
+        Decimal(value) for value in (
+            '0', '-0', '0.00', '-0.00', '0.1', '-0.1', '0.3', '-0.3',
+            '0.25', '-0.25', '0.0001', '-0.0001', '1E+3', '-1E+3',
+            '123456789.123456789', '-123456789.123456789')]
+
+    for code in CODES:
+        currency = cast(Currency, finnr.iso.mint.get(code))
+        for rounding in ROUNDINGS:
+            _check_equivalence(currency, rounding, edge_cases + amounts)
+    print('Results are bit-identical for all rounding modes.')
+
+    print(f'{"":<24}{"reference":>12}{"finnr":>12}{"speedup":>10}')
+    for code in CODES:
+        _report_currency(cast(Currency, finnr.iso.mint.get(code)), amounts)
+
+
+def _report_currency(currency: Currency, amounts: list[Decimal]) -> None:
+    _report(
+        f'{currency.code_alpha3} mint',
+        lambda: [
+            _reference_mint(currency, amount, ROUND_HALF_UP)
+            for amount in amounts],
+        lambda: [
+            currency.mint(
+                amount, quantize_to_minor=True, rounding=ROUND_HALF_UP)
+            for amount in amounts])
+    _report(
+        f'{currency.code_alpha3} mint_many',
+        lambda: [
+            _reference_mint(currency, amount, ROUND_HALF_UP)
+            for amount in amounts],
+        lambda: currency.mint_many(
+            amounts, quantize_to_minor=True, rounding=ROUND_HALF_UP))
+
+
+def _random_amount(rng: random.Random) -> Decimal:
+    """Generates the kind of amounts we see in practice: mostly small,
+    with a handful of decimal places, some of them negative.
+    """
+    places = rng.choice((0, 1, 1, 2, 2, 3, 4))
+    coefficient = rng.randrange(-5_000_000, 20_000_000)
+    return Decimal(coefficient).scaleb(-places)
+
+
+def _reference_round(
+        currency: Currency,
+        dec_amount: Decimal,
+        rounding: str
+        ) -> Decimal:
+    """This is the previous implementation of rounding to a non-decimal
+    minor unit (verbatim, apart from the variable lookups), which the
+    current one must match exactly.
+    """
+    minor_denom = cast(int, currency.minor_unit_denominator)
+    minor_quantizor = cast(Decimal, currency._metadata.minor_quantizor)
+    dec_amount = dec_amount.quantize(minor_quantizor, rounding=rounding)
+    shifted_amount = dec_amount * minor_denom
+    with localcontext() as ctx:
+        ctx.rounding = rounding
+        # Note that the zero here is necessary to keep it a decimal,
+        # otherwise we'll end up with an int
+        rounded_shifted_amount = round(shifted_amount, 0)
+
+    return rounded_shifted_amount / minor_denom
+
+
+def _reference_mint(
+        currency: Currency,
+        dec_amount: Decimal,
+        rounding: str
+        ) -> Money:
+    return Money(
+        amount=_reference_round(currency, dec_amount, rounding),
+        currency=currency)
+
+
+def _check_equivalence(
+        currency: Currency,
+        rounding: str,
+        amounts: list[Decimal]
+        ) -> None:
+    expected = [
+        _reference_round(currency, amount, rounding).as_tuple()
+        for amount in amounts]
+    actual_one = [
+        currency.mint(
+            amount, quantize_to_minor=True, rounding=rounding
+        ).amount.as_tuple()
+        for amount in amounts]
+    actual_many = [
+        money.amount.as_tuple()
+        for money in currency.mint_many(
+            amounts, quantize_to_minor=True, rounding=rounding)]
+
+    for amount, reference, one, many in zip(
+        amounts, expected, actual_one, actual_many, strict=True
+    ):
+        if not reference == one == many:
+            raise RuntimeError(
+                'Rounding mismatch!',
+                currency.code_alpha3, rounding, amount, reference, one, many)
+
+
+def _report(
+        label: str,
+        reference: Callable[[], object],
+        candidate: Callable[[], object]
+        ) -> None:
+    reference_time = _best_time(reference)
+    candidate_time = _best_time(candidate)
+    print(
+        f'{label:<24}{reference_time * 1e3:>10.1f}ms'
+        + f'{candidate_time * 1e3:>10.1f}ms'
+        + f'{reference_time / candidate_time:>10.2f}')
+
+
+def _best_time(func: Callable[[], object]) -> float:
+    best = float('inf')
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+"""Benchmarks how a pricing-style workload scales across threads within
+a single process. On a free-threaded build of Python (eg ``3.13t`` or
+``3.14t``), throughput should scale with the number of threads; on a
+normal build, the GIL keeps it roughly flat.
+
+Every thread shares the same ``FrozenMoney`` prices and the same
+(lazily-loaded) ISO currency database, and each thread's results are
+checked against a single-threaded reference run, so this doubles as a
+smoke test for races in finnr's shared state.
+
+Run with ``uv run python benchmarks_py/thread_scaling.py``.
+"""
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from decimal import ROUND_HALF_EVEN
+from decimal import Decimal
+
+import finnr.iso
+from finnr.money import FrozenMoney
+
+ITERATIONS_PER_THREAD = 20_000
+CODES = ('EUR', 'USD', 'JPY', 'BHD', 'MGA', 'CHF')
+
+
+def main() -> None:
+    # Note that we're deliberately not touching finnr.iso.mint before the
+    # threads start, so that the lazy loading is part of what's contended.
+    thread_counts = sorted({1, 2, 4, 8, os.cpu_count() or 1})
+    barrier_start = threading.Barrier(max(thread_counts))
+    with ThreadPoolExecutor(max(thread_counts)) as executor:
+        mints = list(executor.map(
+            lambda _: _wait_then_get_mint(barrier_start),
+            range(max(thread_counts))))
+    if any(mint is not mints[0] for mint in mints):
+        raise RuntimeError('Concurrent lazy loading created multiple mints!')
+
+    prices = [
+        finnr.iso.mint('19.99', code).freeze()
+        for code in CODES]
+    reference = price_book(prices, ITERATIONS_PER_THREAD)
+
+    gil_enabled = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print(f'Python {sys.version.split()[0]}, GIL enabled: {gil_enabled}')
+    print(f'{"threads":>8}{"ops/s":>14}{"speedup":>10}')
+    baseline = None
+    for thread_count in thread_counts:
+        with ThreadPoolExecutor(thread_count) as executor:
+            start = time.perf_counter()
+            results = list(executor.map(
+                lambda _: price_book(prices, ITERATIONS_PER_THREAD),
+                range(thread_count)))
+            elapsed = time.perf_counter() - start
+
+        if any(result != reference for result in results):
+            raise RuntimeError('Threaded results differ from reference!')
+
+        ops_per_second = thread_count * ITERATIONS_PER_THREAD / elapsed
+        if baseline is None:
+            baseline = ops_per_second
+        print(
+            f'{thread_count:>8}{ops_per_second:>14,.0f}'
+            + f'{ops_per_second / baseline:>10.2f}')
+
+
+def price_book(
+        prices: list[FrozenMoney],
+        iterations: int
+        ) -> list[FrozenMoney]:
+    """A small pricing workload: applies a running discount and tax to
+    the shared prices, minting and rounding along the way.
+    """
+    mint = finnr.iso.mint
+    discount = Decimal('0.97')
+    tax = Decimal('1.19')
+    totals = [price * 0 for price in prices]
+    for iteration in range(iterations):
+        index = iteration % len(prices)
+        price = prices[index]
+        taxed = (price * discount) * tax
+        rounded = mint(
+            taxed.amount,
+            price.currency.code_alpha3,
+            quantize_to_minor=True,
+            rounding=ROUND_HALF_EVEN)
+        totals[index] += rounded.freeze()
+
+    return totals
+
+
+def _wait_then_get_mint(barrier: threading.Barrier):
+    barrier.wait()
+    return finnr.iso.mint
+
+
+if __name__ == '__main__':
+    main()
@@ -112,6 +112,11 @@ def codegen_moneymath_module():  # noqa: PLR0912
                 context_kwarg=context_kwarg,
                 context_passthrough=context_passthrough,
                 linebreaker=linebreaker,
+                # The scalar branch is nested one level deeper, within the
+                # try/except that converts TypeErrors into ScalarRequired.
+                scalar_linebreaker=_LineBreaker(
+                    do_linebreak=method_info.requires_long_signature,
+                    indent_level=5),
                 actiontype_start=actiontype_start,
                 actiontype_end=actiontype_end,
                 return1=return1,
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import typing
-from textwrap import wrap
 from typing import Literal
 
 from templatey import Slot
@@ -28,10 +27,13 @@ class IsoCurrenciesModuleTemplate:
 
 @template(trusted_unicon, 'single_currency.templatey.py')
 class CurrencyTemplate:
+    """Renders a single row of the ISO module's currency table. See the
+    ISO module template for a description of the encoding.
+    """
     code_alpha3: Var[str]
     code_num: Var[int]
-    minor_unit_denominator: Var[int | str]
-    entities_wrapped: Var[str]
+    minor_unit_denominator: Var[str]
+    entities: Var[str]
     name: Var[str]
     approx_active_from: Var[str]
     approx_active_until: Var[str]
@@ -40,45 +42,36 @@ class CurrencyTemplate:
     def from_currency(cls, currency: Currency) -> CurrencyTemplate:
         """Converts a currency object into a currency template.
         """
-        entities_wrapped = '\n'.join(wrap(
-            ', '.join(f"'{entity}'" for entity in sorted(currency.entities)),
-            initial_indent='\n            ',
-            subsequent_indent='            '))
-
-        approx_active_from = _coerce_datelike_to_str(
-            _coerce_singletons_to_str(
-                currency.approx_active_from))
-        approx_active_until = _coerce_datelike_to_str(
-            _coerce_singletons_to_str(
-                currency.approx_active_until))
+        if currency.minor_unit_denominator is Singleton.UNKNOWN:
+            minor_unit_denominator = '0'
+        else:
+            minor_unit_denominator = repr(currency.minor_unit_denominator)
+
+        if currency.name is Singleton.UNKNOWN:
+            name = 'None'
+        else:
+            name = repr(currency.name)
 
         return cls(
             code_alpha3=currency.code_alpha3,
             code_num=currency.code_num,
-            minor_unit_denominator=_coerce_singletons_to_str(
-                currency.minor_unit_denominator),
-            entities_wrapped=entities_wrapped,
-            name=_coerce_singletons_to_str(currency.name),
-            approx_active_from=approx_active_from,
-            approx_active_until=approx_active_until)
+            minor_unit_denominator=minor_unit_denominator,
+            entities=' '.join(sorted(currency.entities)),
+            name=name,
+            approx_active_from=_encode_datelike(currency.approx_active_from),
+            approx_active_until=_encode_datelike(
+                currency.approx_active_until))
 
 
-def _coerce_singletons_to_str[T](
-        value: T | Literal[Singleton.UNKNOWN] | None
-        ) -> T | str:
+def _encode_datelike(
+        value: DateLike | Literal[Singleton.UNKNOWN] | None
+        ) -> str:
     if value is Singleton.UNKNOWN:
-        return 'Singleton.UNKNOWN'
+        return '0'
     elif value is None:
         return 'None'
     else:
-        return value
-
-
-def _coerce_datelike_to_str(value: DateLike | str) -> str:
-    if isinstance(value, str):
-        return value
-    else:
-        return f'date({value.year}, {value.month}, {value.day})'
+        return f'{value.year:04d}{value.month:02d}{value.day:02d}'
 
 
 @template(trusted_unicon, 'moneymath_module.templatey.py')
@@ -101,6 +94,7 @@ class OverloadedMethodTemplate:
     # This is really just a bunch of garbage hacks at this point. Templatey is,
     # it turns out, not yet well-suited for codegen. The more you know!
     linebreaker: Var[_LineBreaker]
+    scalar_linebreaker: Var[_LineBreaker]
     return1: Var[str]
     return3: Var[str]
     actiontype_start: Var[str]
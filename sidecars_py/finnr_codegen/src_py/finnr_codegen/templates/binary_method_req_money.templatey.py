@@ -1,7 +1,7 @@
     def ␎var.name␏(␎
             var.bookend_arg_separator
             ␏self,␎
-            var.normal_arg_separator␏other: Money␎var.context_kwarg␏␎
+            var.normal_arg_separator␏other: _AnyMoney␎var.context_kwarg␏␎
             var.bookend_arg_separator
             ␏) -> ␎var.return_type␏:
         try:
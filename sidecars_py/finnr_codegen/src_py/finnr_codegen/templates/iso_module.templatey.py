@@ -6,9 +6,24 @@ __style_modifiers__: 'ccw/nodisplay'
     (See sidecars_py).
 
     Do not modify it directly.
+
+    The currency data is stored as a single table of literals, which the
+    compiler folds into one constant. That keeps both the bytecode and the
+    ``.pyc`` small, and means that loading the module is little more than
+    unmarshalling that constant. It is then decoded into ``Currency``
+    objects in a single tight loop. The row encoding is:
+    ++  ``minor_unit_denominator``: an int, ``None`` for continuous
+        currencies, or ``0`` if unknown
+    ++  ``entities``: a single space-separated string
+    ++  ``name``: a string, or ``None`` if unknown
+    ++  ``approx_active_from`` and ``approx_active_until``: an int of the
+        form ``YYYYMMDD``, or ``0`` if unknown. ``approx_active_until`` is
+        ``None`` if the currency is still active.
 """
+import threading
 from datetime import date
 from typing import Annotated
+from typing import Literal
 
 from docnote import Note
 
@@ -16,11 +31,74 @@ from finnr._types import Singleton
 from finnr.currency import Currency
 from finnr.currency import CurrencySet
 
+# Note that this is deliberately only annotated, and not assigned. The actual
+# currency set is only constructed upon first access, via the module
+# ``__getattr__``, which keeps ``import finnr.iso`` cheap.
 mint: Annotated[
     CurrencySet,
-    Note('The ISO-4217 currency database.')
-] = CurrencySet({
+    Note('''The ISO-4217 currency database. This is constructed lazily,
+        the first time it is accessed.''')]
+
+# This makes sure that concurrent first accesses (for example, from multiple
+# threads on a free-threaded build) all get the same currency set.
+_mint_lock = threading.Lock()
+
+
+def __getattr__(name: str) -> CurrencySet:
+    if name == 'mint':
+        global mint  # noqa: PLW0603
+        with _mint_lock:
+            built_mint = globals().get('mint')
+            if built_mint is None:
+                built_mint = _build_mint()
+                built_mint.register(f'{__name__}:mint')
+                mint = built_mint
+
+        return built_mint
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+def _build_mint() -> CurrencySet:
+    unknown = Singleton.UNKNOWN
+    decode_date = _decode_date
+    return CurrencySet([
+        Currency(
+            code_alpha3=code_alpha3,
+            code_num=code_num,
+            minor_unit_denominator=(
+                unknown if minor_unit_denominator == 0
+                else minor_unit_denominator),
+            entities=frozenset(entities.split()),
+            name=unknown if name is None else name,
+            approx_active_from=decode_date(approx_active_from),
+            approx_active_until=(
+                None if approx_active_until is None
+                else decode_date(approx_active_until)))
+        for (
+            code_alpha3,
+            code_num,
+            minor_unit_denominator,
+            entities,
+            name,
+            approx_active_from,
+            approx_active_until,
+        ) in _CURRENCY_TABLE])
+
+
+def _decode_date(encoded: int) -> date | Literal[Singleton.UNKNOWN]:
+    # Note that None (for approx_active_until) is handled inline by the
+    # caller, so that the active-from dates are never typed as optional.
+    if encoded == 0:
+        return Singleton.UNKNOWN
+    else:
+        return date(encoded // 10000, encoded // 100 % 100, encoded % 100)
+
+
+_CURRENCY_TABLE: tuple[
+    tuple[str, int, int | None, str, str | None, int, int | None], ...
+] = (
 ␎
 slot.currencies:
     __suffix__=',\n'
-␏})
+␏)
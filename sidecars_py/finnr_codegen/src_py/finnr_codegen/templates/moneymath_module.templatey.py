@@ -42,11 +42,13 @@ from finnr.exceptions import ScalarRequired
 if typing.TYPE_CHECKING:
     from finnr.currency import Currency
 
-    # Note: at runtime, this gets injected by the money module itself, so
-    # that the value is available at runtime
+    # Note: at runtime, these get injected by the money module itself, so
+    # that the values are available at runtime
+    from finnr.money import MinorUnitMoney
     from finnr.money import Money
 
 type _Scalar = Decimal | int
+type _AnyMoney = Money | MinorUnitMoney
 
 
 class MoneyMathImpl(Protocol):
@@ -66,14 +68,14 @@ class MoneyMathImpl(Protocol):
     ###########################################################
 
     @overload
-    def __divmod__(self, other: Money) -> tuple[Decimal, Money]: ...
+    def __divmod__(self, other: _AnyMoney) -> tuple[Decimal, Money]: ...
     @overload
     def __divmod__(self, other: Decimal | int) -> tuple[Money, Money]: ...
     def __divmod__(
             self,
-            other: Decimal | int | Money
+            other: Decimal | int | _AnyMoney
             ) -> tuple[Decimal | Money, Money]:
-        if isinstance(other, Money):
+        if isinstance(other, (Money, MinorUnitMoney)):
             if self.currency != other.currency:
                 raise MismatchedCurrency(self.currency, other.currency)
 
@@ -81,7 +83,11 @@ class MoneyMathImpl(Protocol):
             return quotient, Money(amount=remainder, currency=self.currency)
 
         else:
-            quotient, remainder = self.amount.__divmod__(other)
+            try:
+                quotient, remainder = self.amount.__divmod__(other)
+            except TypeError as exc:
+                raise ScalarRequired(other) from exc
+
             return (
                 Money(amount=quotient, currency=self.currency),
                 Money(amount=remainder, currency=self.currency))
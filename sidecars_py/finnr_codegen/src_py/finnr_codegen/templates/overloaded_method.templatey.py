@@ -2,7 +2,7 @@
     def ␎var.name␏(␎
             var.bookend_arg_separator
             ␏self,␎
-            var.normal_arg_separator␏other: Money␎
+            var.normal_arg_separator␏other: _AnyMoney␎
             var.context_kwarg␏␎
             var.bookend_arg_separator
             ␏) -> ␎var.return1␏: ...
@@ -17,15 +17,18 @@
     def ␎var.name␏(␎
             var.bookend_arg_separator
             ␏self,␎
-            var.normal_arg_separator␏other: Money | _Scalar␎
+            var.normal_arg_separator␏other: _AnyMoney | _Scalar␎
             var.context_kwarg␏␎
             var.bookend_arg_separator
             ␏) -> ␎var.return3␏:
-        if isinstance(other, Money):
+        if isinstance(other, (Money, MinorUnitMoney)):
             if self.currency != other.currency:
                 raise MismatchedCurrency(self.currency, other.currency)
 
             return ␎var.actiontype_start␏self.amount.␎var.passthrough_name␏(␎var.linebreaker␏other.amount␎var.context_passthrough␏)␎var.actiontype_end␏
 
         else:
-            return self.currency.mint(␎var.linebreaker␏self.amount.␎var.passthrough_name␏(other␎var.context_passthrough␏))
\ No newline at end of file
+            try:
+                return self.currency.mint(␎var.scalar_linebreaker␏self.amount.␎var.passthrough_name␏(other␎var.context_passthrough␏))
+            except TypeError as exc:
+                raise ScalarRequired(other) from exc
\ No newline at end of file
@@ -1,8 +1 @@
-    Currency(
-        code_alpha3='␎var.code_alpha3␏',
-        code_num=␎var.code_num␏,
-        minor_unit_denominator=␎var.minor_unit_denominator␏,
-        entities=frozenset({␎var.entities_wrapped␏}),
-        name='␎var.name␏',
-        approx_active_from=␎var.approx_active_from␏,
-        approx_active_until=␎var.approx_active_until␏,)
\ No newline at end of file
+    ('␎var.code_alpha3␏', ␎var.code_num␏, ␎var.minor_unit_denominator␏, '␎var.entities␏', ␎var.name␏, ␎var.approx_active_from␏, ␎var.approx_active_until␏)
\ No newline at end of file
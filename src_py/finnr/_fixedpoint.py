@@ -0,0 +1,117 @@
+"""This module contains private helpers for doing money math in the
+integer domain, ie, on scaled integer coefficients instead of on
+``Decimal`` objects. These are shared between the various columnar and
+fixed-point representations of money.
+
+> Implementation notes
+__style_modifiers__: 'ccw/nodisplay'
+    Everything here must produce the **same** results as the equivalent
+    ``Decimal`` operation; the only point is speed. In particular, the
+    rounding modes here must match the semantics of the ``decimal``
+    module rounding constants exactly, including for negative values.
+"""
+from __future__ import annotations
+
+from decimal import MAX_EMAX
+from decimal import MAX_PREC
+from decimal import MIN_EMIN
+from decimal import ROUND_05UP
+from decimal import ROUND_CEILING
+from decimal import ROUND_DOWN
+from decimal import ROUND_FLOOR
+from decimal import ROUND_HALF_DOWN
+from decimal import ROUND_HALF_EVEN
+from decimal import ROUND_HALF_UP
+from decimal import ROUND_UP
+from decimal import Context
+from decimal import Decimal
+
+# We use this for any conversions between scaled ints and decimals, so that
+# they are always exact, regardless of the precision of the ambient context.
+EXACT_CONTEXT = Context(prec=MAX_PREC, Emax=MAX_EMAX, Emin=MIN_EMIN)
+
+
+def div_round(numerator: int, denominator: int, rounding: str) -> int:
+    """Divides ``numerator`` by ``denominator``, rounding the quotient
+    to an integer using the passed ``decimal`` rounding mode. The
+    denominator must be positive.
+    """
+    if numerator < 0:
+        negative = True
+        quotient, remainder = divmod(-numerator, denominator)
+    else:
+        negative = False
+        quotient, remainder = divmod(numerator, denominator)
+
+    if remainder and _should_round_away(
+        quotient, remainder, denominator, negative, rounding
+    ):
+        quotient += 1
+
+    return -quotient if negative else quotient
+
+
+def _should_round_away(  # noqa: PLR0911
+        quotient: int,
+        remainder: int,
+        denominator: int,
+        negative: bool,
+        rounding: str
+        ) -> bool:
+    """Given a nonzero remainder of a division of magnitudes, returns
+    True if the (truncated) magnitude of the quotient needs to be
+    incremented to respect the rounding mode.
+    """
+    if rounding == ROUND_HALF_UP:
+        return remainder * 2 >= denominator
+    elif rounding == ROUND_HALF_EVEN:
+        doubled = remainder * 2
+        return doubled > denominator or (
+            doubled == denominator and bool(quotient % 2))
+    elif rounding == ROUND_HALF_DOWN:
+        return remainder * 2 > denominator
+    elif rounding == ROUND_DOWN:
+        return False
+    elif rounding == ROUND_UP:
+        return True
+    elif rounding == ROUND_CEILING:
+        return not negative
+    elif rounding == ROUND_FLOOR:
+        return negative
+    elif rounding == ROUND_05UP:
+        return quotient % 5 == 0
+    else:
+        raise ValueError('Unknown rounding mode!', rounding)
+
+
+def get_exponent(dec: Decimal) -> int:
+    """Returns the exponent of a finite decimal, raising ``ValueError``
+    for infinities and NaNs.
+    """
+    exponent = dec.as_tuple().exponent
+    if isinstance(exponent, int):
+        return exponent
+
+    raise ValueError('Amount must be finite!', dec)
+
+
+def decimal_to_scaled(dec: Decimal, exponent: int) -> int:
+    """Converts a decimal into an integer count of ``10 ** exponent``.
+    The caller is responsible for making sure that the conversion is
+    exact, ie, that the exponent of ``dec`` is at least ``exponent``.
+    """
+    return int(dec.scaleb(-exponent, context=EXACT_CONTEXT))
+
+
+def scaled_to_decimal(scaled: int, exponent: int) -> Decimal:
+    """The inverse of ``decimal_to_scaled``: converts an integer count
+    of ``10 ** exponent`` back into an (exact) decimal.
+    """
+    return Decimal(scaled).scaleb(exponent, context=EXACT_CONTEXT)
+
+
+def rescale(scaled: int, from_exponent: int, to_exponent: int) -> int:
+    """Exactly converts a scaled integer from one exponent to a smaller
+    (ie, more precise) one.
+    """
+    return scaled * 10 ** (from_exponent - to_exponent)
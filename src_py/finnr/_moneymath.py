@@ -42,11 +42,13 @@ from finnr.exceptions import ScalarRequired
 if typing.TYPE_CHECKING:
     from finnr.currency import Currency
 
-    # Note: at runtime, this gets injected by the money module itself, so
-    # that the value is available at runtime
+    # Note: at runtime, these get injected by the money module itself, so
+    # that the values are available at runtime
+    from finnr.money import MinorUnitMoney
     from finnr.money import Money
 
 type _Scalar = Decimal | int
+type _AnyMoney = Money | MinorUnitMoney
 
 
 class MoneyMathImpl(Protocol):
@@ -71,7 +73,7 @@ class MoneyMathImpl(Protocol):
         except TypeError as exc:
             raise ScalarRequired(other) from exc
 
-    def __add__(self, other: Money) -> Money:
+    def __add__(self, other: _AnyMoney) -> Money:
         try:
             if self.currency != other.currency:
                 raise MismatchedCurrency(self.currency, other.currency)
@@ -81,7 +83,7 @@ class MoneyMathImpl(Protocol):
         except AttributeError as exc:
             raise MoneyRequired(other) from exc
 
-    def __sub__(self, other: Money) -> Money:
+    def __sub__(self, other: _AnyMoney) -> Money:
         try:
             if self.currency != other.currency:
                 raise MismatchedCurrency(self.currency, other.currency)
@@ -98,7 +100,7 @@ class MoneyMathImpl(Protocol):
         except TypeError as exc:
             raise ScalarRequired(other) from exc
 
-    def __iadd__(self, other: Money) -> Self:
+    def __iadd__(self, other: _AnyMoney) -> Self:
         try:
             if self.currency != other.currency:
                 raise MismatchedCurrency(self.currency, other.currency)
@@ -109,7 +111,7 @@ class MoneyMathImpl(Protocol):
         except AttributeError as exc:
             raise MoneyRequired(other) from exc
 
-    def __isub__(self, other: Money) -> Self:
+    def __isub__(self, other: _AnyMoney) -> Self:
         try:
             if self.currency != other.currency:
                 raise MismatchedCurrency(self.currency, other.currency)
@@ -121,46 +123,55 @@ class MoneyMathImpl(Protocol):
             raise MoneyRequired(other) from exc
 
     @overload
-    def __truediv__(self, other: Money) -> Decimal: ...
+    def __truediv__(self, other: _AnyMoney) -> Decimal: ...
     @overload
     def __truediv__(self, other: _Scalar) -> Money: ...
-    def __truediv__(self, other: Money | _Scalar) -> Money | Decimal:
-        if isinstance(other, Money):
+    def __truediv__(self, other: _AnyMoney | _Scalar) -> Money | Decimal:
+        if isinstance(other, (Money, MinorUnitMoney)):
             if self.currency != other.currency:
                 raise MismatchedCurrency(self.currency, other.currency)
 
             return self.amount.__truediv__(other.amount)
 
         else:
-            return self.currency.mint(self.amount.__truediv__(other))
+            try:
+                return self.currency.mint(self.amount.__truediv__(other))
+            except TypeError as exc:
+                raise ScalarRequired(other) from exc
 
     @overload
-    def __floordiv__(self, other: Money) -> Decimal: ...
+    def __floordiv__(self, other: _AnyMoney) -> Decimal: ...
     @overload
     def __floordiv__(self, other: _Scalar) -> Money: ...
-    def __floordiv__(self, other: Money | _Scalar) -> Money | Decimal:
-        if isinstance(other, Money):
+    def __floordiv__(self, other: _AnyMoney | _Scalar) -> Money | Decimal:
+        if isinstance(other, (Money, MinorUnitMoney)):
             if self.currency != other.currency:
                 raise MismatchedCurrency(self.currency, other.currency)
 
             return self.amount.__floordiv__(other.amount)
 
         else:
-            return self.currency.mint(self.amount.__floordiv__(other))
+            try:
+                return self.currency.mint(self.amount.__floordiv__(other))
+            except TypeError as exc:
+                raise ScalarRequired(other) from exc
 
     @overload
-    def __mod__(self, other: Money) -> Money: ...
+    def __mod__(self, other: _AnyMoney) -> Money: ...
     @overload
     def __mod__(self, other: _Scalar) -> Money: ...
-    def __mod__(self, other: Money | _Scalar) -> Money:
-        if isinstance(other, Money):
+    def __mod__(self, other: _AnyMoney | _Scalar) -> Money:
+        if isinstance(other, (Money, MinorUnitMoney)):
             if self.currency != other.currency:
                 raise MismatchedCurrency(self.currency, other.currency)
 
             return self.currency.mint(self.amount.__mod__(other.amount))
 
         else:
-            return self.currency.mint(self.amount.__mod__(other))
+            try:
+                return self.currency.mint(self.amount.__mod__(other))
+            except TypeError as exc:
+                raise ScalarRequired(other) from exc
 
     def __itruediv__(self, other: _Scalar) -> Self:
         try:
@@ -212,7 +223,7 @@ class MoneyMathImpl(Protocol):
 
     def compare(
             self,
-            other: Money,
+            other: _AnyMoney,
             context: Context | None = None
             ) -> _Scalar:
         try:
@@ -227,7 +238,7 @@ class MoneyMathImpl(Protocol):
 
     def compare_signal(
             self,
-            other: Money,
+            other: _AnyMoney,
             context: Context | None = None
             ) -> _Scalar:
         try:
@@ -242,7 +253,7 @@ class MoneyMathImpl(Protocol):
 
     def compare_total(
             self,
-            other: Money,
+            other: _AnyMoney,
             context: Context | None = None
             ) -> _Scalar:
         try:
@@ -257,7 +268,7 @@ class MoneyMathImpl(Protocol):
 
     def compare_total_mag(
             self,
-            other: Money,
+            other: _AnyMoney,
             context: Context | None = None
             ) -> _Scalar:
         try:
@@ -273,7 +284,7 @@ class MoneyMathImpl(Protocol):
     @overload
     def remainder_near(
             self,
-            other: Money,
+            other: _AnyMoney,
             context: Context | None = None
             ) -> Money: ...
     @overload
@@ -284,10 +295,10 @@ class MoneyMathImpl(Protocol):
             ) -> Money: ...
     def remainder_near(
             self,
-            other: Money | _Scalar,
+            other: _AnyMoney | _Scalar,
             context: Context | None = None
             ) -> Money:
-        if isinstance(other, Money):
+        if isinstance(other, (Money, MinorUnitMoney)):
             if self.currency != other.currency:
                 raise MismatchedCurrency(self.currency, other.currency)
 
@@ -296,8 +307,11 @@ class MoneyMathImpl(Protocol):
                 other.amount, context=context))
 
         else:
-            return self.currency.mint(
-                self.amount.remainder_near(other, context=context))
+            try:
+                return self.currency.mint(
+                    self.amount.remainder_near(other, context=context))
+            except TypeError as exc:
+                raise ScalarRequired(other) from exc
 
     def shift(
             self,
@@ -334,7 +348,7 @@ class MoneyMathImpl(Protocol):
 
     def same_quantum(
             self,
-            other: Money,
+            other: _AnyMoney,
             context: Context | None = None
             ) -> bool:
         try:
@@ -379,7 +393,7 @@ class MoneyMathImpl(Protocol):
 
     def next_toward(
             self,
-            other: Money,
+            other: _AnyMoney,
             context: Context | None = None
             ) -> Money:
         try:
@@ -394,7 +408,7 @@ class MoneyMathImpl(Protocol):
 
     def max(
             self,
-            other: Money,
+            other: _AnyMoney,
             context: Context | None = None
             ) -> Money:
         try:
@@ -409,7 +423,7 @@ class MoneyMathImpl(Protocol):
 
     def max_mag(
             self,
-            other: Money,
+            other: _AnyMoney,
             context: Context | None = None
             ) -> Money:
         try:
@@ -424,7 +438,7 @@ class MoneyMathImpl(Protocol):
 
     def min(
             self,
-            other: Money,
+            other: _AnyMoney,
             context: Context | None = None
             ) -> Money:
         try:
@@ -439,7 +453,7 @@ class MoneyMathImpl(Protocol):
 
     def min_mag(
             self,
-            other: Money,
+            other: _AnyMoney,
             context: Context | None = None
             ) -> Money:
         try:
@@ -454,7 +468,7 @@ class MoneyMathImpl(Protocol):
 
     def copy_sign(
             self,
-            other: Money,
+            other: _AnyMoney,
             context: Context | None = None
             ) -> Money:
         try:
@@ -473,14 +487,14 @@ class MoneyMathImpl(Protocol):
     ###########################################################
 
     @overload
-    def __divmod__(self, other: Money) -> tuple[Decimal, Money]: ...
+    def __divmod__(self, other: _AnyMoney) -> tuple[Decimal, Money]: ...
     @overload
     def __divmod__(self, other: Decimal | int) -> tuple[Money, Money]: ...
     def __divmod__(
             self,
-            other: Decimal | int | Money
+            other: Decimal | int | _AnyMoney
             ) -> tuple[Decimal | Money, Money]:
-        if isinstance(other, Money):
+        if isinstance(other, (Money, MinorUnitMoney)):
             if self.currency != other.currency:
                 raise MismatchedCurrency(self.currency, other.currency)
 
@@ -488,7 +502,11 @@ class MoneyMathImpl(Protocol):
             return quotient, Money(amount=remainder, currency=self.currency)
 
         else:
-            quotient, remainder = self.amount.__divmod__(other)
+            try:
+                quotient, remainder = self.amount.__divmod__(other)
+            except TypeError as exc:
+                raise ScalarRequired(other) from exc
+
             return (
                 Money(amount=quotient, currency=self.currency),
                 Money(amount=remainder, currency=self.currency))
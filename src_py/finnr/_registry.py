@@ -0,0 +1,80 @@
+"""This module contains the registry of named ``CurrencySet``s, which
+is what allows currencies (and monies) to be pickled by reference
+instead of by value.
+
+Registry IDs are of the form ``'module.path:attribute'``, and point at
+where the currency set can be imported from. That way, even if the
+unpickling process hasn't yet imported (or, for lazy modules like
+``finnr.iso``, accessed) the currency set, it can be found on demand.
+"""
+from __future__ import annotations
+
+import threading
+import typing
+from importlib import import_module
+
+if typing.TYPE_CHECKING:
+    from finnr.currency import Currency
+    from finnr.currency import CurrencySet
+
+_registry: dict[str, CurrencySet] = {}
+# This guards both the registry itself and the registry IDs on the
+# currencies, so that concurrent registrations (for example, two threads
+# both lazily loading the same currency set) can't interleave.
+_registry_lock = threading.Lock()
+
+
+def register_currency_set(
+        registry_id: str,
+        currency_set: CurrencySet
+        ) -> None:
+    """Registers the currency set under the passed registry ID, and
+    stamps the ID on all of its currencies that aren't already part of
+    a different registered set. Raises ``ValueError`` if a different
+    currency set was already registered under the same ID.
+    """
+    with _registry_lock:
+        existing = _registry.setdefault(registry_id, currency_set)
+        if existing is not currency_set:
+            raise ValueError(
+                'A different CurrencySet is already registered with that ID!',
+                registry_id)
+
+        for currency in currency_set:
+            if currency._registry_id is None:
+                object.__setattr__(currency, '_registry_id', registry_id)
+
+
+def resolve_currency_set(registry_id: str) -> CurrencySet:
+    """Returns the currency set for the passed registry ID, importing
+    it if it hasn't been registered yet in the current process.
+    """
+    currency_set = _registry.get(registry_id)
+    if currency_set is None:
+        module_name, _, attribute = registry_id.partition(':')
+        try:
+            currency_set = getattr(import_module(module_name), attribute)
+        except (ImportError, AttributeError, ValueError) as exc:
+            exc.add_note(f'Unknown CurrencySet registry ID: {registry_id}')
+            raise exc
+
+        # The currency set usually registers itself when created, in which
+        # case this is a no-op, but it doesn't hurt to make sure.
+        register_currency_set(registry_id, currency_set)
+
+    return currency_set
+
+
+def restore_currency(registry_id: str, code_alpha3: str) -> Currency:
+    """Returns the canonical currency instance for the passed code from
+    the registered currency set. This is the unpickling counterpart to
+    ``Currency.__reduce__``.
+    """
+    currency_set = resolve_currency_set(registry_id)
+    currency = currency_set.get(code_alpha3)
+    if currency is None:
+        raise KeyError(
+            'Currency not found in registered CurrencySet!',
+            registry_id, code_alpha3)
+
+    return currency
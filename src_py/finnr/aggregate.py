@@ -0,0 +1,350 @@
+"""This module contains helpers for aggregating large numbers of
+``Money`` objects: ``MoneyBag`` for totals across any number of
+currencies, and ``MoneyAccumulator`` for a single currency.
+"""
+from __future__ import annotations
+
+import typing
+from collections.abc import Iterable
+from collections.abc import Iterator
+from decimal import Decimal
+from typing import Annotated
+
+from docnote import ClcNote
+
+from finnr.exceptions import MismatchedCurrency
+from finnr.money import Money
+
+if typing.TYPE_CHECKING:
+    from finnr.currency import Currency
+
+_ZERO = Decimal(0)
+
+
+class MoneyBag:
+    """A ``MoneyBag`` keeps a running total of ``Money`` values of any
+    number of different currencies, one total per currency. Unlike
+    adding ``Money`` objects directly, adding a value of a different
+    currency to a bag never raises ``MismatchedCurrency``; it simply
+    starts (or continues) a separate total for that currency.
+
+    Adding a value to the bag is O(1), and doesn't create any
+    intermediate ``Money`` objects; those are only created when reading
+    the totals back out of the bag.
+
+    > Example
+    __embed__: 'code/python'
+        >>> bag = MoneyBag([mint(1, 'EUR'), mint(2, 'USD')])
+        >>> bag += mint(3, 'EUR')
+        >>> bag[mint.get('EUR')]
+        Money(amount=Decimal('4'), currency=Currency(code_alpha3='EUR', ...))
+    """
+    __slots__ = ('_totals',)
+    _totals: dict[Currency, Decimal]
+
+    def __init__(self, monies: Iterable[Money] = ()):
+        self._totals = {}
+        self.add_many(monies)
+
+    def add(self, money: Money) -> None:
+        """Adds a single ``Money`` value to the bag."""
+        totals = self._totals
+        currency = money.currency
+        existing = totals.get(currency)
+        if existing is None:
+            totals[currency] = money.amount
+        else:
+            totals[currency] = existing + money.amount
+
+    def add_many(self, monies: Iterable[Money]) -> None:
+        """Adds every ``Money`` value in ``monies`` to the bag. This is
+        equivalent to -- but faster than -- calling ``add`` for each one.
+        """
+        totals = self._totals
+        get_total = totals.get
+        for money in monies:
+            currency = money.currency
+            existing = get_total(currency)
+            if existing is None:
+                totals[currency] = money.amount
+            else:
+                totals[currency] = existing + money.amount
+
+    def subtract(self, money: Money) -> None:
+        """Subtracts a single ``Money`` value from the bag. If the bag
+        didn't yet contain the currency, its total will be negative.
+        """
+        totals = self._totals
+        currency = money.currency
+        existing = totals.get(currency)
+        if existing is None:
+            totals[currency] = -money.amount
+        else:
+            totals[currency] = existing - money.amount
+
+    def subtract_many(self, monies: Iterable[Money]) -> None:
+        """Subtracts every ``Money`` value in ``monies`` from the bag.
+        """
+        totals = self._totals
+        get_total = totals.get
+        for money in monies:
+            currency = money.currency
+            existing = get_total(currency)
+            if existing is None:
+                totals[currency] = -money.amount
+            else:
+                totals[currency] = existing - money.amount
+
+    def merge(self, other: MoneyBag) -> None:
+        """Adds all of the totals from ``other`` into this bag."""
+        totals = self._totals
+        for currency, amount in other._totals.items():
+            existing = totals.get(currency)
+            if existing is None:
+                totals[currency] = amount
+            else:
+                totals[currency] = existing + amount
+
+    def copy(self) -> MoneyBag:
+        """Returns a shallow copy of the bag."""
+        copied = MoneyBag()
+        copied._totals = self._totals.copy()
+        return copied
+
+    def get[T](self, currency: Currency, default: T = None) -> Money | T:
+        """Returns the total for the passed currency, or ``default`` if
+        the bag doesn't contain it.
+        """
+        amount = self._totals.get(currency)
+        if amount is None:
+            return default
+
+        return Money(amount=amount, currency=currency)
+
+    @property
+    def currencies(self) -> frozenset[Currency]:
+        """Returns all of the currencies contained in the bag."""
+        return frozenset(self._totals)
+
+    def __getitem__(self, currency: Currency) -> Money:
+        return Money(amount=self._totals[currency], currency=currency)
+
+    def __contains__(self, currency: object) -> bool:
+        return currency in self._totals
+
+    def __iter__(self) -> Iterator[Money]:
+        for currency, amount in self._totals.items():
+            yield Money(amount=amount, currency=currency)
+
+    def __len__(self) -> int:
+        return len(self._totals)
+
+    def __iadd__(self, other: Money | MoneyBag) -> MoneyBag:
+        if isinstance(other, MoneyBag):
+            self.merge(other)
+        else:
+            self.add(other)
+        return self
+
+    def __isub__(self, other: Money | MoneyBag) -> MoneyBag:
+        if isinstance(other, MoneyBag):
+            self.subtract_many(other)
+        else:
+            self.subtract(other)
+        return self
+
+    def __add__(self, other: Money | MoneyBag) -> MoneyBag:
+        result = self.copy()
+        result += other
+        return result
+
+    def __sub__(self, other: Money | MoneyBag) -> MoneyBag:
+        result = self.copy()
+        result -= other
+        return result
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, MoneyBag):
+            return self._totals == other._totals
+
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({list(self)!r})'
+
+
+class MoneyAccumulator:
+    """A ``MoneyAccumulator`` keeps a running total of ``Money`` values
+    of a single currency. It's intended for tight summation loops:
+    adding a value only updates a single running ``Decimal``, and a
+    ``Money`` object is only created when reading the ``total``.
+
+    The currency can either be passed explicitly, or else it's taken
+    from the first value added to the accumulator. Adding a value of a
+    different currency raises ``MismatchedCurrency``.
+
+    > Example
+    __embed__: 'code/python'
+        >>> accumulator = MoneyAccumulator(monies)
+        >>> accumulator += mint(3, 'EUR')
+        >>> accumulator += more_monies
+        >>> accumulator.total
+        Money(amount=Decimal('42'), currency=Currency(code_alpha3='EUR', ...))
+    """
+    __slots__ = ('_amount', '_currency')
+    _amount: Decimal
+    _currency: Currency | None
+
+    def __init__(
+            self,
+            monies: Iterable[Money] = (),
+            *,
+            currency: Annotated[
+                Currency | None,
+                ClcNote('''The currency of the accumulator. If omitted, the
+                    currency of the first value added is used.''')
+                ] = None):
+        # Note that, just like the builtin sum, we start from zero.
+        self._amount = _ZERO
+        self._currency = currency
+        self.add_many(monies)
+
+    @property
+    def currency(self) -> Currency | None:
+        return self._currency
+
+    @property
+    def amount(self) -> Decimal:
+        """The current total, as a plain ``Decimal``."""
+        return self._amount
+
+    @property
+    def total(self) -> Money:
+        """The current total, as a ``Money`` object. Raises
+        ``ValueError`` if the accumulator doesn't have a currency yet
+        (ie, if it was created without one, and nothing has been added).
+        """
+        currency = self._currency
+        if currency is None:
+            raise ValueError('Accumulator has no currency yet!')
+
+        return Money(amount=self._amount, currency=currency)
+
+    def add(self, money: Money) -> None:
+        """Adds a single ``Money`` value to the total."""
+        currency = money.currency
+        # The identity check makes the common case a single comparison.
+        if currency is not self._currency:
+            self._check_currency(currency)
+        self._amount += money.amount
+
+    def add_many(self, monies: Iterable[Money]) -> None:
+        """Adds every ``Money`` value in ``monies`` to the total. This is
+        equivalent to -- but faster than -- calling ``add`` for each one.
+        If any of the monies has a different currency, all of the monies
+        before it will have been added.
+        """
+        amount = self._amount
+        own_currency = self._currency
+        try:
+            for money in monies:
+                currency = money.currency
+                if currency is not own_currency:
+                    self._check_currency(currency)
+                    own_currency = self._currency
+                amount += money.amount
+
+        finally:
+            self._amount = amount
+
+    def subtract(self, money: Money) -> None:
+        """Subtracts a single ``Money`` value from the total."""
+        currency = money.currency
+        if currency is not self._currency:
+            self._check_currency(currency)
+        self._amount -= money.amount
+
+    def subtract_many(self, monies: Iterable[Money]) -> None:
+        """Subtracts every ``Money`` value in ``monies`` from the total.
+        """
+        amount = self._amount
+        own_currency = self._currency
+        try:
+            for money in monies:
+                currency = money.currency
+                if currency is not own_currency:
+                    self._check_currency(currency)
+                    own_currency = self._currency
+                amount -= money.amount
+
+        finally:
+            self._amount = amount
+
+    def copy(self) -> MoneyAccumulator:
+        """Returns a copy of the accumulator."""
+        copied = MoneyAccumulator(currency=self._currency)
+        copied._amount = self._amount
+        return copied
+
+    def _check_currency(self, currency: Currency) -> None:
+        """Checks the currency of a new value against the currency of the
+        accumulator, adopting it if the accumulator doesn't have one yet.
+        """
+        own_currency = self._currency
+        if own_currency is None:
+            self._currency = currency
+        elif currency != own_currency:
+            raise MismatchedCurrency(own_currency, currency)
+
+    def __iadd__(
+            self,
+            other: Money | Iterable[Money] | MoneyAccumulator
+            ) -> MoneyAccumulator:
+        if isinstance(other, MoneyAccumulator):
+            if other._currency is not None:
+                self._check_currency(other._currency)
+                self._amount += other._amount
+        elif isinstance(other, Iterable):
+            self.add_many(other)
+        else:
+            self.add(other)
+        return self
+
+    def __isub__(
+            self,
+            other: Money | Iterable[Money] | MoneyAccumulator
+            ) -> MoneyAccumulator:
+        if isinstance(other, MoneyAccumulator):
+            if other._currency is not None:
+                self._check_currency(other._currency)
+                self._amount -= other._amount
+        elif isinstance(other, Iterable):
+            self.subtract_many(other)
+        else:
+            self.subtract(other)
+        return self
+
+    def __add__(
+            self,
+            other: Money | Iterable[Money] | MoneyAccumulator
+            ) -> MoneyAccumulator:
+        # Note that this is what makes sum(monies, MoneyAccumulator()) work,
+        # though += and add_many are both faster.
+        result = self.copy()
+        result += other
+        return result
+
+    def __sub__(
+            self,
+            other: Money | Iterable[Money] | MoneyAccumulator
+            ) -> MoneyAccumulator:
+        result = self.copy()
+        result -= other
+        return result
+
+    def __repr__(self) -> str:
+        return (
+            f'{type(self).__name__}(amount={self._amount!r}, '
+            + f'currency={self._currency!r})')
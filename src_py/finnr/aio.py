@@ -0,0 +1,295 @@
+"""This module contains asyncio pipeline stages for streams of money
+events -- for example, payment events from a message queue consumer.
+
+Every stage (except for ``batched``, which creates them) operates on
+micro-batches, ie, an async iterable of lists. Each batch is processed
+with the bulk APIs (``MoneyParser.parse_many``,
+``CurrencySet.mint_many``, etc), so the per-item overhead of both the
+coroutine machinery and the conversion itself is amortized across the
+whole batch.
+
+> Example
+__embed__: 'code/python'
+    parser = MoneyParser(mint)
+    totals = await aggregate(
+        quantize(parse(batched(consume_messages()), parser)))
+"""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterable
+from collections.abc import AsyncIterator
+from collections.abc import Callable
+from collections.abc import Sequence
+from dataclasses import dataclass
+from decimal import ROUND_HALF_UP
+from decimal import Decimal
+from typing import Annotated
+from typing import cast
+
+from docnote import ClcNote
+
+from finnr.aggregate import MoneyBag
+from finnr.currency import Currency
+from finnr.currency import CurrencySet
+from finnr.fx import RateTable
+from finnr.money import Money
+from finnr.money import round_many_to_minor
+from finnr.parsing import MoneyParser
+
+# These are the exceptions we expect from a single bad item, as opposed to
+# problems with the pipeline itself.
+_ITEM_EXCEPTIONS = (ArithmeticError, LookupError, TypeError, ValueError)
+_END_OF_STREAM = object()
+
+
+@dataclass(slots=True, frozen=True)
+class _SourceFailure:
+    exception: Exception
+
+
+async def batched[T](
+        source: AsyncIterable[T],
+        *,
+        max_size: Annotated[
+            int,
+            ClcNote('''The maximum number of items in a single batch.''')
+            ] = 1_000,
+        queue_size: Annotated[
+            int | None,
+            ClcNote('''The maximum number of items buffered from the source
+                before it is paused (ie, the backpressure limit). Defaults
+                to ``max_size``.''')
+            ] = None
+        ) -> AsyncIterator[list[T]]:
+    """Groups the items of the source into micro-batches. The source is
+    consumed by a background task into a bounded queue, and every batch
+    contains whatever is available in the queue (up to ``max_size``) as
+    soon as the next stage is ready for it. This means that batches
+    grow automatically when the downstream stages fall behind, without
+    ever delaying items while waiting for a batch to fill up.
+
+    If the source raises, any items received before the error are
+    yielded first, and then the error is re-raised.
+    """
+    if max_size < 1:
+        raise ValueError('Max batch size must be positive!', max_size)
+
+    queue: asyncio.Queue[object] = asyncio.Queue(
+        maxsize=max_size if queue_size is None else queue_size)
+
+    async def produce() -> None:
+        try:
+            async for item in source:
+                await queue.put(item)
+        except Exception as exc:
+            await queue.put(_SourceFailure(exc))
+        else:
+            await queue.put(_END_OF_STREAM)
+
+    producer = asyncio.create_task(produce())
+    try:
+        while True:
+            batch, terminal = _drain_batch(await queue.get(), queue, max_size)
+            if batch:
+                yield cast('list[T]', batch)
+
+            if terminal is _END_OF_STREAM:
+                return
+            elif isinstance(terminal, _SourceFailure):
+                raise terminal.exception
+
+    finally:
+        producer.cancel()
+
+
+async def unbatched[T](source: AsyncIterable[Sequence[T]]) -> AsyncIterator[T]:
+    """The inverse of ``batched``: flattens a stream of batches back
+    into individual items.
+    """
+    async for batch in source:
+        for item in batch:
+            yield item
+
+
+async def parse(
+        source: AsyncIterable[Sequence[str]],
+        parser: MoneyParser,
+        *,
+        on_error: Annotated[
+            Callable[[str, Exception], None] | None,
+            ClcNote('''If provided, this will be called with every string
+                that fails to parse, along with the exception, and the
+                string will be dropped. Otherwise, the first bad string
+                will raise.''')
+            ] = None,
+        quantize_to_minor: bool = False,
+        rounding: str = ROUND_HALF_UP
+        ) -> AsyncIterator[list[Money]]:
+    """Parses batches of money strings into batches of ``Money``
+    objects. ``quantize_to_minor`` and ``rounding`` have the same
+    meaning as in ``Currency.mint``.
+    """
+    async for batch in source:
+        try:
+            monies = parser.parse_many(
+                batch,
+                quantize_to_minor=quantize_to_minor,
+                rounding=rounding)
+
+        except _ITEM_EXCEPTIONS:
+            monies = _convert_by_item(
+                batch,
+                lambda text: parser.parse(
+                    text,
+                    quantize_to_minor=quantize_to_minor,
+                    rounding=rounding),
+                on_error)
+
+        if monies:
+            yield monies
+
+
+async def mint(
+        source: AsyncIterable[Sequence[tuple[Decimal | float | str, str]]],
+        currency_set: Annotated[
+            CurrencySet,
+            ClcNote('''The currency set used to resolve the currency codes,
+                for example, ``finnr.iso.mint``.''')],
+        *,
+        on_error: Annotated[
+            Callable[[tuple[Decimal | float | str, str], Exception], None]
+            | None,
+            ClcNote('''If provided, this will be called with every pair
+                that fails to mint, along with the exception, and the pair
+                will be dropped. Otherwise, the first bad pair will raise.
+                ''')
+            ] = None,
+        heal_float: bool = True,
+        quantize_to_minor: bool = False,
+        rounding: str = ROUND_HALF_UP
+        ) -> AsyncIterator[list[Money]]:
+    """Mints batches of ``(amount, code_alpha3)`` pairs into batches of
+    ``Money`` objects, via ``CurrencySet.mint_many``. The remaining
+    arguments have the same meaning as in ``Currency.mint``.
+    """
+    async for batch in source:
+        try:
+            monies = currency_set.mint_many(
+                [amount for amount, _ in batch],
+                [code_alpha3 for _, code_alpha3 in batch],
+                heal_float=heal_float,
+                quantize_to_minor=quantize_to_minor,
+                rounding=rounding)
+
+        except _ITEM_EXCEPTIONS:
+            monies = _convert_by_item(
+                batch,
+                lambda pair: currency_set(
+                    pair[0],
+                    pair[1],
+                    heal_float=heal_float,
+                    quantize_to_minor=quantize_to_minor,
+                    rounding=rounding),
+                on_error)
+
+        if monies:
+            yield monies
+
+
+async def quantize(
+        source: AsyncIterable[Sequence[Money]],
+        *,
+        rounding: str = ROUND_HALF_UP
+        ) -> AsyncIterator[list[Money]]:
+    """Rounds (or pads) every money to the minor unit of its currency,
+    exactly as if it had been minted with ``quantize_to_minor=True``,
+    via ``round_many_to_minor``.
+    """
+    async for batch in source:
+        yield round_many_to_minor(batch, rounding)
+
+
+async def convert(
+        source: AsyncIterable[Sequence[Money]],
+        rates: Annotated[
+            RateTable,
+            ClcNote('''The exchange rates to convert with.''')],
+        target: Currency,
+        *,
+        quantize_to_minor: bool = True,
+        rounding: str = ROUND_HALF_UP
+        ) -> AsyncIterator[list[Money]]:
+    """Converts every money in every batch into the target currency,
+    via ``RateTable.convert_many``. The remaining arguments have the
+    same meaning as in ``RateTable.convert``.
+    """
+    async for batch in source:
+        yield rates.convert_many(
+            batch,
+            target,
+            quantize_to_minor=quantize_to_minor,
+            rounding=rounding)
+
+
+async def aggregate(
+        source: AsyncIterable[Sequence[Money]],
+        bag: Annotated[
+            MoneyBag | None,
+            ClcNote('''An existing bag to add the monies to. If omitted, a
+                new one is created.''')
+            ] = None
+        ) -> MoneyBag:
+    """Consumes the entire stream, returning the per-currency totals.
+    """
+    if bag is None:
+        bag = MoneyBag()
+
+    async for batch in source:
+        bag.add_many(batch)
+
+    return bag
+
+
+def _drain_batch(
+        first_item: object,
+        queue: asyncio.Queue[object],
+        max_size: int
+        ) -> tuple[list[object], object]:
+    """Collects a batch from the first item plus whatever is already
+    waiting in the queue, stopping at either the max size or the end of
+    the source. Returns the batch, along with the end-of-stream marker
+    or the source failure if one was reached (or None otherwise).
+    """
+    batch: list[object] = []
+    item = first_item
+    while True:
+        if item is _END_OF_STREAM or isinstance(item, _SourceFailure):
+            return batch, item
+
+        batch.append(item)
+        if len(batch) >= max_size or queue.empty():
+            return batch, None
+
+        item = queue.get_nowait()
+
+
+def _convert_by_item[T](
+        batch: Sequence[T],
+        converter: Callable[[T], Money],
+        on_error: Callable[[T, Exception], None] | None
+        ) -> list[Money]:
+    """Converts a batch one item at a time, reporting (or raising) any
+    errors along the way.
+    """
+    monies: list[Money] = []
+    for item in batch:
+        try:
+            monies.append(converter(item))
+        except _ITEM_EXCEPTIONS as exc:
+            if on_error is None:
+                raise exc
+
+            on_error(item, exc)
+
+    return monies
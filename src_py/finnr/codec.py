@@ -0,0 +1,143 @@
+"""This module contains a compact binary codec for ``Money`` objects,
+for passing large numbers of amounts between processes without going
+through strings.
+
+Every money is encoded as a fixed-width, 11-byte little-endian record:
+++  the numeric currency code, as an unsigned 16-bit int
+++  the exponent of the amount, as a signed 8-bit int
+++  the coefficient of the amount, as a signed 64-bit int
+
+so that the amount is exactly ``coefficient * 10 ** exponent``. Records
+are simply concatenated; there is no header or framing.
+"""
+from __future__ import annotations
+
+import struct
+from collections.abc import Iterable
+from typing import Annotated
+
+from docnote import ClcNote
+
+from finnr._fixedpoint import decimal_to_scaled
+from finnr._fixedpoint import get_exponent
+from finnr._fixedpoint import scaled_to_decimal
+from finnr.currency import Currency
+from finnr.currency import CurrencySet
+from finnr.money import Money
+
+_RECORD = struct.Struct('<Hbq')
+
+RECORD_SIZE: Annotated[
+    int,
+    ClcNote('The size, in bytes, of a single encoded money.')
+] = _RECORD.size
+
+
+class MoneyCodec:
+    """A ``MoneyCodec`` encodes monies into (and decodes them from) the
+    binary format described in the module docs. Currencies are
+    encoded by their numeric code, and resolved against the
+    ``CurrencySet`` passed to the codec, so both sides must use
+    equivalent currency sets -- for example, ``finnr.iso.mint``.
+
+    Encoding and decoding are exact, with one exception: since the
+    coefficient is a plain integer, negative zero is decoded as
+    (positive) zero.
+
+    > Example
+    __embed__: 'code/python'
+        >>> codec = MoneyCodec(mint)
+        >>> payload = codec.encode_many([mint('12.34', 'EUR')])
+        >>> codec.decode_many(payload)
+        [Money(amount=Decimal('12.34'), currency=Currency(...))]
+    """
+    __slots__ = ('_by_num', '_code_nums')
+
+    def __init__(
+            self,
+            mint: Annotated[
+                CurrencySet,
+                ClcNote('''The currency set used to resolve numeric codes.
+                    Since numeric codes can be reused over time, only the
+                    most recently-active currency for each numeric code can
+                    be encoded.''')]):
+        by_num: dict[int, Currency] = {}
+        for currency in mint:
+            canonical = mint.get(currency.code_num)
+            if canonical is not None:
+                by_num[currency.code_num] = canonical
+
+        self._by_num = by_num
+        self._code_nums = {
+            currency: code_num for code_num, currency in by_num.items()}
+
+    def encode(self, money: Money) -> bytes:
+        """Encodes a single money into one record."""
+        return self.encode_many((money,))
+
+    def decode(self, data: bytes | bytearray | memoryview) -> Money:
+        """Decodes a single record back into a money. Raises
+        ``ValueError`` if ``data`` isn't exactly one record long.
+        """
+        if len(data) != RECORD_SIZE:
+            raise ValueError(
+                'Data must be exactly one record long!', len(data))
+
+        return self.decode_many(data)[0]
+
+    def encode_many(self, monies: Iterable[Money]) -> bytes:
+        """Encodes all of the passed monies, returning the concatenated
+        records in the same order. Raises ``KeyError`` for currencies
+        that aren't encodable by the codec, and ``OverflowError`` for
+        amounts that don't fit into the record.
+        """
+        code_nums = self._code_nums
+        pack = _RECORD.pack
+        records: list[bytes] = []
+        for money in monies:
+            amount = money.amount
+            try:
+                code_num = code_nums[money.currency]
+            except KeyError as exc:
+                exc.add_note('Currency not encodable by this MoneyCodec!')
+                raise exc
+
+            exponent = get_exponent(amount)
+            try:
+                records.append(pack(
+                    code_num,
+                    exponent,
+                    decimal_to_scaled(amount, exponent)))
+            except struct.error as exc:
+                raise OverflowError(
+                    'Amount too large or precise to encode!', money
+                ) from exc
+
+        return b''.join(records)
+
+    def decode_many(
+            self,
+            data: bytes | bytearray | memoryview
+            ) -> list[Money]:
+        """Decodes a buffer of concatenated records back into monies,
+        in the same order. The amounts are constructed directly from
+        their integer coefficients, without any string formatting.
+        Raises ``ValueError`` if the buffer isn't a whole number of
+        records long, and ``KeyError`` for unknown currencies.
+        """
+        if len(data) % RECORD_SIZE:
+            raise ValueError(
+                'Data length must be a multiple of the record size!',
+                len(data))
+
+        by_num = self._by_num
+        try:
+            return [
+                Money(
+                    amount=scaled_to_decimal(coefficient, exponent),
+                    currency=by_num[code_num])
+                for code_num, exponent, coefficient
+                in _RECORD.iter_unpack(data)]
+        except KeyError as exc:
+            exc.add_note('Unknown numeric currency code for this MoneyCodec!')
+            raise exc
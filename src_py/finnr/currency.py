@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+from bisect import bisect_right
 from collections import defaultdict
+from collections.abc import Callable
+from collections.abc import Iterable
 from collections.abc import Sequence
 from dataclasses import dataclass
 from dataclasses import field
 from decimal import ROUND_HALF_UP
+from decimal import Context
 from decimal import Decimal
-from decimal import localcontext
+from decimal import getcontext
 from sys import float_info
 from typing import Annotated
 from typing import Literal
@@ -15,10 +19,18 @@ from typing import overload
 
 from docnote import ClcNote
 
+from finnr._fixedpoint import EXACT_CONTEXT
+from finnr._registry import register_currency_set
+from finnr._registry import restore_currency
 from finnr._types import DateLike
 from finnr._types import Singleton
+from finnr.money import MinorUnitMoney
 from finnr.money import Money
 
+_ONE = Decimal(1)
+# This is the same as the decimal module default. See Currency.context.
+_MIN_CONTEXT_PRECISION = 28
+
 
 @dataclass(slots=True, frozen=True)
 class Currency:
@@ -129,6 +141,27 @@ class Currency:
         """
         return self.approx_active_until is None
 
+    @overload
+    def mint(
+            self,
+            amount: Decimal | float | str | tuple[int, Sequence[int], int],
+            *,
+            heal_float: bool = True,
+            quantize_to_minor: bool = False,
+            rounding: str = ROUND_HALF_UP,
+            fixed_point: Literal[False] = False
+            ) -> Money: ...
+    @overload
+    def mint(
+            self,
+            amount: Decimal | float | str | tuple[int, Sequence[int], int],
+            *,
+            heal_float: bool = True,
+            quantize_to_minor: bool = False,
+            rounding: str = ROUND_HALF_UP,
+            fixed_point: bool
+            ) -> Money | MinorUnitMoney: ...
+
     def mint(
             self,
             amount: Decimal | float | str | tuple[int, Sequence[int], int],
@@ -157,8 +190,22 @@ class Currency:
                     operation.
 
                     Otherwise, this is ignored.''')
-                ] = ROUND_HALF_UP
-            ) -> Money:
+                ] = ROUND_HALF_UP,
+            fixed_point: Annotated[
+                bool,
+                ClcNote('''If ``True`` (**not** the default), and the amount
+                    is an exact multiple of the minor unit of the currency,
+                    this will return a ``MinorUnitMoney`` instead of a
+                    ``Money``, storing the amount as an integer count of
+                    minor units. This makes addition, subtraction, and
+                    comparison significantly faster.
+
+                    If the amount has precision below the minor unit (or if
+                    the currency's minor unit cannot be represented as a
+                    fixed-point integer), this falls back to returning a
+                    normal, ``Decimal``-backed ``Money`` object.''')
+                ] = False
+            ) -> Money | MinorUnitMoney:
         """Creates a Money instance for the current currency, using the
         passed amount.
         """
@@ -170,40 +217,200 @@ class Currency:
             dec_amount = Decimal(amount)
 
         if quantize_to_minor:
-            currency_metadata = self._metadata
-            # If this is None, it means either that the currency is continuous
-            # (eg a fictional unit of account), or that the minor unit is
-            # unknown; in both of those cases, we'll skip rounding and simply
-            # use the original dec_amount. Otherwise, we've work to do!
-            if currency_metadata.minor_quantizor is not None:
-                dec_amount = dec_amount.quantize(
-                    currency_metadata.minor_quantizor,
-                    rounding=rounding)
-
-                if not currency_metadata.is_decimal:
-                    # Note that this must be int, or the minor_quantizor
-                    # would be None.
-                    minor_denom = cast(int, self.minor_unit_denominator)
-                    # This seems a little aroundabout, but we're doing it this
-                    # way so that we can respect the passed rounding behavior.
-                    # Otherwise it would probably be faster to do this via mod.
-                    shifted_amount = dec_amount * minor_denom
-                    with localcontext() as ctx:
-                        ctx.rounding = rounding
-                        # Note that the zero here is necessary to keep it a
-                        # decimal, otherwise we'll end up with an int
-                        rounded_shifted_amount = round(shifted_amount, 0)
-
-                    dec_amount = rounded_shifted_amount / minor_denom
+            rounder = self._get_minor_rounder(rounding)
+            dec_amount = rounder.round_one(dec_amount)
+
+        if fixed_point:
+            minor_units = self._to_minor_units(dec_amount)
+            if minor_units is not None:
+                return MinorUnitMoney(minor_units=minor_units, currency=self)
 
         return Money(
             amount=dec_amount,
             currency=self)
 
+    def mint_many(
+            self,
+            amounts: Iterable[
+                Decimal | float | str | tuple[int, Sequence[int], int]],
+            *,
+            heal_float: bool = True,
+            quantize_to_minor: bool = False,
+            rounding: str = ROUND_HALF_UP
+            ) -> list[Money]:
+        """The bulk equivalent of ``mint``: creates a ``Money`` instance
+        for every amount in ``amounts``, returning them as a list in the
+        same order. Arguments have the same meaning as in ``mint``, and
+        the results are identical to calling ``mint`` for each amount.
+
+        This is significantly faster than calling ``mint`` in a loop,
+        since all of the per-call setup -- type dispatch on the amounts,
+        float healing, and quantization -- is done once per batch.
+        """
+        dec_amounts = _convert_to_decimals(list(amounts), heal_float)
+
+        if quantize_to_minor:
+            dec_amounts = self._get_minor_rounder(rounding).round_many(
+                dec_amounts)
+
+        return [
+            Money(amount=dec_amount, currency=self)
+            for dec_amount in dec_amounts]
+
+    def mint_minor_units(self, minor_units: int) -> MinorUnitMoney:
+        """Creates a ``MinorUnitMoney`` instance directly from an integer
+        count of minor units of the currency -- for example, 1234 cents
+        for ``12.34 EUR``. Raises ``ValueError`` if the currency doesn't
+        support fixed-point amounts.
+        """
+        if self._metadata.minor_exponent is None:
+            raise ValueError(
+                'Currency does not support fixed-point amounts!', self)
+
+        return MinorUnitMoney(minor_units=minor_units, currency=self)
+
+    def context(
+            self,
+            rounding: Annotated[
+                str,
+                ClcNote('''The rounding mode of the context, as one of the
+                    ``decimal`` module rounding constants.''')
+                ] = ROUND_HALF_UP
+            ) -> Context:
+        """Returns a ``decimal.Context`` for doing math on amounts of
+        this currency, with the passed rounding mode and a precision of
+        at least 28 significant digits (the same as the ``decimal``
+        module default). If the thread's current decimal context has a
+        higher precision, that is used instead, so that very large or
+        very precise amounts can still be rounded. This is what finnr
+        itself uses when rounding amounts of the currency, so a lower
+        precision (or a different rounding mode) in the thread's
+        context never affects the results.
+
+        The contexts are created once per currency, rounding mode, and
+        precision, and then shared, so treat them as immutable:
+        **don't** change their settings (copy them instead, or use them
+        via ``decimal.localcontext(...)``, which copies them for you).
+        Since they're shared, their flags are also meaningless.
+
+        > Example
+        __embed__: 'code/python'
+            context = currency.context(ROUND_HALF_EVEN)
+            total = context.multiply(money.amount, tax_rate)
+        """
+        precision = _get_context_precision()
+        contexts = self._metadata.contexts
+        context = contexts.get((rounding, precision))
+        if context is None:
+            # As with the minor rounders, a race here is harmless.
+            context = contexts[rounding, precision] = Context(
+                prec=precision, rounding=rounding)
+
+        return context
+
+    def _get_minor_rounder(self, rounding: str) -> _MinorRounder:
+        """Returns a rounder for decimal amounts to the minor unit of
+        the currency, using the passed rounding mode (and the
+        precision of ``Currency.context``). These are built once per
+        rounding mode and precision and then cached on the currency
+        metadata, so that the hot path doesn't need to re-derive any of
+        the quantizers (or check the kind of currency) on every call.
+
+        For currencies without a (known) minor unit, the returned
+        rounder simply returns the amounts unchanged.
+        """
+        precision = _get_context_precision()
+        minor_rounders = self._metadata.minor_rounders
+        rounder = minor_rounders.get((rounding, precision))
+        if rounder is None:
+            # Note that a race here is harmless: at worst, we'll build the
+            # same rounder twice, and one of them will win.
+            rounder = minor_rounders[rounding, precision] = (
+                _build_minor_rounder(
+                    self._metadata,
+                    self.minor_unit_denominator,
+                    self.context(rounding)))
+
+        return rounder
+
+    def _to_minor_units(self, dec_amount: Decimal) -> int | None:
+        """Converts the passed decimal amount into an exact integer
+        count of minor units, returning None if that isn't possible.
+        """
+        currency_metadata = self._metadata
+        minor_exponent = currency_metadata.minor_exponent
+        if minor_exponent is None or not dec_amount.is_finite():
+            return None
+
+        scaled = dec_amount.scaleb(-minor_exponent, context=EXACT_CONTEXT)
+        if scaled != scaled.to_integral_value():
+            return None
+
+        minor_units, remainder = divmod(
+            int(scaled), currency_metadata.minor_multiplier)
+        if remainder:
+            return None
+
+        return minor_units
+
     # TODO (Note that this gets a bit complicated due to Unknowns):
     # def was_active_at(self, date: DateLike) -> bool:
 
     _metadata: _CurrencyMetadata = field(init=False, compare=False, repr=False)
+    _hash: int = field(init=False, compare=False, repr=False)
+    # This is set when the currency is part of a registered CurrencySet.
+    # See CurrencySet.register.
+    _registry_id: str | None = field(
+        init=False, compare=False, repr=False)
+
+    def __eq__(self, other: object) -> bool:
+        # Currencies within a CurrencySet are canonical instances, so in the
+        # overwhelmingly common case, this is resolved by the identity check
+        # alone, without needing to build and compare any tuples.
+        if self is other:
+            return True
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+
+        other = cast(Currency, other)
+        return (
+            self._hash == other._hash
+            and self.code_alpha3 == other.code_alpha3
+            and self.code_num == other.code_num
+            and self.minor_unit_denominator == other.minor_unit_denominator)
+
+    def __ne__(self, other: object) -> bool:
+        if self is other:
+            return False
+
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return not result
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __reduce__(self):
+        # Currencies from a registered CurrencySet are pickled by reference,
+        # which both keeps payloads small and makes sure that unpickling
+        # returns the canonical instance instead of a duplicate.
+        if self._registry_id is not None:
+            return (restore_currency, (self._registry_id, self.code_alpha3))
+
+        # Otherwise, we pickle by value. Note that the cached hash must not
+        # be pickled, because string hashes (and therefore our own) aren't
+        # stable across processes. Re-running the constructor takes care of
+        # recalculating it (and the metadata).
+        return (Currency, (
+            self.code_alpha3,
+            self.code_num,
+            self.minor_unit_denominator,
+            self.entities,
+            self.name,
+            self.approx_active_from,
+            self.approx_active_until))
+
     def __post_init__(self):
         if (
             self.minor_unit_denominator is None
@@ -211,13 +418,20 @@ class Currency:
         ):
             minor_quantizor = None
             is_decimal = True
+            minor_exponent = None
+            minor_multiplier = 1
 
         else:
             minor_quantizor = Decimal(1) / self.minor_unit_denominator
             is_decimal = not bool(self.minor_unit_denominator % 10)
+            minor_exponent, minor_multiplier = _calc_fixed_point_scale(
+                self.minor_unit_denominator)
 
         object.__setattr__(self, '_metadata', _CurrencyMetadata(
-            minor_quantizor, is_decimal))
+            minor_quantizor, is_decimal, minor_exponent, minor_multiplier))
+        object.__setattr__(self, '_hash', hash((
+            self.code_alpha3, self.code_num, self.minor_unit_denominator)))
+        object.__setattr__(self, '_registry_id', None)
 
 
 @dataclass(slots=True)
@@ -228,6 +442,132 @@ class _CurrencyMetadata:
     """
     minor_quantizor: Decimal | None
     is_decimal: bool
+    # These are used to convert between integer counts of minor units and
+    # decimal amounts: ``amount = minor_units * minor_multiplier * 10 **
+    # minor_exponent``. A minor_exponent of None means that the currency
+    # cannot be represented as fixed-point.
+    minor_exponent: int | None
+    minor_multiplier: int
+    # These are built lazily, one per rounding mode and precision; see
+    # Currency._get_minor_rounder.
+    minor_rounders: dict[tuple[str, int], _MinorRounder] = field(
+        default_factory=dict)
+    # Same as above; see Currency.context.
+    contexts: dict[tuple[str, int], Context] = field(default_factory=dict)
+
+
+@dataclass(slots=True, frozen=True)
+class _MinorRounder:
+    """Rounds decimal amounts to the minor unit of a particular
+    currency, using a particular rounding mode. ``round_many`` is the
+    batch equivalent of ``round_one``, and always returns a new list.
+    """
+    round_one: Callable[[Decimal], Decimal]
+    round_many: Callable[[Sequence[Decimal]], list[Decimal]]
+
+
+def _build_minor_rounder(
+        currency_metadata: _CurrencyMetadata,
+        minor_unit_denominator: int | Literal[Singleton.UNKNOWN] | None,
+        context: Context
+        ) -> _MinorRounder:
+    minor_quantizor = currency_metadata.minor_quantizor
+    # If this is None, it means either that the currency is continuous (eg a
+    # fictional unit of account), or that the minor unit is unknown; in both
+    # of those cases, we skip rounding and simply use the original amount.
+    if minor_quantizor is None:
+        return _MinorRounder(_skip_rounding, list)
+
+    rounding = context.rounding
+    if currency_metadata.is_decimal:
+        def round_decimal(dec_amount: Decimal) -> Decimal:
+            return dec_amount.quantize(minor_quantizor, rounding, context)
+
+        def round_decimal_many(
+                dec_amounts: Sequence[Decimal]
+                ) -> list[Decimal]:
+            return [
+                dec_amount.quantize(minor_quantizor, rounding, context)
+                for dec_amount in dec_amounts]
+
+        return _MinorRounder(round_decimal, round_decimal_many)
+
+    # Note that this must be int, or the minor_quantizor would be None.
+    minor_denom = Decimal(cast(int, minor_unit_denominator))
+    multiply = context.multiply
+    divide = context.divide
+
+    # This seems a little aroundabout, but we're doing it this way so that we
+    # can respect the passed rounding behavior: first we round to the
+    # exponent of the minor unit, and then to a whole number of minor units.
+    # Note that quantizing to 1 is exactly what round(x, 0) does. Everything
+    # is done within the currency's context, so we never touch the thread's
+    # decimal context. Also note that all of the arguments are passed
+    # positionally, since keyword parsing is a significant part of the cost
+    # of these calls.
+    def round_non_decimal(dec_amount: Decimal) -> Decimal:
+        shifted_amount = multiply(
+            dec_amount.quantize(minor_quantizor, rounding, context),
+            minor_denom)
+        return divide(
+            shifted_amount.quantize(_ONE, rounding, context), minor_denom)
+
+    def round_non_decimal_many(
+            dec_amounts: Sequence[Decimal]
+            ) -> list[Decimal]:
+        return [
+            divide(
+                multiply(
+                    dec_amount.quantize(minor_quantizor, rounding, context),
+                    minor_denom
+                ).quantize(_ONE, rounding, context),
+                minor_denom)
+            for dec_amount in dec_amounts]
+
+    return _MinorRounder(round_non_decimal, round_non_decimal_many)
+
+
+def _get_context_precision() -> int:
+    """Returns the precision to use for currency contexts: the thread's
+    current precision, but never less than the decimal module default.
+    """
+    precision = getcontext().prec
+    if precision < _MIN_CONTEXT_PRECISION:
+        return _MIN_CONTEXT_PRECISION
+
+    return precision
+
+
+def _skip_rounding(dec_amount: Decimal) -> Decimal:
+    return dec_amount
+
+
+def _calc_fixed_point_scale(
+        minor_unit_denominator: int
+        ) -> tuple[int | None, int]:
+    """Finds the smallest power of ten that is an integer multiple of
+    the minor unit denominator, so that every minor unit can be exactly
+    represented as a decimal. Returns the (negative) exponent of that
+    power of ten, along with the multiplier from minor units to it.
+
+    If there's no such power of ten -- ie, if the minor unit denominator
+    has any prime factors other than 2 and 5 -- returns None for the
+    exponent.
+    """
+    remaining = minor_unit_denominator
+    twos = fives = 0
+    while not remaining % 2:
+        remaining //= 2
+        twos += 1
+    while not remaining % 5:
+        remaining //= 5
+        fives += 1
+
+    if remaining != 1:
+        return None, 1
+
+    exponent = max(twos, fives)
+    return -exponent, 10 ** exponent // minor_unit_denominator
 
 
 class CurrencySet(frozenset[Currency]):
@@ -243,6 +583,7 @@ class CurrencySet(frozenset[Currency]):
     """
     _by_alpha3: dict[str, Currency]
     _by_num: dict[int, list[Currency]]
+    _by_num_dated: dict[int, _DateIndex]
 
     def __init__(self, *args, **kwargs):
         self._by_alpha3 = alpha_lookup = {}
@@ -276,6 +617,33 @@ class CurrencySet(frozenset[Currency]):
                 key=_sortkey_most_recently_active,
                 reverse=True)
 
+        self._by_num_dated = {
+            code_num: _build_date_index(by_num_list)
+            for code_num, by_num_list in num_lookup.items()}
+
+    @overload
+    def __call__(
+            self,
+            amount: Decimal | float | str | tuple[int, Sequence[int], int],
+            code_alpha3: str,
+            *,
+            heal_float: bool = True,
+            quantize_to_minor: bool = False,
+            rounding: str = ROUND_HALF_UP,
+            fixed_point: Literal[False] = False
+            ) -> Money: ...
+    @overload
+    def __call__(
+            self,
+            amount: Decimal | float | str | tuple[int, Sequence[int], int],
+            code_alpha3: str,
+            *,
+            heal_float: bool = True,
+            quantize_to_minor: bool = False,
+            rounding: str = ROUND_HALF_UP,
+            fixed_point: bool
+            ) -> Money | MinorUnitMoney: ...
+
     def __call__(
             self,
             amount: Decimal | float | str | tuple[int, Sequence[int], int],
@@ -305,8 +673,15 @@ class CurrencySet(frozenset[Currency]):
                     operation.
 
                     Otherwise, this is ignored.''')
-                ] = ROUND_HALF_UP
-            ) -> Money:
+                ] = ROUND_HALF_UP,
+            fixed_point: Annotated[
+                bool,
+                ClcNote('''If ``True`` (**not** the default), this will
+                    return a ``MinorUnitMoney`` whenever the amount is an
+                    exact multiple of the minor unit of the currency. See
+                    ``Currency.mint`` for details.''')
+                ] = False
+            ) -> Money | MinorUnitMoney:
         """Mints a new instance of the currency. Arguments have the same
         meaning as ``Currency.mint``.
         """
@@ -320,7 +695,95 @@ class CurrencySet(frozenset[Currency]):
             amount,
             heal_float=heal_float,
             quantize_to_minor=quantize_to_minor,
-            rounding=rounding)
+            rounding=rounding,
+            fixed_point=fixed_point)
+
+    def intern(self, currency: Currency) -> Currency:
+        """Returns the canonical instance of ``currency`` from within
+        the currency set -- ie, the instance that all lookups return.
+        This is useful when currencies are constructed elsewhere (for
+        example, when they come from an external source), since
+        canonical instances compare equal via a simple identity check.
+
+        Raises ``KeyError`` if the currency isn't part of the set.
+        """
+        canonical = self._by_alpha3.get(currency.code_alpha3)
+        if canonical is None or canonical != currency:
+            raise KeyError('Currency not in CurrencySet!', currency)
+
+        return canonical
+
+    def register(
+            self,
+            registry_id: Annotated[
+                str,
+                ClcNote('''The import path of the currency set, in the form
+                    ``'module.path:attribute'`` -- for example,
+                    ``'finnr.iso:mint'``. This must be importable in any
+                    process that unpickles the currencies.''')]
+            ) -> None:
+        """Registers the currency set under the passed ID, so that its
+        currencies -- and any monies using them -- are pickled by
+        reference (ie, as the registry ID and alpha3 code) instead of by
+        value. Unpickling then returns the canonical currency instances
+        from the set, instead of creating duplicates.
+
+        Currencies that are already part of a different registered set
+        keep their original registration.
+        """
+        register_currency_set(registry_id, self)
+
+    def mint_many(
+            self,
+            amounts: Iterable[
+                Decimal | float | str | tuple[int, Sequence[int], int]],
+            codes_alpha3: Iterable[str],
+            *,
+            heal_float: bool = True,
+            quantize_to_minor: bool = False,
+            rounding: str = ROUND_HALF_UP
+            ) -> list[Money]:
+        """The bulk equivalent of calling the currency set: mints a new
+        ``Money`` for every pair of amount and currency code, returning
+        them as a list in the same order. Arguments have the same
+        meaning as ``Currency.mint``.
+
+        This is significantly faster than minting in a loop. Currency
+        lookups are done once per distinct code, and then the amounts
+        are minted in one ``Currency.mint_many`` batch per currency.
+        """
+        amounts = list(amounts)
+        codes_alpha3 = list(codes_alpha3)
+        if len(amounts) != len(codes_alpha3):
+            raise ValueError(
+                'Amounts and codes must be the same length!',
+                len(amounts), len(codes_alpha3))
+
+        # Group the indices of the amounts by their code. Note that we're
+        # doing this before looking up the currency, so that each distinct
+        # code string (which might be eg lowercase) only gets looked up
+        # once.
+        indices_by_code: dict[str, list[int]] = defaultdict(list)
+        for index, code_alpha3 in enumerate(codes_alpha3):
+            indices_by_code[code_alpha3].append(index)
+
+        results: list[Money] = [None] * len(amounts)  # type: ignore
+        for code_alpha3, indices in indices_by_code.items():
+            try:
+                currency = self._by_alpha3[code_alpha3.upper()]
+            except KeyError as exc:
+                exc.add_note('Invalid currency code for this CurrencySet!')
+                raise exc
+
+            minted = currency.mint_many(
+                [amounts[index] for index in indices],
+                heal_float=heal_float,
+                quantize_to_minor=quantize_to_minor,
+                rounding=rounding)
+            for index, money in zip(indices, minted, strict=True):
+                results[index] = money
+
+        return results
 
     @overload
     def get[T](self, code: str, default: T = None) -> Currency | T: ...
@@ -360,12 +823,13 @@ class CurrencySet(frozenset[Currency]):
             if code not in self._by_num:
                 return default
 
-            for_all_nums = self._by_num[code]
             if on_date is None:
-                return for_all_nums[0]
+                return self._by_num[code][0]
 
             else:
-                currency = _get_on_specific_date(for_all_nums, on_date)
+                starts, currencies = self._by_num_dated[code]
+                currency = currencies[
+                    bisect_right(starts, _quickcomp_datelike(on_date)) - 1]
                 if currency is None:
                     return default
                 else:
@@ -374,30 +838,159 @@ class CurrencySet(frozenset[Currency]):
         else:
             raise TypeError('Code must be either string or integer!', code)
 
+    def get_many[T](
+            self,
+            codes: Iterable[str | int],
+            on_dates: Annotated[
+                Iterable[DateLike] | None,
+                ClcNote('''If provided, this must be the same length as
+                    ``codes``. Each date is used (only) to resolve the
+                    corresponding numeric code, exactly as with ``get``.
+                    ''')
+                ] = None,
+            default: T = None,
+            ) -> list[Currency | T]:
+        """The bulk equivalent of ``get``: finds the currency for every
+        code in ``codes``, returning them as a list in the same order.
+        Missing currencies are returned as ``default``.
+
+        This is significantly faster than calling ``get`` in a loop,
+        particularly when resolving numeric codes on specific dates.
+        """
+        if on_dates is None:
+            return [self.get(code, default) for code in codes]
+
+        by_alpha3 = self._by_alpha3
+        by_num_dated = self._by_num_dated
+        results: list[Currency | T] = []
+        for code, on_date in zip(codes, on_dates, strict=True):
+            if isinstance(code, str):
+                results.append(by_alpha3.get(code.upper(), default))
+                continue
+
+            # Note that this must come before the lookup, since (for example)
+            # ``978.0`` would otherwise find the same currency as ``978``.
+            if not isinstance(code, int):
+                raise TypeError('Code must be either string or integer!', code)
+
+            date_index = by_num_dated.get(code)
+            if date_index is None:
+                results.append(default)
+                continue
+
+            starts, currencies = date_index
+            currency = currencies[
+                bisect_right(starts, _quickcomp_datelike(on_date)) - 1]
+            results.append(default if currency is None else currency)
+
+        return results
+
+
+type _DateIndex = tuple[list[int], list[Currency | None]]
+
+
+def _build_date_index(bynum_list: list[Currency]) -> _DateIndex:
+    """Numeric codes can be reused over time. To find the currency for
+    a numeric code on a particular date, we precompute (for each code) a
+    sorted list of encoded dates at which the currency for that code
+    changes, along with the currency in effect starting at that date
+    (or None, if no currency was active). Lookups are then just a
+    bisection of that list.
+
+    The rules themselves (and the precedence between currencies with
+    overlapping active dates) are defined by ``_get_on_encoded_date``.
+    Since the result of that can only change at the start of a
+    currency's active range, or immediately after its end, we only need
+    to evaluate it at those points. Everything before the first of them
+    is covered by a leading start of zero, which precedes every valid
+    encoded date.
+    """
+    boundaries = {0}
+    for currency in bynum_list:
+        active_from, active_until = _encode_active_range(currency)
+        boundaries.add(active_from)
+        if active_until is not None:
+            boundaries.add(active_until + 1)
+
+    starts: list[int] = []
+    currencies: list[Currency | None] = []
+    for boundary in sorted(boundaries):
+        currency = _get_on_encoded_date(bynum_list, boundary)
+        # Collapse adjacent ranges with the same result, to keep things
+        # compact
+        if not currencies or currencies[-1] is not currency:
+            starts.append(boundary)
+            currencies.append(currency)
+
+    return starts, currencies
+
 
-def _get_on_specific_date(
+def _get_on_encoded_date(
         bynum_list: list[Currency],
-        target_date: DateLike
+        target: int
         ) -> Currency | None:
-    """Use this to find a currency defined on a particular date. Returns
-    None if there wasn't any there.
+    """Use this to find a currency defined on a particular (encoded)
+    date. Returns None if there wasn't any there.
     """
     for currency in bynum_list:
         # Note that this relies upon the bynum_list sorting to work!
+        active_from, active_until = _encode_active_range(currency)
         if (
-            currency.approx_active_until is None
-            or currency.approx_active_until is Singleton.UNKNOWN
-            or (
-                _quickcomp_datelike(target_date)
-                <= _quickcomp_datelike(currency.approx_active_until))
+            (active_until is None or target <= active_until)
+            and target >= active_from
         ):
-            if currency.approx_active_from is Singleton.UNKNOWN:
-                return currency
-            elif (
-                _quickcomp_datelike(target_date)
-                >= _quickcomp_datelike(currency.approx_active_from)
-            ):
-                return currency
+            return currency
+
+    return None
+
+
+def _encode_active_range(currency: Currency) -> tuple[int, int | None]:
+    """Encodes the active range of the currency as a pair of
+    ``_quickcomp_datelike`` values. Unknown start dates are encoded as
+    zero (ie, before all time), and unknown or missing end dates are
+    encoded as None (ie, unbounded).
+    """
+    if currency.approx_active_from is Singleton.UNKNOWN:
+        active_from = 0
+    else:
+        active_from = _quickcomp_datelike(currency.approx_active_from)
+
+    if (
+        currency.approx_active_until is None
+        or currency.approx_active_until is Singleton.UNKNOWN
+    ):
+        active_until = None
+    else:
+        active_until = _quickcomp_datelike(currency.approx_active_until)
+
+    return active_from, active_until
+
+
+def _convert_to_decimals(
+        amounts: list[Decimal | float | str | tuple[int, Sequence[int], int]],
+        heal_float: bool
+        ) -> list[Decimal]:
+    """Converts all of the passed amounts to decimals, with the same
+    semantics as ``Currency.mint``. In the common case where all of the
+    amounts are of the same type, the type dispatch is done once for the
+    whole list instead of once per amount.
+    """
+    amount_types = set(map(type, amounts))
+    if len(amount_types) == 1:
+        amount_type, = amount_types
+        if issubclass(amount_type, Decimal):
+            return cast(list[Decimal], amounts)
+        elif issubclass(amount_type, float) and heal_float:
+            return [_heal_float(Decimal(amount)) for amount in amounts]
+        else:
+            return list(map(Decimal, amounts))
+
+    return [
+        _heal_float(Decimal(amount))
+        if heal_float and isinstance(amount, float)
+        else amount if isinstance(amount, Decimal)
+        else Decimal(amount)
+        for amount in amounts]
 
 
 def _quickcomp_datelike(datelike: DateLike) -> int:
@@ -21,3 +21,10 @@ class MismatchedCurrency(FinnrException, ValueError):
     """Raised when you attempted to do math between two ``Money``
     objects of different currencies.
     """
+
+
+class MoneyParseError(FinnrException, ValueError):
+    """Raised when a string couldn't be parsed into a ``Money`` object,
+    either because it was malformed, or because its currency couldn't be
+    determined.
+    """
@@ -0,0 +1,442 @@
+"""This module contains tools for converting ``Money`` between
+currencies, based on a table of exchange rates.
+"""
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections import defaultdict
+from collections.abc import Iterable
+from collections.abc import Mapping
+from decimal import ROUND_HALF_UP
+from decimal import Context
+from decimal import Decimal
+from typing import Annotated
+
+from docnote import ClcNote
+
+from finnr._types import DateLike
+from finnr.currency import Currency
+from finnr.currency import _quickcomp_datelike
+from finnr.money import Money
+
+type _CurrencyPair = tuple[Currency, Currency]
+
+
+class RateTable:
+    """A ``RateTable`` holds (current) exchange rates between
+    currencies, and uses them to convert ``Money`` objects from one
+    currency to another. A rate of ``Decimal('1.08')`` for
+    ``(EUR, USD)`` means that one EUR is worth 1.08 USD.
+
+    Rates are resolved, in order:
+    ++  directly, from the rate for ``(source, target)``
+    ++  by inverting the rate for ``(target, source)``
+    ++  by triangulating through the pivot currency (if one was given),
+        using the direct or inverted rates for ``(source, pivot)`` and
+        ``(pivot, target)``
+
+    Any rate that isn't set directly is calculated once and then
+    memoized, until the next time the rates are changed.
+
+    > Example
+    __embed__: 'code/python'
+        >>> rates = RateTable(
+        ...     {(eur, usd): Decimal('1.08'), (eur, chf): Decimal('0.94')},
+        ...     pivot=eur)
+        >>> rates.convert(mint(100, 'USD'), chf)
+        Money(amount=Decimal('87.04'), currency=Currency(...))
+    """
+    __slots__ = ('_context', '_memoized', '_pivot', '_rates')
+
+    def __init__(
+            self,
+            rates: Mapping[_CurrencyPair, Decimal] | None = None,
+            *,
+            pivot: Annotated[
+                Currency | None,
+                ClcNote('''The currency used to triangulate rates that
+                    aren't directly available.''')
+                ] = None,
+            precision: Annotated[
+                int,
+                ClcNote('''The number of significant digits used for any
+                    calculated (inverted or triangulated) rates, and for
+                    the converted amounts before quantization. This is
+                    independent of the current decimal context, so that
+                    memoized rates are always the same.''')
+                ] = 28):
+        self._rates: dict[_CurrencyPair, Decimal] = {}
+        self._memoized: dict[_CurrencyPair, Decimal] = {}
+        self._pivot = pivot
+        self._context = Context(prec=precision)
+        if rates is not None:
+            self.update(rates)
+
+    @property
+    def pivot(self) -> Currency | None:
+        return self._pivot
+
+    def set_rate(
+            self,
+            source: Currency,
+            target: Currency,
+            rate: Decimal
+            ) -> None:
+        """Sets the rate for converting ``source`` into ``target``.
+        Raises ``ValueError`` if the rate isn't a positive, finite
+        decimal.
+        """
+        self.update({(source, target): rate})
+
+    def update(self, rates: Mapping[_CurrencyPair, Decimal]) -> None:
+        """Sets multiple rates at once. This is equivalent to -- but
+        faster than -- calling ``set_rate`` for each one.
+        """
+        # Validate everything before changing anything, so that a bad rate
+        # leaves the table untouched.
+        validated: dict[_CurrencyPair, Decimal] = {}
+        for pair, rate in rates.items():
+            dec_rate = rate if isinstance(rate, Decimal) else Decimal(rate)
+            if not dec_rate.is_finite() or dec_rate <= 0:
+                raise ValueError(
+                    'Rates must be positive and finite!', pair, rate)
+
+            validated[pair] = dec_rate
+
+        self._rates.update(validated)
+        self._memoized.clear()
+
+    def get_rate(self, source: Currency, target: Currency) -> Decimal:
+        """Returns the rate for converting ``source`` into ``target``,
+        calculating (and memoizing) it if needed. Raises ``KeyError`` if
+        there's no way to determine the rate.
+        """
+        pair = (source, target)
+        rate = self._rates.get(pair)
+        if rate is None:
+            rate = self._memoized.get(pair)
+            if rate is None:
+                rate = self._memoized[pair] = self._calculate_rate(
+                    source, target)
+
+        return rate
+
+    def convert(
+            self,
+            money: Money,
+            target: Currency,
+            *,
+            quantize_to_minor: Annotated[
+                bool,
+                ClcNote('''If ``True`` (the default), the converted amount
+                    is rounded to the minor unit of the target currency.
+                    ''')
+                ] = True,
+            rounding: str = ROUND_HALF_UP
+            ) -> Money:
+        """Converts the money into the target currency."""
+        currency = money.currency
+        if currency == target:
+            amount = money.amount
+        else:
+            amount = self._context.multiply(
+                money.amount, self.get_rate(currency, target))
+
+        return target.mint(
+            amount, quantize_to_minor=quantize_to_minor, rounding=rounding)
+
+    def convert_many(
+            self,
+            monies: Iterable[Money],
+            target: Currency,
+            *,
+            quantize_to_minor: bool = True,
+            rounding: str = ROUND_HALF_UP
+            ) -> list[Money]:
+        """The bulk equivalent of ``convert``: converts every money into
+        the target currency, returning them as a list in the same order.
+        The results are identical to calling ``convert`` for each one.
+
+        Each distinct source currency's rate is only looked up once, and
+        all of the results are minted in a single ``mint_many`` batch.
+        """
+        monies = list(monies)
+        indices_by_currency: dict[Currency, list[int]] = defaultdict(list)
+        for index, money in enumerate(monies):
+            indices_by_currency[money.currency].append(index)
+
+        amounts: list[Decimal] = [None] * len(monies)  # type: ignore
+        multiply = self._context.multiply
+        for currency, indices in indices_by_currency.items():
+            if currency == target:
+                for index in indices:
+                    amounts[index] = monies[index].amount
+                continue
+
+            rate = self.get_rate(currency, target)
+            for index in indices:
+                amounts[index] = multiply(monies[index].amount, rate)
+
+        return target.mint_many(
+            amounts, quantize_to_minor=quantize_to_minor, rounding=rounding)
+
+    def _calculate_rate(self, source: Currency, target: Currency) -> Decimal:
+        if source == target:
+            return Decimal(1)
+
+        rate = self._get_direct_or_inverse(source, target)
+        if rate is not None:
+            return rate
+
+        pivot = self._pivot
+        if pivot is not None and pivot not in {source, target}:
+            to_pivot = self._get_direct_or_inverse(source, pivot)
+            from_pivot = self._get_direct_or_inverse(pivot, target)
+            if to_pivot is not None and from_pivot is not None:
+                return self._context.multiply(to_pivot, from_pivot)
+
+        exc = KeyError('No exchange rate available!', source, target)
+        if pivot is not None:
+            exc.add_note(f'Pivot currency: {pivot.code_alpha3}')
+        raise exc
+
+    def _get_direct_or_inverse(
+            self,
+            source: Currency,
+            target: Currency
+            ) -> Decimal | None:
+        rate = self._rates.get((source, target))
+        if rate is not None:
+            return rate
+
+        inverse = self._rates.get((target, source))
+        if inverse is not None:
+            return self._context.divide(1, inverse)
+
+        return None
+
+
+class RateHistory:
+    """A ``RateHistory`` holds dated exchange rates between currencies,
+    and uses them to convert ``Money`` objects as of a particular date.
+    The rate as of a date is the most recent rate set on or before that
+    date. Rates are resolved exactly as with ``RateTable`` (directly,
+    inverted, or triangulated through the pivot), except that each leg
+    uses its own as-of rate.
+
+    Internally, the rates for each currency pair are kept in a pair of
+    sorted arrays, keyed by an integer encoding of the date, so that
+    as-of lookups are a single bisection.
+
+    > Example
+    __embed__: 'code/python'
+        >>> history = RateHistory(pivot=eur)
+        >>> history.set_rate(eur, usd, date(2025, 1, 2), Decimal('1.03'))
+        >>> history.convert(mint(10, 'EUR'), usd, date(2025, 1, 5))
+        Money(amount=Decimal('10.30'), currency=Currency(...))
+    """
+    __slots__ = ('_context', '_pivot', '_series')
+
+    def __init__(
+            self,
+            *,
+            pivot: Annotated[
+                Currency | None,
+                ClcNote('''The currency used to triangulate rates that
+                    aren't directly available.''')
+                ] = None,
+            precision: Annotated[
+                int,
+                ClcNote('''Same as for ``RateTable``.''')
+                ] = 28):
+        self._series: dict[_CurrencyPair, tuple[list[int], list[Decimal]]]
+        self._series = {}
+        self._pivot = pivot
+        self._context = Context(prec=precision)
+
+    @property
+    def pivot(self) -> Currency | None:
+        return self._pivot
+
+    def set_rate(
+            self,
+            source: Currency,
+            target: Currency,
+            on_date: DateLike,
+            rate: Decimal
+            ) -> None:
+        """Sets the rate for converting ``source`` into ``target``,
+        effective from ``on_date`` until the next dated rate for the
+        same pair. Replaces any existing rate on the same date.
+        """
+        self.update([(source, target, on_date, rate)])
+
+    def update(
+            self,
+            rates: Iterable[tuple[Currency, Currency, DateLike, Decimal]]
+            ) -> None:
+        """Sets multiple dated rates at once, as ``(source, target,
+        on_date, rate)`` tuples. This is much faster than calling
+        ``set_rate`` for each one, since every affected pair is only
+        re-sorted once. If the same pair and date appears more than
+        once, the last rate wins.
+        """
+        incoming: dict[_CurrencyPair, dict[int, Decimal]] = defaultdict(dict)
+        for source, target, on_date, rate in rates:
+            dec_rate = rate if isinstance(rate, Decimal) else Decimal(rate)
+            if not dec_rate.is_finite() or dec_rate <= 0:
+                raise ValueError(
+                    'Rates must be positive and finite!',
+                    source, target, on_date, rate)
+
+            incoming[(source, target)][_quickcomp_datelike(on_date)] = (
+                dec_rate)
+
+        for pair, dated_rates in incoming.items():
+            existing = self._series.get(pair)
+            if existing is None:
+                merged = dated_rates
+            else:
+                merged = dict(zip(*existing, strict=True)) | dated_rates
+
+            keys = sorted(merged)
+            self._series[pair] = (keys, [merged[key] for key in keys])
+
+    def get_rate(
+            self,
+            source: Currency,
+            target: Currency,
+            on_date: DateLike
+            ) -> Decimal:
+        """Returns the rate for converting ``source`` into ``target`` as
+        of the passed date. Raises ``KeyError`` if there's no way to
+        determine the rate on that date.
+        """
+        return self._resolve(source, target, _quickcomp_datelike(on_date))
+
+    def as_of(self, on_date: DateLike) -> RateTable:
+        """Returns a ``RateTable`` snapshot of all rates as of the passed
+        date, for doing many conversions on the same date.
+        """
+        key = _quickcomp_datelike(on_date)
+        table = RateTable(pivot=self._pivot, precision=self._context.prec)
+        table.update({
+            pair: rates[index - 1]
+            for pair, (keys, rates) in self._series.items()
+            if (index := bisect_right(keys, key))})
+        return table
+
+    def convert(
+            self,
+            money: Money,
+            target: Currency,
+            on_date: DateLike,
+            *,
+            quantize_to_minor: bool = True,
+            rounding: str = ROUND_HALF_UP
+            ) -> Money:
+        """Converts the money into the target currency, as of the passed
+        date. Other arguments have the same meaning as in
+        ``RateTable.convert``.
+        """
+        currency = money.currency
+        if currency == target:
+            amount = money.amount
+        else:
+            amount = self._context.multiply(
+                money.amount,
+                self._resolve(currency, target, _quickcomp_datelike(on_date)))
+
+        return target.mint(
+            amount, quantize_to_minor=quantize_to_minor, rounding=rounding)
+
+    def convert_many(
+            self,
+            monies: Iterable[Money],
+            target: Currency,
+            on_dates: Annotated[
+                Iterable[DateLike],
+                ClcNote('''The date of each money (for example, the trade
+                    date). This must be the same length as ``monies``.''')],
+            *,
+            quantize_to_minor: bool = True,
+            rounding: str = ROUND_HALF_UP
+            ) -> list[Money]:
+        """The bulk as-of join: converts every money into the target
+        currency as of its corresponding date, returning them as a list
+        in the same order. The results are identical to calling
+        ``convert`` for each one.
+
+        This makes a single pass over the monies. Each distinct
+        combination of source currency and date is only resolved once,
+        and all of the results are minted in a single ``mint_many``
+        batch.
+        """
+        multiply = self._context.multiply
+        resolve = self._resolve
+        rate_cache: dict[tuple[Currency, int], Decimal] = {}
+        amounts: list[Decimal] = []
+        for money, on_date in zip(monies, on_dates, strict=True):
+            currency = money.currency
+            if currency == target:
+                amounts.append(money.amount)
+                continue
+
+            cache_key = (currency, _quickcomp_datelike(on_date))
+            rate = rate_cache.get(cache_key)
+            if rate is None:
+                rate = rate_cache[cache_key] = resolve(
+                    currency, target, cache_key[1])
+
+            amounts.append(multiply(money.amount, rate))
+
+        return target.mint_many(
+            amounts, quantize_to_minor=quantize_to_minor, rounding=rounding)
+
+    def _resolve(
+            self,
+            source: Currency,
+            target: Currency,
+            key: int
+            ) -> Decimal:
+        if source == target:
+            return Decimal(1)
+
+        rate = self._get_direct_or_inverse(source, target, key)
+        if rate is not None:
+            return rate
+
+        pivot = self._pivot
+        if pivot is not None and pivot not in {source, target}:
+            to_pivot = self._get_direct_or_inverse(source, pivot, key)
+            from_pivot = self._get_direct_or_inverse(pivot, target, key)
+            if to_pivot is not None and from_pivot is not None:
+                return self._context.multiply(to_pivot, from_pivot)
+
+        exc = KeyError('No exchange rate available!', source, target)
+        exc.add_note('No rate on or before the requested date')
+        if pivot is not None:
+            exc.add_note(f'Pivot currency: {pivot.code_alpha3}')
+        raise exc
+
+    def _get_direct_or_inverse(
+            self,
+            source: Currency,
+            target: Currency,
+            key: int
+            ) -> Decimal | None:
+        series = self._series.get((source, target))
+        if series is not None:
+            keys, rates = series
+            index = bisect_right(keys, key)
+            if index:
+                return rates[index - 1]
+
+        series = self._series.get((target, source))
+        if series is not None:
+            keys, rates = series
+            index = bisect_right(keys, key)
+            if index:
+                return self._context.divide(1, rates[index - 1])
+
+        return None
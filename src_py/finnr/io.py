@@ -0,0 +1,232 @@
+"""This module contains helpers for streaming money data in from
+external sources -- for example, amount and currency columns within a
+CSV file -- without needing to load the whole source into memory.
+"""
+from __future__ import annotations
+
+import csv
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import Sequence
+from contextlib import nullcontext
+from dataclasses import dataclass
+from decimal import ROUND_HALF_UP
+from itertools import islice
+from os import PathLike
+from typing import Annotated
+from typing import TextIO
+
+from docnote import ClcNote
+
+from finnr.currency import CurrencySet
+from finnr.money import Money
+
+# These are the exceptions we expect from a single bad row: missing columns
+# (IndexError), unknown currency codes (KeyError), unparseable amounts
+# (decimal.InvalidOperation, which is an ArithmeticError), etc.
+_ROW_EXCEPTIONS = (ArithmeticError, LookupError, TypeError, ValueError)
+
+
+@dataclass(slots=True, frozen=True)
+class RowError:
+    """Passed to the ``on_error`` callback for every row that couldn't
+    be converted into a ``Money`` object.
+    """
+    row_number: Annotated[
+        int,
+        ClcNote('''The 1-based position of the row within the source,
+            including any header row.''')]
+    row: Sequence[str]
+    exception: Exception
+
+
+def read_money_rows(  # noqa: PLR0913
+        rows: Iterable[Sequence[str]],
+        *,
+        mint: Annotated[
+            CurrencySet,
+            ClcNote('''The currency set used to resolve the currency codes
+                within the currency column, for example, ``finnr.iso.mint``.
+                ''')],
+        amount_column: Annotated[
+            int | str,
+            ClcNote('''The column containing the amounts, either as a
+                0-based index, or as a column name from the header row.
+                ''')],
+        currency_column: Annotated[
+            int | str,
+            ClcNote('''The column containing the (alpha3) currency codes,
+                either as a 0-based index, or as a column name from the
+                header row.''')],
+        has_header: Annotated[
+            bool | None,
+            ClcNote('''Whether or not the first row is a header row. If
+                omitted, the first row is assumed to be a header if, and
+                only if, either of the columns was given by name.''')
+            ] = None,
+        chunk_size: Annotated[
+            int,
+            ClcNote('''The number of rows to convert at once. Memory usage
+                is proportional to this, and not to the length of the
+                source.''')
+            ] = 10_000,
+        on_error: Annotated[
+            Callable[[RowError], None] | None,
+            ClcNote('''If provided, this will be called with a ``RowError``
+                for every row that fails to convert, and the row will be
+                skipped. Otherwise, the first bad row will raise.''')
+            ] = None,
+        quantize_to_minor: bool = False,
+        rounding: str = ROUND_HALF_UP
+        ) -> Iterator[list[Money]]:
+    """Lazily converts an iterable of rows -- for example, a
+    ``csv.reader`` -- into ``Money`` objects, yielding them in chunks
+    of (at most) ``chunk_size``. The ``quantize_to_minor`` and
+    ``rounding`` arguments have the same meaning as in
+    ``Currency.mint``.
+
+    Each chunk is minted as a single ``CurrencySet.mint_many`` batch, so
+    currency codes are only resolved once per distinct code per chunk.
+
+    If you'd rather have the individual ``Money`` objects, use
+    ``itertools.chain.from_iterable`` on the result.
+    """
+    if chunk_size < 1:
+        raise ValueError('Chunk size must be positive!', chunk_size)
+
+    row_iterator = iter(rows)
+    row_number = 0
+    if has_header is None:
+        has_header = (
+            isinstance(amount_column, str)
+            or isinstance(currency_column, str))
+
+    if has_header:
+        header = next(row_iterator, None)
+        if header is None:
+            return
+
+        row_number += 1
+        amount_index = _resolve_column(header, amount_column)
+        currency_index = _resolve_column(header, currency_column)
+
+    elif isinstance(amount_column, str) or isinstance(currency_column, str):
+        raise ValueError('Columns can only be named when there is a header!')
+
+    else:
+        amount_index = amount_column
+        currency_index = currency_column
+
+    while chunk := list(islice(row_iterator, chunk_size)):
+        first_row_number = row_number + 1
+        row_number += len(chunk)
+
+        try:
+            monies = mint.mint_many(
+                [row[amount_index] for row in chunk],
+                [row[currency_index] for row in chunk],
+                quantize_to_minor=quantize_to_minor,
+                rounding=rounding)
+
+        # Something in the chunk was bad, so we need to go back through it
+        # row by row to figure out exactly which rows were the problem.
+        except _ROW_EXCEPTIONS:
+            monies = _read_chunk_by_row(
+                chunk,
+                first_row_number,
+                mint=mint,
+                amount_index=amount_index,
+                currency_index=currency_index,
+                on_error=on_error,
+                quantize_to_minor=quantize_to_minor,
+                rounding=rounding)
+
+        if monies:
+            yield monies
+
+
+def read_money_csv(  # noqa: PLR0913
+        source: Annotated[
+            str | PathLike[str] | TextIO,
+            ClcNote('''Either a path to a CSV file, or an already-open text
+                file. If passing an open file, it should be opened with
+                ``newline=''``, as per the ``csv`` module docs.''')],
+        *,
+        mint: CurrencySet,
+        amount_column: int | str,
+        currency_column: int | str,
+        has_header: bool | None = None,
+        chunk_size: int = 10_000,
+        on_error: Callable[[RowError], None] | None = None,
+        quantize_to_minor: bool = False,
+        rounding: str = ROUND_HALF_UP,
+        encoding: str = 'utf-8',
+        **fmtparams
+        ) -> Iterator[list[Money]]:
+    """Streams the rows of a CSV file into ``Money`` objects, yielding
+    them in chunks. This is a thin wrapper around ``read_money_rows``
+    and ``csv.reader``; all other arguments have the same meaning as
+    there. Extra keyword arguments are passed through to ``csv.reader``
+    (for example, ``delimiter=';'``).
+    """
+    if isinstance(source, (str, PathLike)):
+        file_context = open(source, encoding=encoding, newline='')
+    else:
+        file_context = nullcontext(source)
+
+    with file_context as csv_file:
+        yield from read_money_rows(
+            csv.reader(csv_file, **fmtparams),
+            mint=mint,
+            amount_column=amount_column,
+            currency_column=currency_column,
+            has_header=has_header,
+            chunk_size=chunk_size,
+            on_error=on_error,
+            quantize_to_minor=quantize_to_minor,
+            rounding=rounding)
+
+
+def _read_chunk_by_row(  # noqa: PLR0913
+        chunk: list[Sequence[str]],
+        first_row_number: int,
+        *,
+        mint: CurrencySet,
+        amount_index: int,
+        currency_index: int,
+        on_error: Callable[[RowError], None] | None,
+        quantize_to_minor: bool,
+        rounding: str
+        ) -> list[Money]:
+    """Converts a chunk one row at a time, reporting (or raising) any
+    errors along the way.
+    """
+    monies: list[Money] = []
+    for row_number, row in enumerate(chunk, start=first_row_number):
+        try:
+            monies.append(mint(
+                row[amount_index],
+                row[currency_index],
+                quantize_to_minor=quantize_to_minor,
+                rounding=rounding))
+
+        except _ROW_EXCEPTIONS as exc:
+            if on_error is None:
+                exc.add_note(f'Failed to read money from row {row_number}')
+                raise exc
+
+            on_error(RowError(row_number=row_number, row=row, exception=exc))
+
+    return monies
+
+
+def _resolve_column(header: Sequence[str], column: int | str) -> int:
+    if isinstance(column, int):
+        return column
+
+    try:
+        return list(header).index(column)
+    except ValueError as exc:
+        exc.add_note(f'Column {column!r} not found in header row')
+        raise exc
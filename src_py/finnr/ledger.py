@@ -0,0 +1,435 @@
+"""This module contains an append-only, memory-mapped ledger file
+format, for storing very large numbers of money records on disk and
+scanning them without loading them into memory.
+
+A ledger file consists of a fixed-size header followed by fixed-width,
+16-byte rows. Each row is a pair of little-endian signed 64-bit ints:
+the ordinal of the currency (an index into the currency table in the
+header), and the amount, as an integer count of ``10 ** exponent``. The
+exponent is the same for the entire file, and is stored in the header.
+
+Rows are deliberately 8-byte aligned, so that readers can view the
+memory-mapped file directly as an array of ints. This means that
+summing and filtering happen without any copying, and without creating
+any intermediate ``Money`` objects; since the file is memory-mapped,
+any number of reader processes can share it via the OS page cache.
+"""
+from __future__ import annotations
+
+import mmap
+import struct
+import sys
+from array import array
+from collections.abc import Iterable
+from collections.abc import Iterator
+from dataclasses import dataclass
+from decimal import ROUND_CEILING
+from decimal import ROUND_FLOOR
+from decimal import Decimal
+from itertools import compress
+from os import PathLike
+from typing import Annotated
+
+from docnote import ClcNote
+
+from finnr._fixedpoint import EXACT_CONTEXT
+from finnr._fixedpoint import scaled_to_decimal
+from finnr.aggregate import MoneyBag
+from finnr.currency import Currency
+from finnr.currency import CurrencySet
+from finnr.money import Money
+
+_MAGIC = b'FINNRLDG'
+_VERSION = 1
+# Magic, version, exponent, currency count
+_HEADER_PREFIX = struct.Struct('<8shhI')
+_CURRENCY_SLOT_SIZE = 8
+_ROW = struct.Struct('<qq')
+
+MAX_CURRENCIES: Annotated[
+    int,
+    ClcNote('''The maximum number of distinct currencies that a single
+        ledger file can contain.''')
+] = 512
+_HEADER_SIZE = _HEADER_PREFIX.size + MAX_CURRENCIES * _CURRENCY_SLOT_SIZE
+# If the file contains more currencies than this, summing them with one
+# filtering pass per currency is slower than a single pass in Python.
+_MAX_FILTER_PASSES = 16
+
+
+class LedgerWriter:
+    """Appends money records to a ledger file, creating it if needed.
+    Currencies are added to the file's currency table the first time
+    they're written.
+
+    Note that there must only ever be a single writer per file at a
+    time. However, it's safe for readers to open the file while it's
+    being written to; they'll see all of the rows that were completely
+    written at the time they were opened.
+
+    > Example
+    __embed__: 'code/python'
+        with LedgerWriter('ledger.fnl') as writer:
+            writer.append_many(monies)
+    """
+    __slots__ = ('_exponent', '_file', '_ordinals')
+
+    def __init__(
+            self,
+            path: str | PathLike[str],
+            *,
+            exponent: Annotated[
+                int | None,
+                ClcNote('''The (file-wide) exponent used to store the
+                    amounts, for example ``-2`` to store every amount as an
+                    integer count of hundredths. This must be small enough
+                    to exactly represent every amount written to the file.
+
+                    If the file already exists, this must either match the
+                    existing exponent, or be omitted. If it doesn't exist
+                    and this is omitted, defaults to ``-4``, which is enough
+                    for the minor units of every ISO currency.''')
+                ] = None):
+        try:
+            self._file = open(path, 'r+b')
+        except FileNotFoundError:
+            self._file = open(path, 'x+b')
+            self._exponent = -4 if exponent is None else exponent
+            self._ordinals: dict[str, int] = {}
+            self._file.write(_HEADER_PREFIX.pack(
+                _MAGIC, _VERSION, self._exponent, 0))
+            self._file.write(
+                bytes(_HEADER_SIZE - _HEADER_PREFIX.size))
+            return
+
+        try:
+            header = _Header.read(self._file.read(_HEADER_SIZE))
+            if exponent is not None and exponent != header.exponent:
+                raise ValueError(
+                    'Exponent does not match existing ledger!',
+                    exponent, header.exponent)
+
+            # Truncate any partially-written trailing row, so that appended
+            # rows stay aligned.
+            row_count = _count_rows(self._file.seek(0, 2))
+            self._file.truncate(_HEADER_SIZE + row_count * _ROW.size)
+
+        except Exception:
+            self._file.close()
+            raise
+
+        self._exponent = header.exponent
+        self._ordinals = {
+            code_alpha3: ordinal
+            for ordinal, code_alpha3 in enumerate(header.codes_alpha3)}
+
+    @property
+    def exponent(self) -> int:
+        return self._exponent
+
+    def append(self, money: Money) -> None:
+        """Appends a single money to the ledger."""
+        self.append_many((money,))
+
+    def append_many(self, monies: Iterable[Money]) -> None:
+        """Appends all of the passed monies to the ledger, in order.
+        Raises ``ValueError`` if an amount can't be exactly represented
+        at the ledger's exponent, and ``OverflowError`` if it's too
+        large to fit into a row.
+        """
+        # Note that we don't update the ordinals until all of the rows have
+        # been encoded; otherwise, an error partway through would leave us
+        # with currencies that were never written to the header.
+        ordinals = self._ordinals.copy()
+        new_codes: list[str] = []
+        rows: list[bytes] = []
+        pack = _ROW.pack
+        negative_exponent = -self._exponent
+        for money in monies:
+            code_alpha3 = money.currency.code_alpha3
+            ordinal = ordinals.get(code_alpha3)
+            if ordinal is None:
+                ordinal = len(ordinals)
+                if ordinal >= MAX_CURRENCIES:
+                    raise ValueError('Too many currencies for ledger!')
+
+                ordinals[code_alpha3] = ordinal
+                new_codes.append(code_alpha3)
+
+            scaled = money.amount.scaleb(
+                negative_exponent, context=EXACT_CONTEXT)
+            if scaled != scaled.to_integral_value():
+                raise ValueError(
+                    'Amount cannot be exactly represented at the ledger '
+                    + 'exponent!', money, self._exponent)
+
+            try:
+                rows.append(pack(ordinal, int(scaled)))
+            except struct.error as exc:
+                raise OverflowError(
+                    'Amount too large for ledger!', money) from exc
+
+        self._ordinals = ordinals
+        ledger_file = self._file
+        # The currency table must always be written before any rows that
+        # reference it, so that concurrent readers never see a row with an
+        # unknown currency.
+        if new_codes:
+            first_new = len(ordinals) - len(new_codes)
+            ledger_file.seek(
+                _HEADER_PREFIX.size + first_new * _CURRENCY_SLOT_SIZE)
+            ledger_file.write(b''.join(
+                code_alpha3.encode('ascii').ljust(_CURRENCY_SLOT_SIZE, b'\0')
+                for code_alpha3 in new_codes))
+            ledger_file.seek(0)
+            ledger_file.write(_HEADER_PREFIX.pack(
+                _MAGIC, _VERSION, self._exponent, len(ordinals)))
+            ledger_file.flush()
+
+        ledger_file.seek(0, 2)
+        ledger_file.write(b''.join(rows))
+
+    def flush(self) -> None:
+        """Flushes all appended rows to the OS, making them visible to
+        any newly-opened readers.
+        """
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> LedgerWriter:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+class LedgerReader:
+    """Reads a ledger file via ``mmap``. Totals and filters are
+    calculated directly on the mapped rows, without creating ``Money``
+    objects; those are only created on demand, when indexing or
+    iterating over the reader.
+
+    The reader sees all of the rows that existed when it was opened;
+    to see rows appended afterwards, open a new reader.
+
+    > Example
+    __embed__: 'code/python'
+        with LedgerReader('ledger.fnl', mint=mint) as reader:
+            eur_total = reader.total(mint.get('EUR'))
+            big_rows = reader.select(min_amount=Decimal(10_000))
+    """
+    __slots__ = (
+        '_currencies', '_exponent', '_file', '_mmap', '_ordinals', '_rows')
+
+    def __init__(
+            self,
+            path: str | PathLike[str],
+            *,
+            mint: Annotated[
+                CurrencySet,
+                ClcNote('''The currency set used to resolve the currency
+                    codes stored in the ledger, for example,
+                    ``finnr.iso.mint``.''')]):
+        self._file = open(path, 'rb')
+        try:
+            self._mmap = mmap.mmap(
+                self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            header = _Header.read(self._mmap[:_HEADER_SIZE])
+            currencies: list[Currency] = []
+            for code_alpha3 in header.codes_alpha3:
+                currency = mint.get(code_alpha3)
+                if currency is None:
+                    raise KeyError(
+                        'Ledger currency not in CurrencySet!', code_alpha3)
+                currencies.append(currency)
+
+        except Exception:
+            self._file.close()
+            raise
+
+        self._exponent = header.exponent
+        self._currencies = tuple(currencies)
+        self._ordinals = {
+            currency: ordinal for ordinal, currency in enumerate(currencies)}
+        row_count = _count_rows(len(self._mmap))
+        self._rows = _map_rows(self._mmap, row_count)
+
+    @property
+    def exponent(self) -> int:
+        return self._exponent
+
+    @property
+    def currencies(self) -> tuple[Currency, ...]:
+        """All of the currencies in the ledger, in order of their first
+        appearance.
+        """
+        return self._currencies
+
+    def total(self, currency: Currency) -> Money:
+        """Returns the sum of all of the rows in the passed currency."""
+        ordinal = self._ordinals.get(currency)
+        if ordinal is None:
+            scaled_total = 0
+        elif len(self._currencies) == 1:
+            scaled_total = sum(self._rows[1::2])
+        else:
+            scaled_total = sum(compress(
+                self._rows[1::2], map(ordinal.__eq__, self._rows[0::2])))
+
+        return Money(
+            amount=scaled_to_decimal(scaled_total, self._exponent),
+            currency=currency)
+
+    def totals(self) -> MoneyBag:
+        """Returns the sums of all rows, one per currency."""
+        bag = MoneyBag()
+        if len(self._currencies) <= _MAX_FILTER_PASSES:
+            bag.add_many(self.total(currency) for currency in self._currencies)
+            return bag
+
+        scaled_totals = [0] * len(self._currencies)
+        for ordinal, scaled in zip(
+            self._rows[0::2], self._rows[1::2], strict=True
+        ):
+            scaled_totals[ordinal] += scaled
+
+        exponent = self._exponent
+        bag.add_many(
+            Money(
+                amount=scaled_to_decimal(scaled_total, exponent),
+                currency=currency)
+            for currency, scaled_total
+            in zip(self._currencies, scaled_totals, strict=True))
+        return bag
+
+    def select(
+            self,
+            currency: Currency | None = None,
+            *,
+            min_amount: Annotated[
+                Decimal | None,
+                ClcNote('If given, only rows with at least this amount.')
+                ] = None,
+            max_amount: Annotated[
+                Decimal | None,
+                ClcNote('If given, only rows with at most this amount.')
+                ] = None
+            ) -> list[int]:
+        """Returns the indices of all of the rows matching the passed
+        filters. Use them to index into the reader to get the actual
+        ``Money`` objects.
+        """
+        masks: list[Iterable[bool]] = []
+        if currency is not None:
+            ordinal = self._ordinals.get(currency)
+            if ordinal is None:
+                return []
+            masks.append(map(ordinal.__eq__, self._rows[0::2]))
+
+        negative_exponent = -self._exponent
+        if min_amount is not None:
+            scaled_min = int(min_amount.scaleb(
+                negative_exponent, context=EXACT_CONTEXT
+            ).to_integral_value(ROUND_CEILING))
+            masks.append(map(scaled_min.__le__, self._rows[1::2]))
+        if max_amount is not None:
+            scaled_max = int(max_amount.scaleb(
+                negative_exponent, context=EXACT_CONTEXT
+            ).to_integral_value(ROUND_FLOOR))
+            masks.append(map(scaled_max.__ge__, self._rows[1::2]))
+
+        indices = range(len(self))
+        if not masks:
+            return list(indices)
+        elif len(masks) == 1:
+            return list(compress(indices, masks[0]))
+        else:
+            return list(compress(indices, map(all, zip(*masks, strict=True))))
+
+    def __len__(self) -> int:
+        return len(self._rows) // 2
+
+    def __getitem__(self, index: int) -> Money:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError('Ledger row index out of range!', index)
+
+        return Money(
+            amount=scaled_to_decimal(
+                self._rows[2 * index + 1], self._exponent),
+            currency=self._currencies[self._rows[2 * index]])
+
+    def __iter__(self) -> Iterator[Money]:
+        currencies = self._currencies
+        exponent = self._exponent
+        for ordinal, scaled in zip(
+            self._rows[0::2], self._rows[1::2], strict=True
+        ):
+            yield Money(
+                amount=scaled_to_decimal(scaled, exponent),
+                currency=currencies[ordinal])
+
+    def close(self) -> None:
+        self._rows.release()
+        self._mmap.close()
+        self._file.close()
+
+    def __enter__(self) -> LedgerReader:
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+@dataclass(slots=True, frozen=True)
+class _Header:
+    """The parsed contents of a ledger file header."""
+    exponent: int
+    codes_alpha3: list[str]
+
+    @classmethod
+    def read(cls, data: bytes) -> _Header:
+        if len(data) < _HEADER_SIZE:
+            raise ValueError('Truncated ledger header!')
+
+        magic, version, exponent, currency_count = (
+            _HEADER_PREFIX.unpack_from(data))
+        if magic != _MAGIC:
+            raise ValueError('Not a finnr ledger file!')
+        if version != _VERSION:
+            raise ValueError('Unsupported ledger version!', version)
+
+        codes_alpha3: list[str] = []
+        for ordinal in range(currency_count):
+            offset = _HEADER_PREFIX.size + ordinal * _CURRENCY_SLOT_SIZE
+            codes_alpha3.append(
+                data[offset:offset + _CURRENCY_SLOT_SIZE]
+                .rstrip(b'\0').decode('ascii'))
+
+        return cls(exponent, codes_alpha3)
+
+
+def _count_rows(file_size: int) -> int:
+    """Returns the number of complete rows in a ledger file of the
+    passed size, ignoring any partially-written trailing row.
+    """
+    return max(file_size - _HEADER_SIZE, 0) // _ROW.size
+
+
+def _map_rows(mapped: mmap.mmap, row_count: int) -> memoryview:
+    """Returns a flat, int64 view of all of the rows in the mapped
+    ledger file, alternating between ordinal and scaled amount.
+    """
+    rows_end = _HEADER_SIZE + row_count * _ROW.size
+    if sys.byteorder == 'little':
+        with memoryview(mapped) as raw:
+            return raw[_HEADER_SIZE:rows_end].cast('q')
+
+    # The file format is always little-endian, so on big-endian platforms
+    # we have no choice but to copy.
+    swapped = array('q', mapped[_HEADER_SIZE:rows_end])
+    swapped.byteswap()
+    return memoryview(swapped)
@@ -3,19 +3,35 @@ from __future__ import annotations
 import operator
 import typing
 from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Sequence
 from dataclasses import dataclass
+from dataclasses import field
+from decimal import ROUND_DOWN
 from decimal import ROUND_HALF_UP
+from decimal import Context
 from decimal import Decimal
+from heapq import nlargest
 from typing import Annotated
+from typing import cast
+from typing import overload
 
 from docnote import ClcNote
 
 import finnr._moneymath
+from finnr._fixedpoint import decimal_to_scaled
+from finnr._fixedpoint import get_exponent
+from finnr._fixedpoint import scaled_to_decimal
 from finnr._moneymath import MoneyMathImpl
+from finnr._registry import restore_currency
+from finnr.exceptions import MismatchedCurrency
+from finnr.exceptions import MoneyRequired
+from finnr.exceptions import ScalarRequired
 
 if typing.TYPE_CHECKING:
     from finnr.currency import Currency
 
+_ONE = Decimal(1)
 
 amount_getter: Annotated[
     Callable[[Money], Decimal],
@@ -46,20 +62,547 @@ class Money(MoneyMathImpl):
     amount: Decimal
     currency: Currency
 
-    def round_to_major(self, rounding=ROUND_HALF_UP) -> Money: ...
-    def round_to_minor(self, rounding=ROUND_HALF_UP) -> Money: ...
+    def round_to_major(
+            self,
+            rounding: Annotated[
+                str,
+                ClcNote('''The rounding mode to use, as one of the
+                    ``decimal`` module rounding constants.''')
+                ] = ROUND_HALF_UP
+            ) -> Money:
+        """Returns a new ``Money`` object with the amount rounded to a
+        whole number of major units of the currency, for example,
+        ``12.50 EUR`` to ``13 EUR``.
+        """
+        currency = self.currency
+        return Money(
+            amount=self.amount.quantize(
+                _ONE, rounding, currency.context(rounding)),
+            currency=currency)
+
+    def round_to_minor(
+            self,
+            rounding: Annotated[
+                str,
+                ClcNote('''The rounding mode to use, as one of the
+                    ``decimal`` module rounding constants.''')
+                ] = ROUND_HALF_UP
+            ) -> Money:
+        """Returns a new ``Money`` object with the amount rounded to a
+        whole number of minor units of the currency, for example,
+        ``12.345 EUR`` to ``12.35 EUR``. This is exactly equivalent to
+        minting the amount with ``quantize_to_minor=True``.
+
+        Currencies without a (known) minor unit are returned unchanged.
+        """
+        currency = self.currency
+        return Money(
+            amount=currency._get_minor_rounder(rounding).round_one(self.amount),
+            currency=currency)
 
     @property
-    def is_nominal_division(self) -> bool: ...
-        # Returns whether or not the amount can be expressed as an
-        # integer multiple of the minor unit
+    def is_nominal_division(self) -> bool:
+        """Returns whether or not the amount can be expressed as an
+        integer multiple of the minor unit. This is always true for
+        currencies without a (known) minor unit.
+        """
+        amount = self.amount
+        round_down = self.currency._get_minor_rounder(ROUND_DOWN).round_one
+        return round_down(amount) == amount
 
     @property
-    def is_nominal_major(self) -> bool: ...
-        # Returns whether or not the amount can be expressed as an
-        # integer multiple of the major unit
+    def is_nominal_major(self) -> bool:
+        """Returns whether or not the amount can be expressed as an
+        integer multiple of the major unit.
+        """
+        amount = self.amount
+        context = self.currency.context(ROUND_DOWN)
+        return amount.quantize(_ONE, ROUND_DOWN, context) == amount
+
+    def allocate(
+            self,
+            ratios: Annotated[
+                Sequence[int | Decimal],
+                ClcNote('''The relative size of each part. These must be
+                    non-negative, and at least one must be positive. For
+                    example, ``[1, 1, 2]`` allocates a quarter of the amount
+                    to each of the first two parts, and half to the last.
+                    ''')]
+            ) -> list[Money]:
+        """Allocates the amount into parts proportional to the passed
+        ratios, returning one ``Money`` per ratio. Every part is a whole
+        number of minor units of the currency, and the parts always sum
+        to exactly the original amount. Any minor units left over after
+        rounding down are distributed using the largest remainder
+        method, with ties going to the earlier parts.
+
+        This works for non-decimal currencies as well: for example,
+        allocating ``1 MGA`` (whose minor unit is ``0.2``) in half
+        results in ``0.6 MGA`` and ``0.4 MGA``.
+
+        Raises ``ValueError`` if the amount isn't a whole number of minor
+        units (round it first), or if the currency's minor unit isn't
+        known.
+        """
+        weights, total = _ratios_to_weights(ratios)
+        return _allocate_money(self, weights, total)
+
+    def split(self, parts: int) -> list[Money]:
+        """Splits the amount into ``parts`` equal parts, with any
+        leftover minor units going to the first parts. This is
+        equivalent to ``allocate([1] * parts)``.
+        """
+        if parts < 1:
+            raise ValueError('Must split into at least one part!', parts)
+
+        return _allocate_money(self, [1] * parts, parts)
+
+    def __reduce__(self):
+        # If the currency is registered, we pickle just the amount and the
+        # currency reference, instead of the amount plus a whole nested
+        # currency reduction.
+        registry_id = self.currency._registry_id
+        if registry_id is not None:
+            return (_restore_money, (
+                self.amount, registry_id, self.currency.code_alpha3))
+
+        return (Money, (self.amount, self.currency))
+
+    def freeze(self) -> FrozenMoney:
+        """Returns an immutable, hashable ``FrozenMoney`` copy of the
+        ``Money`` object, for use as a dict key or set member.
+        """
+        return FrozenMoney(amount=self.amount, currency=self.currency)
+
+
+@dataclass(slots=True, frozen=True)
+class FrozenMoney:
+    """``FrozenMoney`` objects are an immutable, hashable counterpart
+    to ``Money``, created by calling ``Money.freeze``. Their hash is
+    calculated once, on creation, so they can be used efficiently as
+    dict keys or set members -- for example, to deduplicate or group
+    large numbers of values by amount and currency.
+
+    As with ``Decimal``, equality (and therefore hashing) is based on
+    the numeric value of the amount, so ``1.0 EUR`` and ``1.00 EUR``
+    are the same key. ``FrozenMoney`` objects only ever compare equal
+    to other ``FrozenMoney`` objects.
+
+    ``FrozenMoney`` also supports the basic arithmetic operators, which
+    always return new ``FrozenMoney`` objects. Unlike with ``Money``,
+    augmented assignment (``+=``, ``-=``, etc) therefore rebinds the
+    name instead of mutating the object in place, which makes
+    ``FrozenMoney`` safe to share between threads (including on
+    free-threaded builds of Python). For anything else, convert back to
+    ``Money`` via ``to_money``.
+    """
+    amount: Decimal
+    currency: Currency
+
+    _hash: int = field(init=False, compare=False, repr=False)
+
+    def to_money(self) -> Money:
+        """Converts the ``FrozenMoney`` back into a normal, mutable
+        ``Money`` object.
+        """
+        return Money(amount=self.amount, currency=self.currency)
+
+    def __add__(self, other: FrozenMoney | Money) -> FrozenMoney:
+        try:
+            if self.currency != other.currency:
+                raise MismatchedCurrency(self.currency, other.currency)
+
+            return FrozenMoney(
+                amount=self.amount.__add__(other.amount),
+                currency=self.currency)
+
+        except AttributeError as exc:
+            raise MoneyRequired(other) from exc
+
+    def __sub__(self, other: FrozenMoney | Money) -> FrozenMoney:
+        try:
+            if self.currency != other.currency:
+                raise MismatchedCurrency(self.currency, other.currency)
+
+            return FrozenMoney(
+                amount=self.amount.__sub__(other.amount),
+                currency=self.currency)
+
+        except AttributeError as exc:
+            raise MoneyRequired(other) from exc
+
+    def __mul__(self, other: Decimal | int) -> FrozenMoney:
+        amount = self.amount.__mul__(other)
+        if amount is NotImplemented:
+            raise ScalarRequired(other)
+
+        return FrozenMoney(amount=amount, currency=self.currency)
+
+    def __rmul__(self, other: Decimal | int) -> FrozenMoney:
+        return self.__mul__(other)
+
+    @overload
+    def __truediv__(self, other: FrozenMoney | Money) -> Decimal: ...
+    @overload
+    def __truediv__(self, other: Decimal | int) -> FrozenMoney: ...
+    def __truediv__(
+            self,
+            other: FrozenMoney | Money | Decimal | int
+            ) -> FrozenMoney | Decimal:
+        if isinstance(other, (FrozenMoney, Money)):
+            if self.currency != other.currency:
+                raise MismatchedCurrency(self.currency, other.currency)
+
+            return self.amount.__truediv__(other.amount)
+
+        amount = self.amount.__truediv__(other)
+        if amount is NotImplemented:
+            raise ScalarRequired(other)
+
+        return FrozenMoney(amount=amount, currency=self.currency)
+
+    def __neg__(self) -> FrozenMoney:
+        return FrozenMoney(amount=-self.amount, currency=self.currency)
+
+    def __pos__(self) -> FrozenMoney:
+        return FrozenMoney(amount=+self.amount, currency=self.currency)
+
+    def __abs__(self) -> FrozenMoney:
+        return FrozenMoney(amount=abs(self.amount), currency=self.currency)
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if other.__class__ is not FrozenMoney:
+            return NotImplemented
+
+        other = cast(FrozenMoney, other)
+        return (
+            self._hash == other._hash
+            and self.amount == other.amount
+            and self.currency == other.currency)
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __reduce__(self):
+        # The cached hash must not be pickled, because currency hashes
+        # aren't stable across processes.
+        return (FrozenMoney, (self.amount, self.currency))
+
+    def __post_init__(self):
+        object.__setattr__(
+            self, '_hash', hash((self.amount, self.currency)))
+
+
+@dataclass(slots=True)
+class MinorUnitMoney:
+    """``MinorUnitMoney`` objects are a fixed-point alternative to
+    ``Money``: instead of storing the amount as a ``Decimal``, they store
+    it as an exact integer count of minor units of the currency (for
+    example, ``12.34 EUR`` is stored as 1234). This makes addition,
+    subtraction, and comparisons between them plain integer math, which
+    is several times faster than the ``Decimal`` equivalent.
+
+    They are created by passing ``fixed_point=True`` when minting, or
+    via ``Currency.mint_minor_units``. Any operation whose result can no
+    longer be expressed in whole minor units (for example, multiplying
+    by ``Decimal('0.5')``) transparently falls back to returning a
+    normal ``Money`` object.
+
+    Note that ``MinorUnitMoney`` only supports basic arithmetic and
+    comparisons. For everything else -- for example, rounding
+    (``round_to_major``), allocation (``allocate``), or the ``Decimal``
+    methods -- first convert it via ``to_money``.
+    """
+    minor_units: int
+    currency: Currency
+
+    __hash__ = None  # type: ignore[assignment]
+
+    @property
+    def amount(self) -> Decimal:
+        """The amount, as a ``Decimal``. This is always exact."""
+        currency_metadata = self.currency._metadata
+        return scaled_to_decimal(
+            self.minor_units * currency_metadata.minor_multiplier,
+            cast(int, currency_metadata.minor_exponent))
+
+    def to_money(self) -> Money:
+        """Converts the ``MinorUnitMoney`` into an equivalent,
+        ``Decimal``-backed ``Money`` object.
+        """
+        return Money(amount=self.amount, currency=self.currency)
+
+    def __add__(
+            self,
+            other: MinorUnitMoney | Money
+            ) -> MinorUnitMoney | Money:
+        if isinstance(other, MinorUnitMoney):
+            if self.currency != other.currency:
+                raise MismatchedCurrency(self.currency, other.currency)
+
+            return MinorUnitMoney(
+                minor_units=self.minor_units + other.minor_units,
+                currency=self.currency)
+
+        return self.to_money() + other
+
+    def __sub__(
+            self,
+            other: MinorUnitMoney | Money
+            ) -> MinorUnitMoney | Money:
+        if isinstance(other, MinorUnitMoney):
+            if self.currency != other.currency:
+                raise MismatchedCurrency(self.currency, other.currency)
+
+            return MinorUnitMoney(
+                minor_units=self.minor_units - other.minor_units,
+                currency=self.currency)
+
+        return self.to_money() - other
+
+    def __mul__(self, other: Decimal | int) -> MinorUnitMoney | Money:
+        if type(other) is int:
+            return MinorUnitMoney(
+                minor_units=self.minor_units * other,
+                currency=self.currency)
+
+        try:
+            return self.currency.mint(
+                self.amount.__mul__(other), fixed_point=True)
+        except TypeError as exc:
+            raise ScalarRequired(other) from exc
+
+    def __rmul__(self, other: Decimal | int) -> MinorUnitMoney | Money:
+        return self.__mul__(other)
+
+    @overload
+    def __truediv__(self, other: MinorUnitMoney | Money) -> Decimal: ...
+    @overload
+    def __truediv__(
+            self,
+            other: Decimal | int
+            ) -> MinorUnitMoney | Money: ...
+    def __truediv__(
+            self,
+            other: MinorUnitMoney | Money | Decimal | int
+            ) -> MinorUnitMoney | Money | Decimal:
+        if isinstance(other, MinorUnitMoney):
+            if self.currency != other.currency:
+                raise MismatchedCurrency(self.currency, other.currency)
+
+            return Decimal(self.minor_units).__truediv__(other.minor_units)
+
+        elif isinstance(other, Money):
+            return self.to_money().__truediv__(other)
+
+        try:
+            return self.currency.mint(
+                self.amount.__truediv__(other), fixed_point=True)
+        except TypeError as exc:
+            raise ScalarRequired(other) from exc
+
+    def __neg__(self) -> MinorUnitMoney:
+        return MinorUnitMoney(
+            minor_units=-self.minor_units, currency=self.currency)
+
+    def __pos__(self) -> MinorUnitMoney:
+        return MinorUnitMoney(
+            minor_units=self.minor_units, currency=self.currency)
+
+    def __abs__(self) -> MinorUnitMoney:
+        return MinorUnitMoney(
+            minor_units=abs(self.minor_units), currency=self.currency)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, MinorUnitMoney):
+            return (
+                self.minor_units == other.minor_units
+                and self.currency == other.currency)
+        elif isinstance(other, Money):
+            return (
+                self.amount == other.amount
+                and self.currency == other.currency)
+        else:
+            return NotImplemented
+
+    def compare(self, other: MinorUnitMoney | Money) -> Decimal:
+        """Same as ``Money.compare``: returns ``Decimal(-1)``,
+        ``Decimal(0)``, or ``Decimal(1)`` depending on whether this is
+        less than, equal to, or greater than ``other``.
+        """
+        if isinstance(other, MinorUnitMoney):
+            if self.currency != other.currency:
+                raise MismatchedCurrency(self.currency, other.currency)
+
+            mine = self.minor_units
+            theirs = other.minor_units
+            return _COMPARISONS[(mine > theirs) - (mine < theirs)]
+
+        try:
+            if self.currency != other.currency:
+                raise MismatchedCurrency(self.currency, other.currency)
+
+            return self.amount.compare(other.amount)
+
+        except AttributeError as exc:
+            raise MoneyRequired(other) from exc
+
+
+_COMPARISONS = (Decimal(0), Decimal(1), Decimal(-1))
+
+
+def allocate_many(
+        monies: Iterable[Money],
+        ratios: Sequence[int | Decimal]
+        ) -> list[list[Money]]:
+    """The bulk equivalent of ``Money.allocate``: allocates every money
+    against the same ratios, returning one list of parts per money. The
+    results are identical to calling ``allocate`` on each one, but the
+    ratios are only validated and converted into integer weights once,
+    instead of once per money.
+    """
+    weights, total = _ratios_to_weights(ratios)
+    return [_allocate_money(money, weights, total) for money in monies]
+
+
+def round_many_to_major(
+        monies: Iterable[Money],
+        rounding: str = ROUND_HALF_UP
+        ) -> list[Money]:
+    """The bulk equivalent of ``Money.round_to_major``, returning the
+    rounded monies as a list, in the same order.
+    """
+    contexts: dict[Currency, Context] = {}
+    rounded: list[Money] = []
+    for money in monies:
+        currency = money.currency
+        context = contexts.get(currency)
+        if context is None:
+            context = contexts[currency] = currency.context(rounding)
+
+        rounded.append(Money(
+            amount=money.amount.quantize(_ONE, rounding, context),
+            currency=currency))
+
+    return rounded
+
+
+def round_many_to_minor(
+        monies: Iterable[Money],
+        rounding: str = ROUND_HALF_UP
+        ) -> list[Money]:
+    """The bulk equivalent of ``Money.round_to_minor``, returning the
+    rounded monies as a list, in the same order. The monies may be of
+    mixed currencies; the rounder for each currency is only looked up
+    once per call. To round a whole column of a single currency, see
+    ``MoneyArray.round_to_minor``.
+    """
+    rounders: dict[Currency, Callable[[Decimal], Decimal]] = {}
+    rounded: list[Money] = []
+    for money in monies:
+        currency = money.currency
+        rounder = rounders.get(currency)
+        if rounder is None:
+            rounder = rounders[currency] = currency._get_minor_rounder(
+                rounding).round_one
+
+        rounded.append(Money(amount=rounder(money.amount), currency=currency))
+
+    return rounded
+
+
+def _ratios_to_weights(
+        ratios: Sequence[int | Decimal]
+        ) -> tuple[list[int], int]:
+    """Converts the ratios into exactly proportional integer weights,
+    returning them along with their total.
+    """
+    if not ratios:
+        raise ValueError('Must allocate into at least one part!')
+
+    dec_ratios = [
+        ratio if isinstance(ratio, Decimal) else Decimal(ratio)
+        for ratio in ratios]
+    for ratio in dec_ratios:
+        if not ratio.is_finite() or ratio < 0:
+            raise ValueError('Ratios must be non-negative and finite!', ratio)
+
+    exponent = min(map(get_exponent, dec_ratios))
+    weights = [decimal_to_scaled(ratio, exponent) for ratio in dec_ratios]
+    total = sum(weights)
+    if not total:
+        raise ValueError('At least one ratio must be positive!', ratios)
+
+    return weights, total
+
+
+def _allocate_money(
+        money: Money,
+        weights: list[int],
+        total: int
+        ) -> list[Money]:
+    currency = money.currency
+    currency_metadata = currency._metadata
+    minor_exponent = currency_metadata.minor_exponent
+    if minor_exponent is None:
+        raise ValueError(
+            'Currency minor unit unknown or not decimal-representable!',
+            currency)
+
+    minor_units = currency._to_minor_units(money.amount)
+    if minor_units is None:
+        raise ValueError(
+            'Amount must be a whole number of minor units to allocate!',
+            money)
+
+    multiplier = currency_metadata.minor_multiplier
+    return [
+        Money(
+            amount=scaled_to_decimal(share * multiplier, minor_exponent),
+            currency=currency)
+        for share in _allocate_units(minor_units, weights, total)]
+
+
+def _allocate_units(units: int, weights: list[int], total: int) -> list[int]:
+    """Allocates an integer number of units proportionally to the
+    weights, using the largest remainder method. Negative units are
+    allocated symmetrically to positive ones.
+    """
+    if units < 0:
+        return [-share for share in _allocate_units(-units, weights, total)]
+
+    shares: list[int] = []
+    remainders: list[int] = []
+    for weight in weights:
+        share, remainder = divmod(units * weight, total)
+        shares.append(share)
+        remainders.append(remainder)
+
+    leftover = units - sum(shares)
+    if leftover:
+        # Note that nlargest is stable, so ties go to the earlier parts.
+        for index in nlargest(
+            leftover, range(len(weights)), key=remainders.__getitem__
+        ):
+            shares[index] += 1
+
+    return shares
+
+
+def _restore_money(
+        amount: Decimal,
+        registry_id: str,
+        code_alpha3: str
+        ) -> Money:
+    """This is the unpickling counterpart to ``Money.__reduce__``."""
+    return Money(
+        amount=amount,
+        currency=restore_currency(registry_id, code_alpha3))
 
 
-# This injects the Money object into the _moneymath namespace to avoid it
-# having a circular import
+# This injects the Money (and MinorUnitMoney) objects into the _moneymath
+# namespace to avoid it having a circular import
 finnr._moneymath.Money = Money
+finnr._moneymath.MinorUnitMoney = MinorUnitMoney  # type: ignore
@@ -0,0 +1,487 @@
+"""``MoneyArray``s are a columnar alternative to long lists of ``Money``
+objects, for when you need to do the same math on many amounts of the
+same currency.
+"""
+from __future__ import annotations
+
+import operator
+import typing
+from array import array
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
+from dataclasses import dataclass
+from decimal import ROUND_HALF_EVEN
+from decimal import ROUND_HALF_UP
+from decimal import Decimal
+from itertools import compress
+from typing import Annotated
+from typing import overload
+
+from docnote import ClcNote
+
+from finnr._fixedpoint import EXACT_CONTEXT
+from finnr._fixedpoint import decimal_to_scaled
+from finnr._fixedpoint import div_round
+from finnr._fixedpoint import get_exponent
+from finnr._fixedpoint import rescale
+from finnr._fixedpoint import scaled_to_decimal
+from finnr.exceptions import MismatchedCurrency
+from finnr.exceptions import MoneyRequired
+from finnr.exceptions import ScalarRequired
+from finnr.money import Money
+
+if typing.TYPE_CHECKING:
+    from finnr.currency import Currency
+
+type _Scalar = Decimal | int
+type _Mask = list[bool]
+
+
+@dataclass(slots=True, eq=False)
+class MoneyArray:
+    """A ``MoneyArray`` is a single currency, plus a packed buffer of
+    amounts. Internally, the amounts are stored as signed 64-bit integer
+    coefficients, all sharing a single decimal ``exponent`` -- so, for
+    example, ``[1.23 EUR, 4.5 EUR]`` would be stored as ``[123, 450]``
+    with an exponent of -2.
+
+    All math operations are vectorized over the whole array, and (with
+    the exception of division) are exact. Operations between arrays of
+    different exponents first align them to the more precise of the two.
+
+    Comparison operators return a mask (a list of bools), not a single
+    bool. As such, ``MoneyArray``s are unhashable.
+
+    Note that coefficients must fit within a signed 64-bit integer; an
+    ``OverflowError`` will be raised if any operation would result in
+    a coefficient that does not. If you find yourself running into that
+    after repeated multiplication, ``quantize`` the array to reduce the
+    precision of the exponent.
+    """
+    currency: Currency
+    coefficients: array[int]
+    exponent: int
+
+    __hash__ = None  # type: ignore[assignment]
+
+    @classmethod
+    def from_amounts(
+            cls,
+            currency: Currency,
+            amounts: Iterable[Decimal | int | str],
+            *,
+            exponent: Annotated[
+                int | None,
+                ClcNote('''If omitted, the exponent will be determined
+                    automatically, as the most precise exponent of any of
+                    the passed amounts (but no greater than zero).
+
+                    If passed explicitly, all amounts must be exactly
+                    representable at that exponent, or ``ValueError``
+                    will be raised.''')
+                ] = None
+            ) -> MoneyArray:
+        """Constructs a new ``MoneyArray`` from the passed amounts,
+        all of which are assumed to be in ``currency``.
+        """
+        dec_amounts = [
+            amount if isinstance(amount, Decimal) else Decimal(amount)
+            for amount in amounts]
+
+        if exponent is None:
+            exponent = min(
+                (get_exponent(amount) for amount in dec_amounts), default=0)
+            exponent = min(exponent, 0)
+            coefficients = [
+                decimal_to_scaled(amount, exponent)
+                for amount in dec_amounts]
+
+        else:
+            # Note that we can't just compare exponents here, since amounts
+            # with trailing zeros (eg ``1.230``) can still be exact at a
+            # larger exponent.
+            negative_exponent = -exponent
+            coefficients: list[int] = []
+            for amount in dec_amounts:
+                scaled = amount.scaleb(
+                    negative_exponent, context=EXACT_CONTEXT)
+                if scaled != scaled.to_integral_value():
+                    raise ValueError(
+                        'Amounts must be exactly representable at the given '
+                        + 'exponent!', amount, exponent)
+
+                coefficients.append(int(scaled))
+
+        return cls(
+            currency=currency,
+            coefficients=array('q', coefficients),
+            exponent=exponent)
+
+    @classmethod
+    def from_monies(
+            cls,
+            monies: Iterable[Money],
+            *,
+            currency: Annotated[
+                Currency | None,
+                ClcNote('''The currency of the array. If omitted, it will
+                    be taken from the first ``Money``, which means that
+                    empty arrays require an explicit currency.''')
+                ] = None,
+            exponent: Annotated[
+                int | None,
+                ClcNote('''Has the same meaning as in
+                    ``MoneyArray.from_amounts``.''')
+                ] = None
+            ) -> MoneyArray:
+        """Constructs a new ``MoneyArray`` from ``Money`` objects, all
+        of which must share the same currency.
+        """
+        amounts: list[Decimal] = []
+        for money in monies:
+            if currency is None:
+                currency = money.currency
+            elif money.currency != currency:
+                raise MismatchedCurrency(currency, money.currency)
+
+            amounts.append(money.amount)
+
+        if currency is None:
+            raise ValueError(
+                'Currency is required when constructing empty arrays!')
+
+        return cls.from_amounts(currency, amounts, exponent=exponent)
+
+    @property
+    def amounts(self) -> list[Decimal]:
+        """Returns the amounts within the array as a list of
+        ``Decimal``s.
+        """
+        exponent = self.exponent
+        return [
+            scaled_to_decimal(coefficient, exponent)
+            for coefficient in self.coefficients]
+
+    def sum(self) -> Money:
+        """Returns the total of all amounts in the array, as a single
+        ``Money`` object.
+        """
+        return Money(
+            amount=scaled_to_decimal(sum(self.coefficients), self.exponent),
+            currency=self.currency)
+
+    def quantize(
+            self,
+            exp: Decimal | int,
+            rounding: Annotated[
+                str | None,
+                ClcNote('''The rounding mode to use. If omitted, this
+                    defaults to ``ROUND_HALF_EVEN``, matching the default
+                    ``decimal`` context.''')
+                ] = None
+            ) -> MoneyArray:
+        """Returns a new ``MoneyArray`` with all amounts rounded (or
+        padded) to the exponent of ``exp``. This has the same semantics
+        as ``Decimal.quantize``, for example,
+        ``array.quantize(Decimal('0.01'))``.
+        """
+        if isinstance(exp, int):
+            exp = Decimal(exp)
+        target_exponent = get_exponent(exp)
+
+        if target_exponent <= self.exponent:
+            factor = 10 ** (self.exponent - target_exponent)
+            coefficients = array('q', [
+                coefficient * factor for coefficient in self.coefficients])
+
+        else:
+            if rounding is None:
+                rounding = ROUND_HALF_EVEN
+            divisor = 10 ** (target_exponent - self.exponent)
+            coefficients = array('q', [
+                div_round(coefficient, divisor, rounding)
+                for coefficient in self.coefficients])
+
+        return MoneyArray(
+            currency=self.currency,
+            coefficients=coefficients,
+            exponent=target_exponent)
+
+    def round_to_major(self, rounding: str = ROUND_HALF_UP) -> MoneyArray:
+        """The columnar equivalent of ``Money.round_to_major``: returns
+        a new ``MoneyArray`` with all amounts rounded to a whole number
+        of major units.
+        """
+        return self.quantize(0, rounding)
+
+    def round_to_minor(self, rounding: str = ROUND_HALF_UP) -> MoneyArray:
+        """The columnar equivalent of ``Money.round_to_minor``: returns
+        a new ``MoneyArray`` with all amounts rounded to a whole number
+        of minor units, with exactly the same results as rounding each
+        amount individually. This is done entirely on the integer
+        coefficients.
+
+        Raises ``ValueError`` if the minor unit of the currency can't be
+        expressed as a decimal (and therefore can't be stored in a
+        ``MoneyArray``).
+        """
+        currency_metadata = self.currency._metadata
+        minor_quantizor = currency_metadata.minor_quantizor
+        # Same as Money.round_to_minor, this is a no-op for currencies without
+        # a (known) minor unit.
+        if minor_quantizor is None:
+            return MoneyArray(
+                currency=self.currency,
+                coefficients=array('q', self.coefficients),
+                exponent=self.exponent)
+
+        if currency_metadata.minor_exponent is None:
+            raise ValueError(
+                'Currency minor unit not decimal-representable!',
+                self.currency)
+
+        # Note that the exponent of the quantizor is always the minor exponent
+        # here, since the minor unit is decimal-representable.
+        rounded = self.quantize(minor_quantizor, rounding)
+        if not currency_metadata.is_decimal:
+            minor_multiplier = currency_metadata.minor_multiplier
+            # This matches the second rounding step of the Decimal-based
+            # rounder for non-decimal currencies, which rounds the (already
+            # quantized) amount to a whole number of minor units.
+            rounded.coefficients = array('q', [
+                div_round(coefficient, minor_multiplier, rounding)
+                * minor_multiplier
+                for coefficient in rounded.coefficients])
+
+        return rounded
+
+    def compress(self, mask: Iterable[object]) -> MoneyArray:
+        """Returns a new ``MoneyArray`` containing only the amounts
+        where the corresponding ``mask`` value was truthy. Use this in
+        combination with the comparison operators to filter arrays, for
+        example, ``array.compress(array > threshold)``.
+        """
+        return MoneyArray(
+            currency=self.currency,
+            coefficients=array('q', compress(self.coefficients, mask)),
+            exponent=self.exponent)
+
+    def __len__(self) -> int:
+        return len(self.coefficients)
+
+    def __iter__(self) -> Iterator[Money]:
+        currency = self.currency
+        for amount in self.amounts:
+            yield Money(amount=amount, currency=currency)
+
+    @overload
+    def __getitem__(self, index: int) -> Money: ...
+    @overload
+    def __getitem__(self, index: slice) -> MoneyArray: ...
+    def __getitem__(self, index: int | slice) -> Money | MoneyArray:
+        if isinstance(index, slice):
+            return MoneyArray(
+                currency=self.currency,
+                coefficients=self.coefficients[index],
+                exponent=self.exponent)
+
+        return Money(
+            amount=scaled_to_decimal(self.coefficients[index], self.exponent),
+            currency=self.currency)
+
+    def __add__(self, other: MoneyArray | Money) -> MoneyArray:
+        return self._apply_binary(other, operator.add)
+
+    def __sub__(self, other: MoneyArray | Money) -> MoneyArray:
+        return self._apply_binary(other, operator.sub)
+
+    def __mul__(self, other: _Scalar) -> MoneyArray:
+        if isinstance(other, int):
+            multiplier = other
+            exponent = self.exponent
+        elif isinstance(other, Decimal):
+            other_exponent = get_exponent(other)
+            multiplier = decimal_to_scaled(other, other_exponent)
+            exponent = self.exponent + other_exponent
+        else:
+            raise ScalarRequired(other)
+
+        return MoneyArray(
+            currency=self.currency,
+            coefficients=array('q', [
+                coefficient * multiplier
+                for coefficient in self.coefficients]),
+            exponent=exponent)
+
+    def __rmul__(self, other: _Scalar) -> MoneyArray:
+        return self.__mul__(other)
+
+    def __truediv__(self, other: _Scalar) -> MoneyArray:
+        """Divides every amount by a scalar. Unlike the other
+        operations, this is not generally exact; results are rounded to
+        the current exponent of the array using ``ROUND_HALF_EVEN``. If
+        you need more precision, ``quantize`` the array to a smaller
+        exponent first.
+        """
+        return self.divide(other)
+
+    def divide(
+            self,
+            other: _Scalar,
+            rounding: str = ROUND_HALF_EVEN
+            ) -> MoneyArray:
+        """Same as ``array / other``, but with an explicit rounding mode.
+        """
+        if isinstance(other, int):
+            divisor = other
+            other_exponent = 0
+        elif isinstance(other, Decimal):
+            other_exponent = get_exponent(other)
+            divisor = decimal_to_scaled(other, other_exponent)
+        else:
+            raise ScalarRequired(other)
+
+        if divisor == 0:
+            raise ZeroDivisionError('MoneyArray division by zero')
+        # div_round requires a positive denominator, so move the sign over
+        # to the numerator instead
+        if divisor < 0:
+            divisor = -divisor
+            sign = -1
+        else:
+            sign = 1
+
+        # Dividing by c * 10**e means we need to multiply by 10**-e to stay
+        # at the same exponent as we started at
+        if other_exponent <= 0:
+            multiplier = sign * 10 ** -other_exponent
+        else:
+            multiplier = sign
+            divisor *= 10 ** other_exponent
+
+        return MoneyArray(
+            currency=self.currency,
+            coefficients=array('q', [
+                div_round(coefficient * multiplier, divisor, rounding)
+                for coefficient in self.coefficients]),
+            exponent=self.exponent)
+
+    def __neg__(self) -> MoneyArray:
+        return MoneyArray(
+            currency=self.currency,
+            coefficients=array('q', map(operator.neg, self.coefficients)),
+            exponent=self.exponent)
+
+    def __pos__(self) -> MoneyArray:
+        return MoneyArray(
+            currency=self.currency,
+            coefficients=array('q', self.coefficients),
+            exponent=self.exponent)
+
+    def __abs__(self) -> MoneyArray:
+        return MoneyArray(
+            currency=self.currency,
+            coefficients=array('q', map(abs, self.coefficients)),
+            exponent=self.exponent)
+
+    def __eq__(self, other: object) -> _Mask:  # type: ignore[override]
+        return self._compare(other, operator.eq)
+
+    def __ne__(self, other: object) -> _Mask:  # type: ignore[override]
+        return self._compare(other, operator.ne)
+
+    def __lt__(self, other: MoneyArray | Money) -> _Mask:
+        return self._compare(other, operator.lt)
+
+    def __le__(self, other: MoneyArray | Money) -> _Mask:
+        return self._compare(other, operator.le)
+
+    def __gt__(self, other: MoneyArray | Money) -> _Mask:
+        return self._compare(other, operator.gt)
+
+    def __ge__(self, other: MoneyArray | Money) -> _Mask:
+        return self._compare(other, operator.ge)
+
+    def _apply_binary(
+            self,
+            other: object,
+            op: Callable[[int, int], int]
+            ) -> MoneyArray:
+        """Applies the operator elementwise between self and other,
+        after aligning both to a common exponent, and returns the result
+        as a new array.
+        """
+        mine, theirs, exponent = self._align(other)
+        if isinstance(theirs, int):
+            coefficients = array('q', [
+                op(coefficient, theirs) for coefficient in mine])
+        else:
+            coefficients = array('q', map(op, mine, theirs))
+
+        return MoneyArray(
+            currency=self.currency,
+            coefficients=coefficients,
+            exponent=exponent)
+
+    def _compare(
+            self,
+            other: object,
+            op: Callable[[int, int], bool]
+            ) -> _Mask:
+        """Compares self and other elementwise after aligning both to a
+        common exponent, returning the resulting mask.
+        """
+        mine, theirs, _ = self._align(other)
+        if isinstance(theirs, int):
+            return [op(coefficient, theirs) for coefficient in mine]
+        else:
+            return list(map(op, mine, theirs))
+
+    def _align(
+            self,
+            other: object
+            ) -> tuple[array[int], array[int] | int, int]:
+        """Checks that other is compatible with self, and then converts
+        both to coefficients at a common exponent. If other is a single
+        ``Money``, it will be returned as a single int; otherwise, it
+        will be an array of the same length as self.
+        """
+        if isinstance(other, MoneyArray):
+            if other.currency != self.currency:
+                raise MismatchedCurrency(self.currency, other.currency)
+            if len(other.coefficients) != len(self.coefficients):
+                raise ValueError(
+                    'MoneyArray lengths differ!',
+                    len(self.coefficients), len(other.coefficients))
+
+            exponent = min(self.exponent, other.exponent)
+            theirs = _realign(other.coefficients, other.exponent, exponent)
+
+        elif isinstance(other, Money):
+            if other.currency != self.currency:
+                raise MismatchedCurrency(self.currency, other.currency)
+
+            exponent = min(self.exponent, get_exponent(other.amount))
+            theirs = decimal_to_scaled(other.amount, exponent)
+
+        else:
+            raise MoneyRequired(other)
+
+        mine = _realign(self.coefficients, self.exponent, exponent)
+        return mine, theirs, exponent
+
+
+def _realign(
+        coefficients: array[int],
+        from_exponent: int,
+        to_exponent: int
+        ) -> array[int]:
+    """Converts the coefficients to the (smaller) target exponent. If
+    no conversion is required, returns the original array back.
+    """
+    if from_exponent == to_exponent:
+        return coefficients
+
+    factor = rescale(1, from_exponent, to_exponent)
+    return array('q', [coefficient * factor for coefficient in coefficients])
@@ -0,0 +1,248 @@
+"""This module contains helpers for aggregating very large numbers of
+``Money`` objects across multiple processes.
+
+All of the reducers here work the same way: the input is split into
+chunks, each chunk is reduced to one partial result per currency within
+a worker process, and the partial results are then merged in the
+calling process. Only a bounded number of chunks is ever in flight at
+once, so the input can be a lazy iterable of any length.
+
+Note that the monies (and their currencies) must be picklable. Monies of
+registered currencies -- for example, anything from ``finnr.iso.mint``
+-- are pickled by reference, which keeps the per-chunk overhead low.
+"""
+from __future__ import annotations
+
+import os
+from collections import deque
+from collections.abc import Callable
+from collections.abc import Iterable
+from concurrent.futures import Executor
+from concurrent.futures import Future
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import nullcontext
+from decimal import Decimal
+from itertools import islice
+from typing import Annotated
+
+from docnote import ClcNote
+
+from finnr._fixedpoint import EXACT_CONTEXT
+from finnr.aggregate import MoneyBag
+from finnr.currency import Currency
+from finnr.money import Money
+
+# How many chunks to keep in flight per worker. More than one per worker
+# keeps the workers busy while the results are being merged.
+_CHUNKS_IN_FLIGHT_PER_WORKER = 2
+
+
+def sum_by_currency(
+        monies: Iterable[Money],
+        *,
+        workers: Annotated[
+            int | None,
+            ClcNote('''The number of worker processes to use. Defaults to
+                the number of CPUs, as per ``ProcessPoolExecutor``. If an
+                ``executor`` is passed, this only controls how many chunks
+                are submitted to it at once.''')
+            ] = None,
+        chunk_size: Annotated[
+            int,
+            ClcNote('''The number of monies sent to a worker at once.''')
+            ] = 100_000,
+        executor: Annotated[
+            Executor | None,
+            ClcNote('''An existing executor to use instead of creating (and
+                shutting down) a new process pool for every call.''')
+            ] = None
+        ) -> MoneyBag:
+    """Sums the passed monies in parallel, returning one total per
+    currency.
+
+    Unlike adding ``Money`` objects directly, the totals are always
+    exact, regardless of the precision of the current decimal context
+    (or of the contexts within the worker processes).
+    """
+    totals = _reduce_by_currency(
+        monies,
+        _sum_chunk,
+        EXACT_CONTEXT.add,
+        workers=workers,
+        chunk_size=chunk_size,
+        executor=executor)
+    return MoneyBag(
+        Money(amount=amount, currency=currency)
+        for currency, amount in totals.items())
+
+
+def count_by_currency(
+        monies: Iterable[Money],
+        *,
+        workers: int | None = None,
+        chunk_size: int = 100_000,
+        executor: Executor | None = None
+        ) -> dict[Currency, int]:
+    """Counts the passed monies in parallel, per currency. Arguments
+    have the same meaning as in ``sum_by_currency``.
+    """
+    return _reduce_by_currency(
+        monies,
+        _count_chunk,
+        int.__add__,
+        workers=workers,
+        chunk_size=chunk_size,
+        executor=executor)
+
+
+def min_by_currency(
+        monies: Iterable[Money],
+        *,
+        workers: int | None = None,
+        chunk_size: int = 100_000,
+        executor: Executor | None = None
+        ) -> dict[Currency, Money]:
+    """Finds the smallest of the passed monies in parallel, per
+    currency. Arguments have the same meaning as in
+    ``sum_by_currency``. If there are multiple smallest monies (for
+    example, ``1.0 EUR`` and ``1.00 EUR``), the first is returned.
+    """
+    minimums = _reduce_by_currency(
+        monies,
+        _min_chunk,
+        _min_decimal,
+        workers=workers,
+        chunk_size=chunk_size,
+        executor=executor)
+    return {
+        currency: Money(amount=amount, currency=currency)
+        for currency, amount in minimums.items()}
+
+
+def max_by_currency(
+        monies: Iterable[Money],
+        *,
+        workers: int | None = None,
+        chunk_size: int = 100_000,
+        executor: Executor | None = None
+        ) -> dict[Currency, Money]:
+    """Finds the largest of the passed monies in parallel, per
+    currency. Arguments have the same meaning as in
+    ``sum_by_currency``. If there are multiple largest monies, the
+    first is returned.
+    """
+    maximums = _reduce_by_currency(
+        monies,
+        _max_chunk,
+        _max_decimal,
+        workers=workers,
+        chunk_size=chunk_size,
+        executor=executor)
+    return {
+        currency: Money(amount=amount, currency=currency)
+        for currency, amount in maximums.items()}
+
+
+def _reduce_by_currency[T](
+        monies: Iterable[Money],
+        chunk_reducer: Callable[[list[Money]], dict[Currency, T]],
+        merger: Callable[[T, T], T],
+        *,
+        workers: int | None,
+        chunk_size: int,
+        executor: Executor | None
+        ) -> dict[Currency, T]:
+    """Fans the monies out to the executor in chunks, reducing each
+    chunk with ``chunk_reducer``, and then merges the partial results
+    together, in the original order of the chunks.
+    """
+    if chunk_size < 1:
+        raise ValueError('Chunk size must be positive!', chunk_size)
+
+    if executor is None:
+        executor_context = ProcessPoolExecutor(max_workers=workers)
+    else:
+        executor_context = nullcontext(executor)
+
+    results: dict[Currency, T] = {}
+
+    def merge(partial: dict[Currency, T]) -> None:
+        for currency, value in partial.items():
+            existing = results.get(currency)
+            if existing is None:
+                results[currency] = value
+            else:
+                results[currency] = merger(existing, value)
+
+    monies_iterator = iter(monies)
+    with executor_context as active_executor:
+        max_in_flight = _CHUNKS_IN_FLIGHT_PER_WORKER * (
+            workers or os.cpu_count() or 1)
+        in_flight: deque[Future[dict[Currency, T]]] = deque()
+        try:
+            while chunk := list(islice(monies_iterator, chunk_size)):
+                if len(in_flight) >= max_in_flight:
+                    merge(in_flight.popleft().result())
+                in_flight.append(active_executor.submit(chunk_reducer, chunk))
+
+            while in_flight:
+                merge(in_flight.popleft().result())
+
+        finally:
+            for future in in_flight:
+                future.cancel()
+
+    return results
+
+
+def _sum_chunk(chunk: list[Money]) -> dict[Currency, Decimal]:
+    add = EXACT_CONTEXT.add
+    totals: dict[Currency, Decimal] = {}
+    for money in chunk:
+        currency = money.currency
+        existing = totals.get(currency)
+        if existing is None:
+            totals[currency] = money.amount
+        else:
+            totals[currency] = add(existing, money.amount)
+
+    return totals
+
+
+def _count_chunk(chunk: list[Money]) -> dict[Currency, int]:
+    counts: dict[Currency, int] = {}
+    for money in chunk:
+        currency = money.currency
+        counts[currency] = counts.get(currency, 0) + 1
+
+    return counts
+
+
+def _min_chunk(chunk: list[Money]) -> dict[Currency, Decimal]:
+    minimums: dict[Currency, Decimal] = {}
+    for money in chunk:
+        currency = money.currency
+        existing = minimums.get(currency)
+        if existing is None or money.amount < existing:
+            minimums[currency] = money.amount
+
+    return minimums
+
+
+def _max_chunk(chunk: list[Money]) -> dict[Currency, Decimal]:
+    maximums: dict[Currency, Decimal] = {}
+    for money in chunk:
+        currency = money.currency
+        existing = maximums.get(currency)
+        if existing is None or money.amount > existing:
+            maximums[currency] = money.amount
+
+    return maximums
+
+
+def _min_decimal(first: Decimal, second: Decimal) -> Decimal:
+    return second if second < first else first
+
+
+def _max_decimal(first: Decimal, second: Decimal) -> Decimal:
+    return second if second > first else first
@@ -0,0 +1,282 @@
+"""This module contains a parser for converting human-formatted money
+strings -- for example, ``'12.34 EUR'``, ``'USD 1,234.56'``, or
+``'1.234,56 €'`` -- into ``Money`` objects.
+"""
+from __future__ import annotations
+
+import re
+from collections import defaultdict
+from collections.abc import Iterable
+from collections.abc import Mapping
+from decimal import ROUND_HALF_UP
+from typing import Annotated
+
+from docnote import ClcNote
+
+from finnr.currency import Currency
+from finnr.currency import CurrencySet
+from finnr.exceptions import MoneyParseError
+from finnr.money import Money
+
+# Note that these are deliberately limited to symbols that unambiguously
+# refer to a single currency. Notably, this excludes ``$`` (used by dozens
+# of currencies) and ``¥`` (both JPY and CNY); pass those explicitly via
+# ``symbols`` if you know which one you mean.
+DEFAULT_SYMBOLS: Mapping[str, str] = {
+    '€': 'EUR',
+    '£': 'GBP',
+    '₹': 'INR',
+    '₩': 'KRW',
+    '₽': 'RUB',
+    '₺': 'TRY',
+    '₪': 'ILS',
+    '₴': 'UAH',
+    '₫': 'VND',
+    '฿': 'THB',
+    '₱': 'PHP',
+    '₦': 'NGN',}
+
+_MINUS_SIGNS = frozenset({'-', '\u2212'})
+# Spaces (including non-breaking and thin spaces) and apostrophes are only
+# ever used as grouping separators, never as decimal separators.
+_GROUPING_ONLY = re.compile(r"[\s'\u2019]")
+# This is the standard number of digits between grouping separators
+_GROUP_DIGITS = 3
+# This is the number of digits between the grouping separators of the
+# lakh/crore style (eg 1,00,00,000), except for the last group, which is
+# always standard.
+_LAKH_GROUP_DIGITS = 2
+_MONEY_PATTERN = re.compile(
+    r'''
+    ^\s*
+    (?P<sign_outer>[-+\u2212])?\s*
+    (?P<prefix>[^\s\d.,'\u2019+\-\u2212]+)?\s*
+    (?P<sign_inner>[-+\u2212])?\s*
+    (?P<number>\d(?:[\d.,'\u2019\s]*\d)?)
+    \s*(?P<suffix>[^\s\d.,'\u2019+\-\u2212]+)?
+    \s*$
+    ''',
+    re.VERBOSE)
+
+
+class MoneyParser:
+    """A ``MoneyParser`` converts formatted money strings into ``Money``
+    objects, where the currency is given either as an alpha3 code or as
+    a currency symbol, and can appear before or after the amount. All
+    of the lookup tables are compiled once, when the parser is created,
+    so parsers should be created once and then reused.
+
+    Decimal and grouping separators are detected automatically (unless
+    an explicit ``decimal_separator`` is passed):
+    ++  if both ``.`` and ``,`` are present, whichever comes last is the
+        decimal separator
+    ++  if one of them is repeated, it's a grouping separator
+    ++  if only one of them appears, exactly once, it's treated as a
+        grouping separator if (and only if) it's followed by exactly 3
+        digits and the currency doesn't have 3 minor digits. So
+        ``'1,234 USD'`` is 1234 USD, but ``'1,234 BHD'`` is 1.234 BHD.
+    ++  spaces and apostrophes are always grouping separators
+
+    > Example
+    __embed__: 'code/python'
+        >>> parser = MoneyParser(mint)
+        >>> parser.parse('1.234,56 €')
+        Money(amount=Decimal('1234.56'), currency=Currency(...))
+    """
+    __slots__ = ('_by_token', '_decimal_separator', '_minor_digits')
+
+    def __init__(
+            self,
+            mint: Annotated[
+                CurrencySet,
+                ClcNote('''The currency set used to resolve currency codes
+                    and symbols, for example, ``finnr.iso.mint``.''')],
+            *,
+            symbols: Annotated[
+                Mapping[str, str],
+                ClcNote('''A mapping of currency symbols to the alpha3 code
+                    of the currency they represent. Symbols for currencies
+                    that aren't in ``mint`` are ignored.''')
+                ] = DEFAULT_SYMBOLS,
+            decimal_separator: Annotated[
+                str | None,
+                ClcNote('''If given (either ``'.'`` or ``','``), disables
+                    separator detection: this is always treated as the
+                    decimal separator, and the other as a grouping
+                    separator.''')
+                ] = None):
+        if decimal_separator not in {None, '.', ','}:
+            raise ValueError(
+                'Decimal separator must be either "." or ","!',
+                decimal_separator)
+
+        by_token: dict[str, Currency] = {}
+        minor_digits: dict[Currency, int | None] = {}
+        for currency in mint:
+            by_token[currency.code_alpha3.upper()] = currency
+            minor_exponent = currency._metadata.minor_exponent
+            minor_digits[currency] = (
+                None if minor_exponent is None else -minor_exponent)
+
+        for symbol, code_alpha3 in symbols.items():
+            currency = mint.get(code_alpha3)
+            if currency is not None:
+                by_token[symbol.upper()] = currency
+
+        self._by_token = by_token
+        self._minor_digits = minor_digits
+        self._decimal_separator = decimal_separator
+
+    def parse(
+            self,
+            text: str,
+            *,
+            quantize_to_minor: bool = False,
+            rounding: str = ROUND_HALF_UP
+            ) -> Money:
+        """Parses a single money string. The ``quantize_to_minor`` and
+        ``rounding`` arguments have the same meaning as in
+        ``Currency.mint``. Raises ``MoneyParseError`` if the string
+        couldn't be parsed.
+        """
+        currency, amount = self._split(text)
+        return currency.mint(
+            amount,
+            quantize_to_minor=quantize_to_minor,
+            rounding=rounding)
+
+    def parse_many(
+            self,
+            texts: Iterable[str],
+            *,
+            quantize_to_minor: bool = False,
+            rounding: str = ROUND_HALF_UP
+            ) -> list[Money]:
+        """The bulk equivalent of ``parse``: parses every string in
+        ``texts``, returning the results as a list in the same order.
+
+        The strings are grouped by currency, and each group is minted as
+        a single ``Currency.mint_many`` batch, which is significantly
+        faster than calling ``parse`` in a loop.
+        """
+        amounts_by_currency: dict[Currency, list[str]] = defaultdict(list)
+        indices_by_currency: dict[Currency, list[int]] = defaultdict(list)
+        count = 0
+        for index, text in enumerate(texts):
+            currency, amount = self._split(text)
+            amounts_by_currency[currency].append(amount)
+            indices_by_currency[currency].append(index)
+            count += 1
+
+        results: list[Money] = [None] * count  # type: ignore
+        for currency, amounts in amounts_by_currency.items():
+            minted = currency.mint_many(
+                amounts,
+                quantize_to_minor=quantize_to_minor,
+                rounding=rounding)
+            for index, money in zip(
+                indices_by_currency[currency], minted, strict=True
+            ):
+                results[index] = money
+
+        return results
+
+    def _split(self, text: str) -> tuple[Currency, str]:
+        """Splits the passed text into its currency and a normalized
+        amount string (ie, something that can be passed directly to
+        ``Decimal``).
+        """
+        match = _MONEY_PATTERN.match(text)
+        if match is None:
+            raise MoneyParseError('Malformed money string!', text)
+
+        sign_outer, prefix, sign_inner, number, suffix = match.groups()
+        if (prefix is None) == (suffix is None):
+            raise MoneyParseError(
+                'Money strings must have exactly one currency code or '
+                + 'symbol!', text)
+        if sign_outer is not None and sign_inner is not None:
+            raise MoneyParseError('Multiple signs!', text)
+
+        token = prefix if suffix is None else suffix
+        currency = self._by_token.get(token.upper())
+        if currency is None:
+            raise MoneyParseError('Unknown currency code or symbol!', text)
+
+        amount = self._normalize_number(
+            _GROUPING_ONLY.sub('', number), self._minor_digits[currency])
+        if amount is None:
+            raise MoneyParseError('Malformed money amount!', text)
+
+        if (sign_outer or sign_inner) in _MINUS_SIGNS:
+            amount = '-' + amount
+
+        return currency, amount
+
+    def _normalize_number(
+            self,
+            number: str,
+            minor_digits: int | None
+            ) -> str | None:
+        """Converts the number to a plain, ``.``-delimited decimal
+        string. Returns None if the separators don't make sense.
+        """
+        last_dot = number.rfind('.')
+        last_comma = number.rfind(',')
+        if last_dot == last_comma == -1:
+            return number
+
+        decimal_separator = self._decimal_separator
+        if decimal_separator is None:
+            if last_dot != -1 and last_comma != -1:
+                decimal_separator = '.' if last_dot > last_comma else ','
+            else:
+                separator = '.' if last_dot != -1 else ','
+                separator_index = max(last_dot, last_comma)
+                if (
+                    number.count(separator) > 1
+                    or (
+                        len(number) - separator_index == _GROUP_DIGITS + 1
+                        and minor_digits != _GROUP_DIGITS)
+                ):
+                    decimal_separator = ',' if separator == '.' else '.'
+                else:
+                    decimal_separator = separator
+
+        grouping_separator = ',' if decimal_separator == '.' else '.'
+        integral, _, fractional = number.rpartition(decimal_separator)
+        if not integral:
+            integral, fractional = fractional, ''
+        if decimal_separator in integral:
+            return None
+
+        groups = integral.split(grouping_separator)
+        if grouping_separator in fractional or not _is_valid_grouping(groups):
+            return None
+
+        integral = ''.join(groups)
+        if fractional:
+            return f'{integral}.{fractional}'
+        return integral
+
+
+def _is_valid_grouping(groups: list[str]) -> bool:
+    """Checks the digit groups between grouping separators. Groups
+    after the first must be 3 digits, and the first one 1-3 digits,
+    except for the lakh/crore style (eg ``12,34,567``), where all of
+    them except the last one are (up to) 2 digits.
+    """
+    if len(groups) == 1:
+        return True
+    if len(groups[-1]) != _GROUP_DIGITS:
+        return False
+
+    inner_lengths = {len(group) for group in groups[1:-1]}
+    if inner_lengths and inner_lengths <= {_LAKH_GROUP_DIGITS}:
+        max_first_digits = _LAKH_GROUP_DIGITS
+    elif inner_lengths <= {_GROUP_DIGITS}:
+        max_first_digits = _GROUP_DIGITS
+    else:
+        return False
+
+    return len(groups[0]) <= max_first_digits
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+from decimal import Decimal
+
+import pytest
+
+from finnr._types import Singleton
+from finnr.aggregate import MoneyAccumulator
+from finnr.aggregate import MoneyBag
+from finnr.currency import Currency
+from finnr.exceptions import MismatchedCurrency
+
+_test_currency = Currency(
+    code_alpha3='EUR',
+    code_num=978,
+    minor_unit_denominator=100,
+    entities=frozenset(),
+    name='Euro',
+    approx_active_from=Singleton.UNKNOWN,
+    approx_active_until=None,)
+_other_currency = Currency(
+    code_alpha3='MGA',
+    code_num=969,
+    minor_unit_denominator=5,
+    entities=frozenset(),
+    name='Malagasy Ariary',
+    approx_active_from=Singleton.UNKNOWN,
+    approx_active_until=None,)
+
+
+class TestMoneyBag:
+
+    def test_mixed_currencies(self):
+        """Adding monies of different currencies must keep separate
+        totals instead of raising.
+        """
+        bag = MoneyBag([_test_currency.mint(1), _other_currency.mint(2)])
+        bag += _test_currency.mint('0.5')
+        bag.add_many([_other_currency.mint(3), _test_currency.mint(1)])
+
+        assert len(bag) == 2
+        assert bag[_test_currency] == _test_currency.mint('2.5')
+        assert bag[_other_currency] == _other_currency.mint(5)
+        assert bag.currencies == {_test_currency, _other_currency}
+
+    def test_subtraction(self):
+        """Subtracting monies and bags must reduce the totals, going
+        negative for currencies not yet in the bag.
+        """
+        bag = MoneyBag([_test_currency.mint(10)])
+        bag -= _test_currency.mint(3)
+        bag -= _other_currency.mint(2)
+
+        assert bag[_test_currency].amount == Decimal(7)
+        assert bag[_other_currency].amount == Decimal(-2)
+
+        difference = bag - MoneyBag([_test_currency.mint(7)])
+        assert difference[_test_currency].amount == Decimal(0)
+        # Make sure the original bag was left alone
+        assert bag[_test_currency].amount == Decimal(7)
+
+    def test_merge(self):
+        """Merging bags must add their totals together."""
+        bag1 = MoneyBag([_test_currency.mint(1)])
+        bag2 = MoneyBag([_test_currency.mint(2), _other_currency.mint(3)])
+        bag1.merge(bag2)
+
+        assert bag1 == MoneyBag([
+            _test_currency.mint(3), _other_currency.mint(3)])
+        assert bag1.get(_test_currency) == _test_currency.mint(3)
+
+    def test_get_missing(self):
+        """Getting a missing currency must return the default."""
+        bag = MoneyBag()
+        assert bag.get(_test_currency) is None
+        assert _test_currency not in bag
+
+
+class TestMoneyAccumulator:
+
+    def test_accumulate(self):
+        """Adding single monies and iterables of them must keep a
+        running total, adopting the currency of the first value.
+        """
+        accumulator = MoneyAccumulator()
+        assert accumulator.currency is None
+        with pytest.raises(ValueError):
+            accumulator.total  # noqa: B018
+
+        accumulator += _test_currency.mint('1.50')
+        accumulator += [_test_currency.mint('2'), _test_currency.mint('3')]
+        accumulator.add(_test_currency.mint('0.25'))
+        accumulator.subtract_many([_test_currency.mint('1')])
+        accumulator -= _test_currency.mint('0.75')
+
+        assert accumulator.currency is _test_currency
+        assert accumulator.amount == Decimal('5.00')
+        assert accumulator.total == _test_currency.mint('5.00')
+
+    def test_explicit_currency(self):
+        """An explicit currency must be used for an empty total, and be
+        enforced for any added values.
+        """
+        accumulator = MoneyAccumulator(currency=_test_currency)
+        assert accumulator.total == _test_currency.mint(0)
+
+        with pytest.raises(MismatchedCurrency):
+            accumulator += _other_currency.mint(1)
+
+    def test_mismatched_partial(self):
+        """Adding an iterable with a mismatched currency must raise,
+        keeping everything added before the mismatched value.
+        """
+        accumulator = MoneyAccumulator([_test_currency.mint(1)])
+
+        with pytest.raises(MismatchedCurrency):
+            accumulator.add_many([
+                _test_currency.mint(2),
+                _other_currency.mint(3),
+                _test_currency.mint(4)])
+
+        assert accumulator.total == _test_currency.mint(3)
+
+    def test_sum_and_merge(self):
+        """The builtin sum must work with an accumulator as the start
+        value, and accumulators must be combinable.
+        """
+        monies = [_test_currency.mint(amount) for amount in range(5)]
+        start = MoneyAccumulator()
+        result = sum(monies, start)
+
+        assert isinstance(result, MoneyAccumulator)
+        assert result.total == _test_currency.mint(10)
+        # This must not have mutated the start value
+        assert start.currency is None
+
+        result += MoneyAccumulator(monies)
+        assert result.total == _test_currency.mint(20)
+        result -= MoneyAccumulator()
+        assert result.total == _test_currency.mint(20)
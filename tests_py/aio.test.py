@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import asyncio
+from decimal import ROUND_DOWN
+from decimal import Decimal
+
+import pytest
+
+from finnr._types import Singleton
+from finnr.aio import aggregate
+from finnr.aio import batched
+from finnr.aio import convert
+from finnr.aio import mint
+from finnr.aio import parse
+from finnr.aio import quantize
+from finnr.aio import unbatched
+from finnr.currency import Currency
+from finnr.currency import CurrencySet
+from finnr.exceptions import MoneyParseError
+from finnr.fx import RateTable
+from finnr.parsing import MoneyParser
+
+_eur = Currency(
+    code_alpha3='EUR',
+    code_num=978,
+    minor_unit_denominator=100,
+    entities=frozenset(),
+    name='Euro',
+    approx_active_from=Singleton.UNKNOWN,
+    approx_active_until=None,)
+_usd = Currency(
+    code_alpha3='USD',
+    code_num=840,
+    minor_unit_denominator=100,
+    entities=frozenset(),
+    name='US Dollar',
+    approx_active_from=Singleton.UNKNOWN,
+    approx_active_until=None,)
+_mint = CurrencySet({_eur, _usd})
+
+
+async def _source[T](items: list[T], error: Exception | None = None):
+    for item in items:
+        # Give the consumer a chance to run, like a real source would
+        await asyncio.sleep(0)
+        yield item
+
+    if error is not None:
+        raise error
+
+
+async def _collect(source):
+    return [item async for item in source]
+
+
+class TestBatched:
+
+    def test_batch_sizes(self):
+        """Batches must preserve order and respect the max size."""
+        batches = asyncio.run(_collect(
+            batched(_source(list(range(10))), max_size=3)))
+        assert all(1 <= len(batch) <= 3 for batch in batches)
+        assert [item for batch in batches for item in batch] == list(
+            range(10))
+
+    def test_source_error(self):
+        """Source errors must be raised after the preceding items."""
+        received = []
+
+        async def consume():
+            async for batch in batched(
+                _source([1, 2], RuntimeError('boom'))
+            ):
+                received.extend(batch)
+
+        with pytest.raises(RuntimeError):
+            asyncio.run(consume())
+        assert received == [1, 2]
+
+    def test_unbatched(self):
+        """Unbatching must flatten the batches back into items."""
+        items = asyncio.run(_collect(unbatched(batched(
+            _source(['a', 'b', 'c']), max_size=2))))
+        assert items == ['a', 'b', 'c']
+
+
+class TestPipeline:
+
+    def test_parse_to_aggregate(self):
+        """A full pipeline must parse, quantize, convert, and total
+        the stream, reporting bad items without stopping.
+        """
+        errors = []
+        texts = ['1.0099 EUR', 'USD 2', 'garbage', '€3,5', 'USD 0.0099']
+
+        bag = asyncio.run(aggregate(convert(
+            quantize(
+                parse(
+                    batched(_source(texts), max_size=2),
+                    MoneyParser(_mint),
+                    on_error=lambda text, exc: errors.append(text)),
+                rounding=ROUND_DOWN),
+            RateTable({(_eur, _usd): Decimal(2)}),
+            _eur)))
+
+        assert bag[_eur] == _eur.mint('5.50')
+        assert _usd not in bag
+        assert errors == ['garbage']
+
+    def test_parse_raises(self):
+        """Without an error callback, bad items must raise."""
+        with pytest.raises(MoneyParseError):
+            asyncio.run(_collect(parse(
+                batched(_source(['garbage'])), MoneyParser(_mint))))
+
+    def test_mint(self):
+        """Minting must convert amount and code pairs in order."""
+        errors = []
+        batches = asyncio.run(_collect(mint(
+            batched(_source([
+                ('1.5', 'EUR'), ('2', 'XXX'), (Decimal(3), 'usd')])),
+            _mint,
+            on_error=lambda pair, exc: errors.append(pair))))
+
+        assert [money for batch in batches for money in batch] == [
+            _eur.mint('1.5'), _usd.mint(3)]
+        assert errors == [('2', 'XXX')]
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from decimal import Decimal
+
+import pytest
+
+from finnr._types import Singleton
+from finnr.codec import RECORD_SIZE
+from finnr.codec import MoneyCodec
+from finnr.currency import Currency
+from finnr.currency import CurrencySet
+
+_eur = Currency(
+    code_alpha3='EUR',
+    code_num=978,
+    minor_unit_denominator=100,
+    entities=frozenset(),
+    name='Euro',
+    approx_active_from=Singleton.UNKNOWN,
+    approx_active_until=None,)
+_mga = Currency(
+    code_alpha3='MGA',
+    code_num=969,
+    minor_unit_denominator=5,
+    entities=frozenset(),
+    name='Malagasy Ariary',
+    approx_active_from=Singleton.UNKNOWN,
+    approx_active_until=None,)
+_mint = CurrencySet({_eur, _mga})
+
+
+class TestMoneyCodec:
+
+    def test_roundtrip(self):
+        """Encoding and decoding must be exact, preserving the amount,
+        its exponent, the currency instance, and the order.
+        """
+        codec = MoneyCodec(_mint)
+        monies = [
+            _eur.mint('12.34'),
+            _mga.mint('-0.2'),
+            _eur.mint('1E+3'),
+            _eur.mint('0.000001'),
+            _eur.mint(0),
+            _mga.mint('9223372036854775807'),]
+        payload = codec.encode_many(monies)
+        assert len(payload) == RECORD_SIZE * len(monies)
+
+        decoded = codec.decode_many(memoryview(payload))
+        assert decoded == monies
+        assert [money.amount.as_tuple() for money in decoded] == [
+            money.amount.as_tuple() for money in monies]
+        assert decoded[1].currency is _mga
+
+        assert codec.decode(codec.encode(monies[0])) == monies[0]
+
+    def test_unencodable(self):
+        """Unknown currencies and oversized amounts must raise."""
+        codec = MoneyCodec(CurrencySet({_eur}))
+        with pytest.raises(KeyError):
+            codec.encode(_mga.mint(1))
+        with pytest.raises(OverflowError):
+            codec.encode(_eur.mint('9223372036854775808'))
+        with pytest.raises(ValueError):
+            codec.encode(_eur.mint(Decimal('NaN')))
+
+    def test_bad_data(self):
+        """Truncated data and unknown codes must raise."""
+        codec = MoneyCodec(CurrencySet({_eur}))
+        payload = MoneyCodec(_mint).encode(_mga.mint(1))
+        with pytest.raises(KeyError):
+            codec.decode_many(payload)
+        with pytest.raises(ValueError):
+            codec.decode_many(payload[:-1])
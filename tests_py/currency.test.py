@@ -1,12 +1,27 @@
 from __future__ import annotations
 
+import pickle
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import date
+from decimal import ROUND_DOWN
+from decimal import ROUND_HALF_UP
 from decimal import Decimal
+from decimal import localcontext
 
+import pytest
+
+from finnr._registry import _registry
+from finnr._registry import _registry_lock
 from finnr._types import Singleton
 from finnr.currency import Currency
 from finnr.currency import CurrencySet
 from finnr.currency import heal_float
+from finnr.exceptions import MoneyRequired
+from finnr.exceptions import ScalarRequired
+from finnr.money import MinorUnitMoney
 from finnr.money import Money
 
 
@@ -35,6 +50,81 @@ class TestCurrency:
         assert not currency.is_active
 
 
+    def test_context(self):
+        """Contexts must be cached per rounding mode, and carry that
+        rounding mode.
+        """
+        currency = Currency(
+            code_alpha3='EUR',
+            code_num=978,
+            minor_unit_denominator=100,
+            entities=frozenset(),
+            name='Euro',
+            approx_active_from=Singleton.UNKNOWN,
+            approx_active_until=None,)
+
+        context = currency.context()
+        assert context.rounding == ROUND_HALF_UP
+        assert context.prec == 28
+        assert currency.context() is context
+        assert currency.context(ROUND_DOWN).rounding == ROUND_DOWN
+        assert currency.context(ROUND_DOWN) is not context
+
+    def test_quantization_ignores_thread_context(self):
+        """Quantizing while minting must not depend on the precision of
+        the thread's decimal context.
+        """
+        currency = Currency(
+            code_alpha3='MGA',
+            code_num=969,
+            minor_unit_denominator=5,
+            entities=frozenset(),
+            name='Malagasy Ariary',
+            approx_active_from=Singleton.UNKNOWN,
+            approx_active_until=None,)
+
+        with localcontext(prec=2):
+            result = currency.mint('123.45', quantize_to_minor=True)
+
+        assert result.amount == Decimal('123.6')
+
+    def test_quantization_respects_higher_thread_precision(self):
+        """If the thread's decimal context has a higher precision than
+        the default, quantizing must use it, for both decimal and
+        non-decimal currencies.
+        """
+        eur = Currency(
+            code_alpha3='EUR',
+            code_num=978,
+            minor_unit_denominator=100,
+            entities=frozenset(),
+            name='Euro',
+            approx_active_from=Singleton.UNKNOWN,
+            approx_active_until=None,)
+        mga = Currency(
+            code_alpha3='MGA',
+            code_num=969,
+            minor_unit_denominator=5,
+            entities=frozenset(),
+            name='Malagasy Ariary',
+            approx_active_from=Singleton.UNKNOWN,
+            approx_active_until=None,)
+        large_amount = '1' + '0' * 30 + '.123'
+
+        with localcontext(prec=50):
+            assert eur.context().prec == 50
+            eur_minted = eur.mint(large_amount, quantize_to_minor=True)
+            eur_rounded = eur.mint(large_amount).round_to_minor()
+            mga_minted = mga.mint(large_amount, quantize_to_minor=True)
+            mga_rounded = mga.mint(large_amount).round_to_minor()
+
+        assert eur_minted.amount == Decimal('1' + '0' * 30 + '.12')
+        assert eur_rounded.amount == eur_minted.amount
+        assert mga_minted.amount == Decimal('1' + '0' * 30 + '.2')
+        assert mga_rounded.amount == mga_minted.amount
+        assert eur.context().prec == 28
+
+
 class TestCurrencySet:
 
     def test_minting_plain(self):
@@ -99,6 +189,76 @@ class TestCurrencySet:
         result = mint('3.1415', 'MGA', quantize_to_minor=True)
         assert result.amount == Decimal('3.2')
 
+    def test_minting_quantization_nondecimal_exact(self):
+        """Quantizing non-decimal currencies must give exactly the same
+        decimal representation (including the exponent and the sign of
+        zero) from both mint and mint_many.
+        """
+        mint = CurrencySet({Currency(
+            code_alpha3='MGA',
+            code_num=969,
+            minor_unit_denominator=5,
+            entities=frozenset(),
+            name='Malagasy Ariary',
+            approx_active_from=Singleton.UNKNOWN,
+            approx_active_until=None,)})
+        amounts = ['-0.04', '0.5', '1.00', '0.25', '-7.1']
+        expected = {
+            ROUND_HALF_UP: ['-0', '0.6', '1', '0.4', '-7.2'],
+            ROUND_DOWN: ['-0', '0.4', '1', '0.2', '-7'],}
+
+        for rounding, expected_amounts in expected.items():
+            results = [
+                mint(amount, 'MGA', quantize_to_minor=True, rounding=rounding)
+                for amount in amounts]
+            many_results = mint.mint_many(
+                amounts,
+                ['MGA'] * len(amounts),
+                quantize_to_minor=True,
+                rounding=rounding)
+
+            assert [str(result.amount) for result in results] == (
+                expected_amounts)
+            assert [str(result.amount) for result in many_results] == (
+                expected_amounts)
+
+    def test_mint_many(self):
+        """Minting many must produce identical results to minting each
+        amount individually, regardless of the amount types.
+        """
+        mint = CurrencySet({
+            Currency(
+                code_alpha3='EUR',
+                code_num=978,
+                minor_unit_denominator=100,
+                entities=frozenset(),
+                name='Euro',
+                approx_active_from=Singleton.UNKNOWN,
+                approx_active_until=None,),
+            Currency(
+                code_alpha3='MGA',
+                code_num=969,
+                minor_unit_denominator=5,
+                entities=frozenset(),
+                name='Malagasy Ariary',
+                approx_active_from=Singleton.UNKNOWN,
+                approx_active_until=None,)})
+        amounts = ['3.1415', 3.14, Decimal('-2.05'), 7, '0.1']
+        codes = ['EUR', 'mga', 'EUR', 'MGA', 'eur']
+
+        for quantize_to_minor in (False, True):
+            results = mint.mint_many(
+                amounts, codes, quantize_to_minor=quantize_to_minor)
+            expected = [
+                mint(amount, code, quantize_to_minor=quantize_to_minor)
+                for amount, code in zip(amounts, codes, strict=True)]
+            assert results == expected
+            assert [result.amount.as_tuple() for result in results] == [
+                result.amount.as_tuple() for result in expected]
+
+        assert mint.mint_many(['1', '2'], ['EUR', 'EUR']) == [
+            mint(1, 'EUR'), mint(2, 'EUR')]
+
     def test_get_alpha(self):
         """Getting via the alpha must return the correct currency.
         """
@@ -203,6 +363,63 @@ class TestCurrencySet:
         assert result_nodate is currency3
         assert result_dated is currency4
 
+    def test_get_many(self):
+        """Getting many must return the same results as getting each
+        individually, including resolving numeric codes by date.
+        """
+        currency1 = Currency(
+            code_alpha3='EUR',
+            code_num=978,
+            minor_unit_denominator=100,
+            entities=frozenset(),
+            name='Euro',
+            approx_active_from=Singleton.UNKNOWN,
+            approx_active_until=None,)
+        currency2 = Currency(
+            code_alpha3='ZRN',
+            code_num=180,
+            minor_unit_denominator=100,
+            entities=frozenset({
+                'AO'}),
+            name='New Zaire',
+            approx_active_from=date(1993, 1, 1),
+            approx_active_until=date(1999, 6, 30),)
+        currency3 = Currency(
+            code_alpha3='ZRZ',
+            code_num=180,
+            minor_unit_denominator=100,
+            entities=frozenset({
+                'AO'}),
+            name='Zaire',
+            approx_active_from=date(1967, 1, 1),
+            approx_active_until=date(1994, 2, 28),)
+        mint = CurrencySet({currency1, currency2, currency3})
+        codes = ['eur', 180, 180, 180, 180, 180, 999]
+        dates = [
+            date(2000, 1, 1),
+            date(1960, 1, 1),
+            date(1967, 1, 1),
+            date(1993, 6, 1),
+            date(1999, 6, 30),
+            date(1999, 7, 1),
+            date(2000, 1, 1),]
+
+        results = mint.get_many(codes, dates)
+
+        assert results == [
+            currency1, None, currency3, currency2, currency2, None, None]
+        assert results == [
+            mint.get(code, on_date=on_date)  # type: ignore
+            for code, on_date in zip(codes, dates, strict=True)]
+        assert mint.get_many([180, 'EUR']) == [currency2, currency1]
+
+        # Non-integer numbers must raise, just like with ``get``, even if
+        # they compare equal to a known numeric code.
+        with pytest.raises(TypeError):
+            mint.get(978.0, on_date=date(2000, 1, 1))  # type: ignore
+        with pytest.raises(TypeError):
+            mint.get_many([978.0], [date(2000, 1, 1)])  # type: ignore
+
 
 def test_heal_float():
     """heal_float must produce expected results.
@@ -212,3 +429,252 @@ def test_heal_float():
     gooddec = Decimal('3.14')
     assert badfloat != gooddec
     assert heal_float(badfloat) == gooddec
+
+
+class TestFixedPoint:
+
+    def test_mint_aligned(self):
+        """Minting a minor-unit-aligned amount with fixed_point=True
+        must return an exact MinorUnitMoney.
+        """
+        currency = Currency(
+            code_alpha3='EUR',
+            code_num=978,
+            minor_unit_denominator=100,
+            entities=frozenset(),
+            name='Euro',
+            approx_active_from=Singleton.UNKNOWN,
+            approx_active_until=None,)
+        result = currency.mint('12.30', fixed_point=True)
+
+        assert isinstance(result, MinorUnitMoney)
+        assert result.minor_units == 1230
+        assert result.amount == Decimal('12.3')
+        assert result == currency.mint('12.3')
+
+    def test_mint_fallback(self):
+        """Minting an amount with precision below the minor unit must
+        fall back to a Decimal-backed Money.
+        """
+        currency = Currency(
+            code_alpha3='EUR',
+            code_num=978,
+            minor_unit_denominator=100,
+            entities=frozenset(),
+            name='Euro',
+            approx_active_from=Singleton.UNKNOWN,
+            approx_active_until=None,)
+        result = currency.mint('12.345', fixed_point=True)
+
+        assert isinstance(result, Money)
+        assert result.amount == Decimal('12.345')
+
+    def test_nondecimal(self):
+        """Fixed-point amounts must work for non-decimal minor units.
+        """
+        currency = Currency(
+            code_alpha3='MGA',
+            code_num=969,
+            minor_unit_denominator=5,
+            entities=frozenset(),
+            name='Malagasy Ariary',
+            approx_active_from=Singleton.UNKNOWN,
+            approx_active_until=None,)
+        result = currency.mint('3.4', fixed_point=True)
+        assert isinstance(result, MinorUnitMoney)
+        assert result.minor_units == 17
+
+        fallback = currency.mint('3.1', fixed_point=True)
+        assert isinstance(fallback, Money)
+
+    def test_math(self):
+        """Math between fixed-point amounts must be exact, and fall back
+        to Money when it can no longer be fixed-point.
+        """
+        currency = Currency(
+            code_alpha3='EUR',
+            code_num=978,
+            minor_unit_denominator=100,
+            entities=frozenset(),
+            name='Euro',
+            approx_active_from=Singleton.UNKNOWN,
+            approx_active_until=None,)
+        money1 = currency.mint_minor_units(150)
+        money2 = currency.mint_minor_units(25)
+
+        assert (money1 + money2) == currency.mint_minor_units(175)
+        difference = money1 - money2
+        assert isinstance(difference, MinorUnitMoney)
+        assert difference.minor_units == 125
+        product = money1 * 3
+        assert isinstance(product, MinorUnitMoney)
+        assert product.minor_units == 450
+        assert money1.compare(money2) == Decimal(1)
+        assert money1 / money2 == Decimal(6)
+
+        halved = money2 * Decimal('0.5')
+        assert isinstance(halved, Money)
+        assert halved.amount == Decimal('0.125')
+        assert money1 + currency.mint('0.001') == currency.mint('1.501')
+
+    def test_mixed_math(self):
+        """Math between Money and MinorUnitMoney must work with either
+        one on the left, and non-monies must be rejected with finnr
+        exceptions.
+        """
+        currency = Currency(
+            code_alpha3='EUR',
+            code_num=978,
+            minor_unit_denominator=100,
+            entities=frozenset(),
+            name='Euro',
+            approx_active_from=Singleton.UNKNOWN,
+            approx_active_until=None,)
+        money = currency.mint('10')
+        fixed = currency.mint_minor_units(400)
+
+        assert money / fixed == Decimal('2.5')
+        assert fixed / money == Decimal('0.4')
+        assert money // fixed == Decimal(2)
+        assert money % fixed == currency.mint('2')
+        assert divmod(money, fixed) == (Decimal(2), currency.mint('2'))
+        assert money + fixed == currency.mint('14')
+        assert fixed - money == currency.mint('-6')
+        assert money.compare(fixed) == Decimal(1)
+        assert fixed.compare(money) == Decimal(-1)
+
+        with pytest.raises(ScalarRequired):
+            _ = money / 'foo'  # type: ignore[operator]
+        with pytest.raises(ScalarRequired):
+            _ = divmod(money, 2.5)  # type: ignore[operator]
+        with pytest.raises(MoneyRequired):
+            fixed.compare(Decimal(1))  # type: ignore[arg-type]
+
+
+class TestCurrencyIdentity:
+
+    def test_equality_and_hash(self):
+        """Equal currencies must compare equal and hash the same, even
+        if they aren't the same instance.
+        """
+        currency1 = Currency(
+            code_alpha3='EUR',
+            code_num=978,
+            minor_unit_denominator=100,
+            entities=frozenset(),
+            name='Euro',
+            approx_active_from=Singleton.UNKNOWN,
+            approx_active_until=None,)
+        currency2 = Currency(
+            code_alpha3='EUR',
+            code_num=978,
+            minor_unit_denominator=100,
+            entities=frozenset(),
+            name='Other euro',
+            approx_active_from=Singleton.UNKNOWN,
+            approx_active_until=None,)
+        currency3 = Currency(
+            code_alpha3='EUR',
+            code_num=1,
+            minor_unit_denominator=100,
+            entities=frozenset(),
+            name='Euro',
+            approx_active_from=Singleton.UNKNOWN,
+            approx_active_until=None,)
+
+        assert currency1 == currency2
+        assert not currency1 != currency2
+        assert hash(currency1) == hash(currency2)
+        assert currency1 != currency3
+
+    def test_intern(self):
+        """Interning a currency must return the canonical instance from
+        the currency set.
+        """
+        canonical = Currency(
+            code_alpha3='EUR',
+            code_num=978,
+            minor_unit_denominator=100,
+            entities=frozenset(),
+            name='Euro',
+            approx_active_from=Singleton.UNKNOWN,
+            approx_active_until=None,)
+        mint = CurrencySet({canonical})
+        duplicate = pickle.loads(pickle.dumps(canonical))  # noqa: S301
+
+        assert duplicate is not canonical
+        assert duplicate == canonical
+        assert mint.intern(duplicate) is canonical
+
+    def test_pickle_by_reference(self):
+        """Currencies and monies from a registered currency set must be
+        pickled by reference, unpickling to the canonical instance.
+        """
+        kwargs = {
+            'code_alpha3': 'EUR',
+            'code_num': 978,
+            'minor_unit_denominator': 100,
+            'entities': frozenset({'AT', 'BE', 'DE', 'FR'}),
+            'name': 'Euro',
+            'approx_active_from': date(1999, 1, 1),
+            'approx_active_until': None,}
+        unregistered = Currency(**kwargs)
+        canonical = Currency(**kwargs)
+        mint = CurrencySet({canonical})
+        registry_id = 'tests_py.currency:_test_pickle_mint'
+
+        with _unregistered_afterwards(registry_id):
+            mint.register(registry_id)
+
+            by_value = pickle.dumps(unregistered.mint('1.23'))
+            by_reference = pickle.dumps(canonical.mint('1.23'))
+            assert len(by_reference) < len(by_value)
+
+            money = pickle.loads(by_reference)  # noqa: S301
+            assert money == canonical.mint('1.23')
+            assert money.currency is canonical
+            assert pickle.loads(  # noqa: S301
+                pickle.dumps(canonical)) is canonical
+
+    def test_concurrent_register(self):
+        """Registering the same currency set from many threads at once
+        must neither raise nor leave currencies unregistered.
+        """
+        mint = CurrencySet({
+            Currency(
+                code_alpha3=f'X{index:02}',
+                code_num=900 + index,
+                minor_unit_denominator=100,
+                entities=frozenset(),
+                name='Test',
+                approx_active_from=Singleton.UNKNOWN,
+                approx_active_until=None,)
+            for index in range(50)})
+        barrier = threading.Barrier(8)
+        registry_id = 'tests_py.currency:_test_concurrent_mint'
+
+        def register():
+            barrier.wait()
+            mint.register(registry_id)
+
+        with _unregistered_afterwards(registry_id):
+            with ThreadPoolExecutor(8) as executor:
+                for future in [executor.submit(register) for _ in range(8)]:
+                    future.result()
+
+            for currency in mint:
+                assert pickle.loads(  # noqa: S301
+                    pickle.dumps(currency)) is currency
+
+
+@contextmanager
+def _unregistered_afterwards(registry_id: str) -> Iterator[None]:
+    """Removes the registry ID from the currency set registry on exit,
+    so that the registration doesn't leak into other tests (or into a
+    second run of the same test within the same process).
+    """
+    try:
+        yield
+    finally:
+        with _registry_lock:
+            _registry.pop(registry_id, None)
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+from datetime import date
+from decimal import ROUND_DOWN
+from decimal import Decimal
+
+import pytest
+
+from finnr._types import Singleton
+from finnr.currency import Currency
+from finnr.fx import RateHistory
+from finnr.fx import RateTable
+
+_eur = Currency(
+    code_alpha3='EUR',
+    code_num=978,
+    minor_unit_denominator=100,
+    entities=frozenset(),
+    name='Euro',
+    approx_active_from=Singleton.UNKNOWN,
+    approx_active_until=None,)
+_usd = Currency(
+    code_alpha3='USD',
+    code_num=840,
+    minor_unit_denominator=100,
+    entities=frozenset(),
+    name='US Dollar',
+    approx_active_from=Singleton.UNKNOWN,
+    approx_active_until=None,)
+_chf = Currency(
+    code_alpha3='CHF',
+    code_num=756,
+    minor_unit_denominator=100,
+    entities=frozenset(),
+    name='Swiss Franc',
+    approx_active_from=Singleton.UNKNOWN,
+    approx_active_until=None,)
+_jpy = Currency(
+    code_alpha3='JPY',
+    code_num=392,
+    minor_unit_denominator=1,
+    entities=frozenset(),
+    name='Yen',
+    approx_active_from=Singleton.UNKNOWN,
+    approx_active_until=None,)
+
+
+def _make_table():
+    return RateTable(
+        {
+            (_eur, _usd): Decimal('1.08'),
+            (_eur, _chf): Decimal('0.94'),
+            (_jpy, _eur): Decimal('0.0062'),},
+        pivot=_eur)
+
+
+class TestRateTable:
+
+    def test_rate_resolution(self):
+        """Rates must resolve directly, inverted, and triangulated
+        through the pivot.
+        """
+        table = _make_table()
+        assert table.get_rate(_eur, _usd) == Decimal('1.08')
+        assert table.get_rate(_usd, _eur) == Decimal(1) / Decimal('1.08')
+        assert table.get_rate(_usd, _chf) == (
+            Decimal(1) / Decimal('1.08')) * Decimal('0.94')
+        assert table.get_rate(_chf, _chf) == Decimal(1)
+
+    def test_memoization(self):
+        """Calculated rates must be memoized until the rates change."""
+        table = _make_table()
+        rate = table.get_rate(_usd, _chf)
+        assert table.get_rate(_usd, _chf) is rate
+
+        table.set_rate(_usd, _chf, Decimal('0.9'))
+        assert table.get_rate(_usd, _chf) == Decimal('0.9')
+        assert table.get_rate(_chf, _usd) == Decimal(1) / Decimal('0.9')
+
+    def test_convert(self):
+        """Conversions must quantize to the target's minor unit."""
+        table = _make_table()
+        assert table.convert(_usd.mint(100), _chf) == _chf.mint('87.04')
+        assert table.convert(
+            _usd.mint(100), _chf, rounding=ROUND_DOWN) == _chf.mint('87.03')
+        assert table.convert(_eur.mint(10), _jpy) == _jpy.mint(1613)
+        assert table.convert(
+            _eur.mint(10), _jpy, quantize_to_minor=False
+        ).amount == Decimal(10) / Decimal('0.0062')
+        assert table.convert(_chf.mint('1.005'), _chf) == _chf.mint('1.01')
+
+    def test_convert_many(self):
+        """Batch conversion must match converting one at a time."""
+        table = _make_table()
+        monies = [
+            _usd.mint(100), _eur.mint('3.333'), _chf.mint(7), _usd.mint(1)]
+        assert table.convert_many(monies, _chf) == [
+            table.convert(money, _chf) for money in monies]
+
+    def test_missing_rate(self):
+        """Missing rates must raise, as must invalid ones."""
+        table = RateTable({(_eur, _usd): Decimal('1.08')})
+        with pytest.raises(KeyError):
+            table.convert(_usd.mint(1), _chf)
+        with pytest.raises(ValueError):
+            table.set_rate(_eur, _chf, Decimal(0))
+
+
+class TestRateHistory:
+
+    def _make_history(self):
+        history = RateHistory(pivot=_eur)
+        history.update([
+            (_eur, _usd, date(2025, 1, 1), Decimal('1.00')),
+            (_eur, _usd, date(2025, 2, 1), Decimal('1.10')),
+            (_eur, _chf, date(2025, 1, 15), Decimal('0.90')),])
+        return history
+
+    def test_as_of(self):
+        """Rates must be the most recent on or before the date, and
+        raise before the first rate.
+        """
+        history = self._make_history()
+        assert history.get_rate(
+            _eur, _usd, date(2025, 1, 31)) == Decimal('1.00')
+        assert history.get_rate(
+            _eur, _usd, date(2025, 2, 1)) == Decimal('1.10')
+        assert history.get_rate(
+            _usd, _eur, date(2030, 1, 1)) == Decimal(1) / Decimal('1.10')
+        assert history.get_rate(
+            _usd, _chf, date(2025, 1, 20)) == Decimal('0.90')
+
+        with pytest.raises(KeyError):
+            history.get_rate(_usd, _chf, date(2025, 1, 10))
+
+        history.set_rate(_eur, _usd, date(2025, 1, 1), Decimal('1.05'))
+        assert history.get_rate(
+            _eur, _usd, date(2025, 1, 1)) == Decimal('1.05')
+
+    def test_convert_many(self):
+        """The bulk as-of join must match converting one at a time."""
+        history = self._make_history()
+        monies = [_eur.mint(10), _usd.mint(5), _eur.mint(1), _chf.mint(3)]
+        dates = [
+            date(2025, 1, 20),
+            date(2025, 3, 1),
+            date(2025, 2, 1),
+            date(2025, 1, 16),]
+
+        converted = history.convert_many(monies, _usd, dates)
+        assert converted == [
+            history.convert(money, _usd, on_date)
+            for money, on_date in zip(monies, dates, strict=True)]
+        assert converted[0] == _usd.mint(10)
+        assert converted[2] == _usd.mint('1.10')
+
+    def test_snapshot(self):
+        """Snapshots must contain the rates as of their date."""
+        table = self._make_history().as_of(date(2025, 1, 20))
+        assert table.get_rate(_eur, _usd) == Decimal('1.00')
+        assert table.convert(_usd.mint(10), _chf) == _chf.mint(9)
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import io
+from decimal import Decimal
+from itertools import chain
+
+import pytest
+
+from finnr._types import Singleton
+from finnr.currency import Currency
+from finnr.currency import CurrencySet
+from finnr.io import RowError
+from finnr.io import read_money_csv
+from finnr.io import read_money_rows
+
+_eur = Currency(
+    code_alpha3='EUR',
+    code_num=978,
+    minor_unit_denominator=100,
+    entities=frozenset(),
+    name='Euro',
+    approx_active_from=Singleton.UNKNOWN,
+    approx_active_until=None,)
+_usd = Currency(
+    code_alpha3='USD',
+    code_num=840,
+    minor_unit_denominator=100,
+    entities=frozenset(),
+    name='US Dollar',
+    approx_active_from=Singleton.UNKNOWN,
+    approx_active_until=None,)
+_mint = CurrencySet({_eur, _usd})
+
+
+class TestReadMoneyRows:
+
+    def test_chunking(self):
+        """Rows must be converted in order, in chunks of at most the
+        chunk size.
+        """
+        rows = [['1.5', 'EUR'], ['2', 'usd'], ['3', 'EUR']]
+        chunks = list(read_money_rows(
+            rows,
+            mint=_mint,
+            amount_column=0,
+            currency_column=1,
+            chunk_size=2))
+
+        assert [len(chunk) for chunk in chunks] == [2, 1]
+        assert list(chain.from_iterable(chunks)) == [
+            _mint('1.5', 'EUR'), _mint(2, 'USD'), _mint(3, 'EUR')]
+
+    def test_bad_rows_reported(self):
+        """Bad rows must be passed to on_error and skipped, without
+        aborting the rest of the conversion.
+        """
+        rows = [
+            ['currency', 'amount'],
+            ['EUR', '1'],
+            ['XXX', '2'],
+            ['EUR', 'nope'],
+            ['USD'],
+            ['USD', '5']]
+        errors: list[RowError] = []
+        monies = list(chain.from_iterable(read_money_rows(
+            rows,
+            mint=_mint,
+            amount_column='amount',
+            currency_column='currency',
+            on_error=errors.append)))
+
+        assert monies == [_mint(1, 'EUR'), _mint(5, 'USD')]
+        assert [error.row_number for error in errors] == [3, 4, 5]
+        assert isinstance(errors[0].exception, KeyError)
+
+    def test_bad_rows_raise(self):
+        """Without an on_error callback, bad rows must raise."""
+        with pytest.raises(KeyError):
+            list(read_money_rows(
+                [['1', 'XXX']],
+                mint=_mint,
+                amount_column=0,
+                currency_column=1))
+
+
+def test_read_money_csv():
+    """Reading from a CSV file must resolve named columns and pass
+    through CSV formatting options.
+    """
+    source = io.StringIO(
+        'date;amount;currency\n'
+        + '2025-01-01;12.34;EUR\n'
+        + '2025-01-02;-5;USD\n')
+    monies = list(chain.from_iterable(read_money_csv(
+        source,
+        mint=_mint,
+        amount_column='amount',
+        currency_column='currency',
+        delimiter=';')))
+
+    assert [money.amount for money in monies] == [
+        Decimal('12.34'), Decimal(-5)]
+    assert [money.currency for money in monies] == [_eur, _usd]
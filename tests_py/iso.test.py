@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import pickle
+
+import pytest
+
 from finnr.currency import CurrencySet
 from finnr.iso import mint
 
@@ -35,3 +39,21 @@ class TestMint:
         assert isinstance(usd_alpha.name, str)
         assert 'dollar' in usd_alpha.name.lower()
         assert usd_alpha.minor_unit_denominator == 100
+
+    def test_lazy_mint_cached(self):
+        """The lazily-constructed mint must only be constructed once,
+        and other missing attributes must still raise.
+        """
+        import finnr.iso  # noqa: PLC0415
+
+        assert finnr.iso.mint is mint
+        with pytest.raises(AttributeError):
+            finnr.iso.foo  # type: ignore # noqa: B018
+
+
+def test_pickle_by_reference():
+    """ISO currencies must unpickle to the canonical instances."""
+    eur = mint.get('EUR')
+    assert pickle.loads(pickle.dumps(eur)) is eur  # noqa: S301
+    money = pickle.loads(pickle.dumps(mint(1, 'EUR')))  # noqa: S301
+    assert money.currency is eur
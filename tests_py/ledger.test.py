@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import IO
+
+import pytest
+
+from finnr._types import Singleton
+from finnr.currency import Currency
+from finnr.currency import CurrencySet
+from finnr.ledger import LedgerReader
+from finnr.ledger import LedgerWriter
+
+_eur = Currency(
+    code_alpha3='EUR',
+    code_num=978,
+    minor_unit_denominator=100,
+    entities=frozenset(),
+    name='Euro',
+    approx_active_from=Singleton.UNKNOWN,
+    approx_active_until=None,)
+_usd = Currency(
+    code_alpha3='USD',
+    code_num=840,
+    minor_unit_denominator=100,
+    entities=frozenset(),
+    name='US Dollar',
+    approx_active_from=Singleton.UNKNOWN,
+    approx_active_until=None,)
+_mint = CurrencySet({_eur, _usd})
+
+
+class TestLedger:
+
+    def test_roundtrip(self, tmp_path):
+        """Rows must be read back exactly and in order, including rows
+        appended by a second writer.
+        """
+        path = tmp_path / 'ledger.fnl'
+        monies = [_eur.mint('1.25'), _usd.mint(-3), _eur.mint('0.0001')]
+        with LedgerWriter(path) as writer:
+            writer.append_many(monies)
+        with LedgerWriter(path, exponent=-4) as writer:
+            writer.append(_usd.mint('2.5'))
+
+        with LedgerReader(path, mint=_mint) as reader:
+            assert len(reader) == 4
+            assert reader.currencies == (_eur, _usd)
+            assert list(reader) == [*monies, _usd.mint('2.5')]
+            assert reader[-1] == _usd.mint('2.5')
+            assert reader[1].currency is _usd
+
+    def test_totals_and_select(self, tmp_path):
+        """Totals and selections must be computed from the mapped rows.
+        """
+        path = tmp_path / 'ledger.fnl'
+        with LedgerWriter(path, exponent=-2) as writer:
+            writer.append_many([
+                _eur.mint('1.25'),
+                _usd.mint(10),
+                _eur.mint('-0.5'),
+                _usd.mint('0.01'),])
+
+        with LedgerReader(path, mint=_mint) as reader:
+            assert reader.total(_eur) == _eur.mint('0.75')
+            totals = reader.totals()
+            assert totals[_usd] == _usd.mint('10.01')
+            assert totals[_eur] == _eur.mint('0.75')
+
+            assert reader.select(_usd) == [1, 3]
+            assert reader.select(min_amount=Decimal('1.251')) == [1]
+            assert reader.select(
+                _eur, max_amount=Decimal(0)) == [2]
+            assert reader.select(max_amount=Decimal(100)) == [0, 1, 2, 3]
+
+    def test_inexact(self, tmp_path):
+        """Amounts that can't be stored exactly must raise, without
+        corrupting the ledger.
+        """
+        path = tmp_path / 'ledger.fnl'
+        with LedgerWriter(path, exponent=-2) as writer:
+            with pytest.raises(ValueError):
+                writer.append_many([_usd.mint(1), _eur.mint('0.001')])
+            writer.append(_eur.mint(1))
+
+        with LedgerReader(path, mint=_mint) as reader:
+            assert list(reader) == [_eur.mint(1)]
+
+        with pytest.raises(ValueError):
+            LedgerWriter(path, exponent=-4)
+
+    def test_invalid_existing_file(self, tmp_path, monkeypatch):
+        """Opening an existing file that isn't a valid ledger must raise,
+        and must close the file.
+        """
+        opened: list[IO[bytes]] = []
+
+        def recording_open(*args, **kwargs):
+            file = open(*args, **kwargs)
+            opened.append(file)
+            return file
+
+        monkeypatch.setattr(
+            'finnr.ledger.open', recording_open, raising=False)
+        empty_path = tmp_path / 'empty.fnl'
+        empty_path.write_bytes(b'')
+        corrupt_path = tmp_path / 'corrupt.fnl'
+        corrupt_path.write_bytes(b'not a ledger' * 1000)
+
+        for path in (empty_path, corrupt_path):
+            with pytest.raises(ValueError):
+                LedgerWriter(path)
+
+        assert len(opened) == 2
+        assert all(file.closed for file in opened)
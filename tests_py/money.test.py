@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+import pickle
+from decimal import ROUND_DOWN
+from decimal import ROUND_HALF_EVEN
+from decimal import Decimal
+
+import pytest
+
+from finnr._types import Singleton
+from finnr.currency import Currency
+from finnr.exceptions import MismatchedCurrency
+from finnr.exceptions import MoneyRequired
+from finnr.exceptions import ScalarRequired
+from finnr.money import FrozenMoney
+from finnr.money import Money
+from finnr.money import allocate_many
+from finnr.money import round_many_to_major
+from finnr.money import round_many_to_minor
+
+_test_currency = Currency(
+    code_alpha3='EUR',
+    code_num=978,
+    minor_unit_denominator=100,
+    entities=frozenset(),
+    name='Euro',
+    approx_active_from=Singleton.UNKNOWN,
+    approx_active_until=None,)
+_other_currency = Currency(
+    code_alpha3='MGA',
+    code_num=969,
+    minor_unit_denominator=5,
+    entities=frozenset(),
+    name='Malagasy Ariary',
+    approx_active_from=Singleton.UNKNOWN,
+    approx_active_until=None,)
+
+
+class TestFrozenMoney:
+
+    def test_roundtrip(self):
+        """Freezing and thawing must preserve the amount and currency,
+        and the thawed money must be independent of the frozen one.
+        """
+        money = _test_currency.mint('1.50')
+        frozen = money.freeze()
+        assert isinstance(frozen, FrozenMoney)
+        assert frozen.amount == Decimal('1.50')
+        assert frozen.currency is _test_currency
+
+        thawed = frozen.to_money()
+        thawed += _test_currency.mint(1)
+        assert thawed == _test_currency.mint('2.50')
+        assert frozen.amount == Decimal('1.50')
+
+    def test_immutable(self):
+        """Frozen monies must not be assignable."""
+        frozen = _test_currency.mint(1).freeze()
+        with pytest.raises(AttributeError):
+            frozen.amount = Decimal(2)  # type: ignore
+
+    def test_hashing(self):
+        """Frozen monies must be usable as dict keys and set members,
+        with numerically-equal amounts of the same currency colliding.
+        """
+        monies = [
+            _test_currency.mint('1.0'),
+            _test_currency.mint('1.00'),
+            _other_currency.mint(1),
+            _test_currency.mint(2),]
+        deduped = {money.freeze() for money in monies}
+        assert len(deduped) == 3
+        assert _test_currency.mint(1).freeze() in deduped
+        assert _test_currency.mint(1).freeze() != _other_currency.mint(
+            1).freeze()
+        assert _test_currency.mint(1).freeze() != _test_currency.mint(1)
+
+    def test_pickle(self):
+        """Frozen monies must survive a pickle roundtrip."""
+        frozen = _test_currency.mint('3.14').freeze()
+        unpickled = pickle.loads(pickle.dumps(frozen))  # noqa: S301
+        assert unpickled == frozen
+        assert hash(unpickled) == hash(frozen)
+
+    def test_math(self):
+        """Arithmetic must return new frozen monies, with augmented
+        assignment rebinding instead of mutating.
+        """
+        frozen = _test_currency.mint('1.50').freeze()
+        shared = frozen
+        frozen += _test_currency.mint(1)
+        frozen -= _test_currency.mint('0.5').freeze()
+        frozen *= 3
+
+        assert isinstance(frozen, FrozenMoney)
+        assert frozen == _test_currency.mint(6).freeze()
+        assert shared.amount == Decimal('1.50')
+        assert (frozen / 4).amount == Decimal('1.5')
+        assert frozen / shared == Decimal(4)
+        assert -shared == _test_currency.mint('-1.5').freeze()
+
+        with pytest.raises(MismatchedCurrency):
+            _ = frozen + _other_currency.mint(1)
+        with pytest.raises(MoneyRequired):
+            _ = frozen + 1  # type: ignore
+        with pytest.raises(ScalarRequired):
+            _ = frozen * shared  # type: ignore
+
+
+class TestRounding:
+
+    def test_round_to_minor(self):
+        """Rounding to minor must round to the minor unit, respecting
+        the rounding mode, and exactly match minting with
+        ``quantize_to_minor``.
+        """
+        money = Money(amount=Decimal('12.345'), currency=_test_currency)
+
+        assert money.round_to_minor().amount == Decimal('12.35')
+        assert money.round_to_minor(ROUND_DOWN).amount == Decimal('12.34')
+        assert money.round_to_minor(ROUND_HALF_EVEN).amount == Decimal(
+            '12.34')
+
+        for amount in ['12.345', '0.5', '0.3', '-0.3', '1.1', '-7.7']:
+            money = Money(amount=Decimal(amount), currency=_other_currency)
+            for rounding in (ROUND_DOWN, ROUND_HALF_EVEN):
+                rounded = money.round_to_minor(rounding)
+                minted = _other_currency.mint(
+                    amount, quantize_to_minor=True, rounding=rounding)
+                assert rounded.amount == minted.amount
+
+        money = Money(amount=Decimal('0.5'), currency=_other_currency)
+        assert money.round_to_minor().amount == Decimal('0.6')
+        assert money.round_to_minor(ROUND_DOWN).amount == Decimal('0.4')
+
+    def test_round_to_major(self):
+        """Rounding to major must round to a whole major unit."""
+        money = Money(amount=Decimal('12.50'), currency=_test_currency)
+
+        assert money.round_to_major().amount == Decimal('13')
+        assert money.round_to_major(ROUND_HALF_EVEN).amount == Decimal('12')
+        assert (-money).round_to_major().amount == Decimal('-13')
+
+    def test_is_nominal(self):
+        """The nominal checks must detect whole minor and major units."""
+        assert _test_currency.mint('12.34').is_nominal_division
+        assert _test_currency.mint('12.340').is_nominal_division
+        assert not _test_currency.mint('12.345').is_nominal_division
+        assert _other_currency.mint('0.4').is_nominal_division
+        assert not _other_currency.mint('0.5').is_nominal_division
+
+        assert _test_currency.mint('12.00').is_nominal_major
+        assert not _test_currency.mint('12.34').is_nominal_major
+
+    def test_round_many(self):
+        """The bulk versions must match rounding one at a time, for
+        mixed currencies.
+        """
+        monies = [
+            _test_currency.mint('1.005'),
+            _other_currency.mint('0.5'),
+            _test_currency.mint('-2.5')]
+
+        for rounding in (ROUND_DOWN, ROUND_HALF_EVEN):
+            assert round_many_to_minor(monies, rounding) == [
+                money.round_to_minor(rounding) for money in monies]
+            assert round_many_to_major(monies, rounding) == [
+                money.round_to_major(rounding) for money in monies]
+
+
+class TestAllocation:
+
+    def test_split_decimal(self):
+        """Splitting must distribute the leftover minor units to the
+        first parts, and the parts must sum to the original amount.
+        """
+        money = _test_currency.mint('10')
+        parts = money.split(3)
+
+        assert [part.amount for part in parts] == [
+            Decimal('3.34'), Decimal('3.33'), Decimal('3.33')]
+        assert all(part.currency is _test_currency for part in parts)
+        assert sum(part.amount for part in parts) == money.amount
+
+    def test_allocate_largest_remainder(self):
+        """The leftover minor units must go to the parts with the
+        largest remainders, not just the first parts.
+        """
+        money = _test_currency.mint('0.05')
+        parts = money.allocate([3, 7])
+
+        # 0.015 / 0.035: both have the same remainder, so the tie goes to
+        # the earlier part
+        assert [part.amount for part in parts] == [
+            Decimal('0.02'), Decimal('0.03')]
+
+        parts = money.allocate([Decimal('0.1'), Decimal('0.9')])
+        # 0.005 / 0.045
+        assert [part.amount for part in parts] == [
+            Decimal('0.01'), Decimal('0.04')]
+
+    def test_allocate_non_decimal(self):
+        """Allocation must work in units of the minor unit, even when
+        that isn't a power of ten.
+        """
+        money = _other_currency.mint('1')
+        parts = money.split(2)
+
+        assert [part.amount for part in parts] == [
+            Decimal('0.6'), Decimal('0.4')]
+
+        parts = _other_currency.mint('3.4').allocate([1, 1, 1])
+        assert [part.amount for part in parts] == [
+            Decimal('1.2'), Decimal('1.2'), Decimal('1')]
+        assert sum(part.amount for part in parts) == Decimal('3.4')
+
+    def test_allocate_negative(self):
+        """Negative amounts must be allocated symmetrically to positive
+        ones.
+        """
+        parts = _test_currency.mint('-10').split(3)
+
+        assert [part.amount for part in parts] == [
+            Decimal('-3.34'), Decimal('-3.33'), Decimal('-3.33')]
+
+    def test_allocate_zero_ratio(self):
+        """Parts with a zero ratio must receive nothing."""
+        parts = _test_currency.mint('1').allocate([0, 1, 0])
+
+        assert [part.amount for part in parts] == [
+            Decimal(0), Decimal('1'), Decimal(0)]
+
+    def test_allocate_invalid(self):
+        """Invalid ratios or amounts that aren't a whole number of minor
+        units must raise.
+        """
+        money = _test_currency.mint('1')
+
+        with pytest.raises(ValueError):
+            money.allocate([])
+        with pytest.raises(ValueError):
+            money.allocate([0, 0])
+        with pytest.raises(ValueError):
+            money.allocate([1, -1])
+        with pytest.raises(ValueError):
+            money.split(0)
+        with pytest.raises(ValueError):
+            Money(amount=Decimal('1.001'), currency=_test_currency).split(2)
+
+    def test_allocate_many(self):
+        """The bulk version must match allocating one at a time."""
+        monies = [
+            _test_currency.mint('10'),
+            _other_currency.mint('1'),
+            _test_currency.mint('-0.07')]
+        ratios = [1, 2, Decimal('0.5')]
+
+        assert allocate_many(monies, ratios) == [
+            money.allocate(ratios) for money in monies]
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+from decimal import ROUND_DOWN
+from decimal import Decimal
+
+import pytest
+
+from finnr._types import Singleton
+from finnr.currency import Currency
+from finnr.exceptions import MismatchedCurrency
+from finnr.exceptions import ScalarRequired
+from finnr.moneyarray import MoneyArray
+
+_test_currency = Currency(
+    code_alpha3='EUR',
+    code_num=978,
+    minor_unit_denominator=100,
+    entities=frozenset(),
+    name='Euro',
+    approx_active_from=Singleton.UNKNOWN,
+    approx_active_until=None,)
+_other_currency = Currency(
+    code_alpha3='MGA',
+    code_num=969,
+    minor_unit_denominator=5,
+    entities=frozenset(),
+    name='Malagasy Ariary',
+    approx_active_from=Singleton.UNKNOWN,
+    approx_active_until=None,)
+
+
+class TestMoneyArray:
+
+    def test_from_amounts(self):
+        """Constructing from amounts must pick the most precise
+        exponent and store exact coefficients.
+        """
+        arr = MoneyArray.from_amounts(_test_currency, ['1.23', 4, '5.5'])
+        assert arr.exponent == -2
+        assert list(arr.coefficients) == [123, 400, 550]
+        assert arr.amounts == [Decimal('1.23'), Decimal(4), Decimal('5.5')]
+        assert arr[0] == _test_currency.mint('1.23')
+
+    def test_from_amounts_inexact(self):
+        """Constructing with an explicit exponent that cannot represent
+        the amounts exactly must raise.
+        """
+        with pytest.raises(ValueError):
+            MoneyArray.from_amounts(_test_currency, ['1.234'], exponent=-2)
+
+    def test_from_amounts_trailing_zeros(self):
+        """Constructing with an explicit exponent must accept amounts
+        whose exponent is smaller, as long as they are still exact.
+        """
+        arr = MoneyArray.from_amounts(
+            _test_currency, [Decimal('1.230'), '4.5000', 7], exponent=-2)
+        assert arr.exponent == -2
+        assert list(arr.coefficients) == [123, 450, 700]
+
+    def test_from_monies_mismatched(self):
+        """Constructing from monies of different currencies must raise.
+        """
+        with pytest.raises(MismatchedCurrency):
+            MoneyArray.from_monies([
+                _test_currency.mint(1), _other_currency.mint(1)])
+
+    def test_add_sub(self):
+        """Adding and subtracting arrays and single monies must be
+        exact and elementwise, aligning exponents as needed.
+        """
+        arr1 = MoneyArray.from_amounts(_test_currency, ['1.5', '2.25'])
+        arr2 = MoneyArray.from_amounts(_test_currency, ['0.001', 1])
+
+        assert (arr1 + arr2).amounts == [
+            Decimal('1.501'), Decimal('3.25')]
+        assert (arr1 - arr2).amounts == [
+            Decimal('1.499'), Decimal('1.25')]
+        assert (arr1 + _test_currency.mint('0.5')).amounts == [
+            Decimal(2), Decimal('2.75')]
+
+    def test_add_mismatched(self):
+        """Adding arrays of different currencies must raise.
+        """
+        arr1 = MoneyArray.from_amounts(_test_currency, [1])
+        arr2 = MoneyArray.from_amounts(_other_currency, [1])
+        with pytest.raises(MismatchedCurrency):
+            _ = arr1 + arr2
+        with pytest.raises(MismatchedCurrency):
+            _ = arr1 + _other_currency.mint(1)
+
+    def test_mul_div(self):
+        """Scalar multiplication must be exact; division must round to
+        the current exponent.
+        """
+        arr = MoneyArray.from_amounts(_test_currency, ['10.00', '-0.05'])
+        assert (arr * 3).amounts == [Decimal(30), Decimal('-0.15')]
+        assert (Decimal('0.5') * arr).amounts == [
+            Decimal(5), Decimal('-0.025')]
+        assert (arr / 3).amounts == [Decimal('3.33'), Decimal('-0.02')]
+        assert arr.divide(3, ROUND_DOWN).amounts == [
+            Decimal('3.33'), Decimal('-0.01')]
+        assert (arr / Decimal('0.5')).amounts == [
+            Decimal(20), Decimal('-0.1')]
+
+        with pytest.raises(ScalarRequired):
+            _ = arr * _test_currency.mint(1)  # type: ignore
+
+    def test_sum_quantize(self):
+        """Sum must return a single money, and quantize must round
+        every amount.
+        """
+        arr = MoneyArray.from_amounts(
+            _test_currency, ['1.005', '2.015', '-3.025'])
+        assert arr.sum() == _test_currency.mint('-0.005')
+
+        quantized = arr.quantize(Decimal('0.01'))
+        assert quantized.exponent == -2
+        assert quantized.amounts == [
+            Decimal('1.00'), Decimal('2.02'), Decimal('-3.02')]
+
+    def test_round_to_minor(self):
+        """Rounding the whole column must match rounding every money
+        individually, including for non-decimal currencies.
+        """
+        amounts = ['1.005', '2.25', '-3.35', '0.1', '-0.1', '7']
+        for currency in (_test_currency, _other_currency):
+            arr = MoneyArray.from_amounts(currency, amounts)
+            for rounding in (None, ROUND_DOWN):
+                kwargs = {} if rounding is None else {'rounding': rounding}
+                assert arr.round_to_minor(**kwargs).amounts == [
+                    money.round_to_minor(**kwargs).amount for money in arr]
+                assert arr.round_to_major(**kwargs).amounts == [
+                    money.round_to_major(**kwargs).amount for money in arr]
+
+    def test_comparison_masks(self):
+        """Comparisons must return elementwise masks that can be used
+        to filter the array.
+        """
+        arr = MoneyArray.from_amounts(_test_currency, [1, 2, 3])
+        threshold = _test_currency.mint('1.5')
+
+        assert (arr > threshold) == [False, True, True]
+        assert (arr == _test_currency.mint(2)) == [False, True, False]
+        assert arr.compress(arr <= threshold).amounts == [Decimal(1)]
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from decimal import localcontext
+
+import pytest
+
+from finnr._types import Singleton
+from finnr.aggregate import MoneyBag
+from finnr.currency import Currency
+from finnr.parallel import count_by_currency
+from finnr.parallel import max_by_currency
+from finnr.parallel import min_by_currency
+from finnr.parallel import sum_by_currency
+
+_test_currency = Currency(
+    code_alpha3='EUR',
+    code_num=978,
+    minor_unit_denominator=100,
+    entities=frozenset(),
+    name='Euro',
+    approx_active_from=Singleton.UNKNOWN,
+    approx_active_until=None,)
+_other_currency = Currency(
+    code_alpha3='MGA',
+    code_num=969,
+    minor_unit_denominator=5,
+    entities=frozenset(),
+    name='Malagasy Ariary',
+    approx_active_from=Singleton.UNKNOWN,
+    approx_active_until=None,)
+_monies = [
+    _test_currency.mint(Decimal(index) / 100)
+    if index % 3 else _other_currency.mint(-index)
+    for index in range(1000)]
+
+
+class TestParallelReducers:
+
+    def test_sum_matches_bag(self):
+        """Parallel sums must match the single-process bag exactly."""
+        result = sum_by_currency(_monies, workers=2, chunk_size=64)
+        assert result == MoneyBag(_monies)
+
+    def test_sum_exact(self):
+        """Parallel sums must be exact, even if the decimal context
+        would otherwise round.
+        """
+        monies = [
+            _test_currency.mint('12345678901234567890.01'),
+            _test_currency.mint('0.001'),]
+        with ThreadPoolExecutor(2) as executor, localcontext() as ctx:
+            ctx.prec = 5
+            result = sum_by_currency(
+                monies, chunk_size=1, executor=executor)
+
+        assert result[_test_currency].amount == Decimal(
+            '12345678901234567890.011')
+
+    def test_count_min_max(self):
+        """Counts, minimums, and maximums must be per currency."""
+        with ThreadPoolExecutor(2) as executor:
+            counts = count_by_currency(
+                _monies, chunk_size=100, executor=executor)
+            minimums = min_by_currency(
+                _monies, chunk_size=100, executor=executor)
+            maximums = max_by_currency(
+                _monies, chunk_size=100, executor=executor)
+
+        assert counts == {_test_currency: 666, _other_currency: 334}
+        assert minimums[_test_currency] == _test_currency.mint('0.01')
+        assert minimums[_other_currency] == _other_currency.mint(-999)
+        assert maximums[_test_currency] == _test_currency.mint('9.98')
+        assert maximums[_other_currency] == _other_currency.mint(0)
+
+    def test_empty(self):
+        """Empty input must return empty results."""
+        assert len(sum_by_currency([], workers=1)) == 0
+        with pytest.raises(ValueError):
+            count_by_currency([], chunk_size=0)
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from decimal import Decimal
+
+import pytest
+
+from finnr._types import Singleton
+from finnr.currency import Currency
+from finnr.currency import CurrencySet
+from finnr.exceptions import MoneyParseError
+from finnr.parsing import MoneyParser
+
+_eur = Currency(
+    code_alpha3='EUR',
+    code_num=978,
+    minor_unit_denominator=100,
+    entities=frozenset(),
+    name='Euro',
+    approx_active_from=Singleton.UNKNOWN,
+    approx_active_until=None,)
+_usd = Currency(
+    code_alpha3='USD',
+    code_num=840,
+    minor_unit_denominator=100,
+    entities=frozenset(),
+    name='US Dollar',
+    approx_active_from=Singleton.UNKNOWN,
+    approx_active_until=None,)
+_bhd = Currency(
+    code_alpha3='BHD',
+    code_num=48,
+    minor_unit_denominator=1000,
+    entities=frozenset(),
+    name='Bahraini Dinar',
+    approx_active_from=Singleton.UNKNOWN,
+    approx_active_until=None,)
+_mint = CurrencySet({_eur, _usd, _bhd})
+
+
+class TestMoneyParser:
+
+    @pytest.mark.parametrize(
+        ('text', 'amount', 'currency'),
+        [
+            ('12.34 EUR', Decimal('12.34'), _eur),
+            ('USD 1,234.56', Decimal('1234.56'), _usd),
+            ('1.234,56 €', Decimal('1234.56'), _eur),
+            ('€1 234,5', Decimal('1234.5'), _eur),
+            ('-€12', Decimal(-12), _eur),
+            ('usd -0.5', Decimal('-0.5'), _usd),
+            ("1'000'000 USD", Decimal(1000000), _usd),
+            ('1,234 USD', Decimal(1234), _usd),
+            ('1,234 BHD', Decimal('1.234'), _bhd),
+            ('1.234.567 EUR', Decimal(1234567), _eur),
+            ('12,34,567.89 USD', Decimal('1234567.89'), _usd),
+            ('USD 1,00,00,000', Decimal(10000000), _usd),])
+    def test_parse(self, text, amount, currency):
+        """Parsing must detect the currency and separators, regardless
+        of formatting convention.
+        """
+        money = MoneyParser(_mint).parse(text)
+        assert money.amount == amount
+        assert money.currency is currency
+
+    @pytest.mark.parametrize(
+        'text',
+        [
+            '12.34',
+            '12.34 XXX',
+            'EUR 12 USD',
+            '1.2.3,4.5 EUR',
+            '1,23,4 EUR',
+            '12,34.5 USD',
+            '1,234,56.7 USD',
+            '1,23,456,789.5 USD',
+            'USD 12345,678',
+            'USD 1234,567.00',
+            'USD 1234,56,789',
+            '123,45,678.9 USD',
+            '$12',
+            '- EUR -12',])
+    def test_parse_invalid(self, text):
+        """Malformed strings, or strings with unknown or missing
+        currencies, must raise.
+        """
+        with pytest.raises(MoneyParseError):
+            MoneyParser(_mint).parse(text)
+
+    def test_explicit_conventions(self):
+        """Explicit symbols and decimal separators must override the
+        defaults.
+        """
+        parser = MoneyParser(
+            _mint, symbols={'$': 'USD'}, decimal_separator=',')
+        assert parser.parse('$1,234').amount == Decimal('1.234')
+        assert parser.parse('$1.234').amount == Decimal(1234)
+
+    def test_parse_many(self):
+        """Bulk parsing must match parsing individually, including the
+        order of results.
+        """
+        parser = MoneyParser(_mint)
+        texts = ['1 EUR', 'USD 2.005', '3,00 €', '0.0045 BHD']
+        assert parser.parse_many(texts, quantize_to_minor=True) == [
+            parser.parse(text, quantize_to_minor=True) for text in texts]
+        assert parser.parse_many([]) == []